@@ -225,6 +225,296 @@ path_is_clear_helper(Board, X, Y, ToX, ToY, DirX, DirY) :-
     NextY is Y + DirY,
     path_is_clear_helper(Board, NextX, NextY, ToX, ToY, DirX, DirY).
 
+% apply_move(++Board, ++FromX, ++FromY, ++ToX, ++ToY, ++Player, --NewBoard)
+% Perform any move: a capture first, otherwise a king move or a simple move
+apply_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard) :-
+    make_capture_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard), !.
+apply_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard) :-
+    get_piece(Board, FromX, FromY, Piece),
+    (Piece == wk ; Piece == bk), !,
+    make_king_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard).
+apply_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard) :-
+    make_simple_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard).
+
+% step_offset(-DX, -DY)
+% Diagonal directions in the order moves are generated
+step_offset(-1, -1).
+step_offset(1, -1).
+step_offset(-1, 1).
+step_offset(1, 1).
+
+% player_square(++Board, ++Player, -X, -Y, -Piece)
+% Enumerate the squares of Player's pieces, row by row
+player_square(Board, Player, X, Y, Piece) :-
+    between(1, 8, Y),
+    between(1, 8, X),
+    get_piece(Board, X, Y, Piece),
+    is_player_piece(Piece, Player).
+
+% capture_move(++Board, ++Player, -FromX, -FromY, -ToX, -ToY)
+% Enumerate all single captures for Player
+capture_move(Board, Player, FromX, FromY, ToX, ToY) :-
+    player_square(Board, Player, FromX, FromY, _),
+    capture_move_from(Board, Player, FromX, FromY, ToX, ToY).
+
+% capture_move_from(++Board, ++Player, ++FromX, ++FromY, -ToX, -ToY)
+% Enumerate single captures of the piece at (FromX, FromY)
+capture_move_from(Board, Player, FromX, FromY, ToX, ToY) :-
+    step_offset(DX, DY),
+    ToX is FromX + 2 * DX,
+    ToY is FromY + 2 * DY,
+    valid_position(ToX, ToY),
+    valid_capture(Board, FromX, FromY, ToX, ToY, Player).
+
+% quiet_move(++Board, ++Player, -FromX, -FromY, -ToX, -ToY)
+% Enumerate all non-capture moves for Player
+quiet_move(Board, Player, FromX, FromY, ToX, ToY) :-
+    player_square(Board, Player, FromX, FromY, Piece),
+    step_offset(DX, DY),
+    (   (Piece == wk ; Piece == bk)
+    ->  between(1, 7, Dist),
+        ToX is FromX + DX * Dist,
+        ToY is FromY + DY * Dist,
+        valid_position(ToX, ToY),
+        valid_king_move(Board, FromX, FromY, ToX, ToY, Player)
+    ;   ToX is FromX + DX,
+        ToY is FromY + DY,
+        valid_position(ToX, ToY),
+        valid_simple_move(Board, FromX, FromY, ToX, ToY, Player)
+    ).
+
+% legal_moves(++Board, ++Player, --Moves)
+% All legal moves [FromX, FromY, ToX, ToY] for Player; captures are mandatory
+legal_moves(Board, Player, Moves) :-
+    findall([FromX, FromY, ToX, ToY],
+            capture_move(Board, Player, FromX, FromY, ToX, ToY),
+            Captures),
+    Captures \== [], !,
+    Moves = Captures.
+legal_moves(Board, Player, Moves) :-
+    findall([FromX, FromY, ToX, ToY],
+            quiet_move(Board, Player, FromX, FromY, ToX, ToY),
+            Moves).
+
+% capture_sequence(++Board, ++X, ++Y, ++Player, -Path)
+% Enumerate complete capture sequences of the piece at (X, Y): the piece keeps
+% capturing while it can; Path is the list of squares [[X, Y], ..., [ToX, ToY]]
+capture_sequence(Board, X, Y, Player, [[X, Y] | Rest]) :-
+    step_offset(DX, DY),
+    ToX is X + 2 * DX,
+    ToY is Y + 2 * DY,
+    valid_position(ToX, ToY),
+    make_capture_move(Board, X, Y, ToX, ToY, Player, NewBoard),
+    capture_continuation(NewBoard, ToX, ToY, Player, Rest).
+
+% capture_continuation(++Board, ++X, ++Y, ++Player, -Path)
+% Rest of a capture sequence after landing on (X, Y)
+capture_continuation(Board, X, Y, Player, Path) :-
+    capture_from(Board, Player, X, Y), !,
+    capture_sequence(Board, X, Y, Player, Path).
+capture_continuation(_, X, Y, _, [[X, Y]]).
+
+% capture_sequences(++Board, ++X, ++Y, ++Player, -Paths)
+% All complete capture sequences of the piece at (X, Y)
+capture_sequences(Board, X, Y, Player, Paths) :-
+    findall(Path, capture_sequence(Board, X, Y, Player, Path), Paths).
+
+% Board handles
+% A board is asserted once and then referred to by an integer handle,
+% so queries do not have to pass (and parse) the whole board term
+
+% board_state(?Handle, ?Board)
+% Stored board for each handle
+:- dynamic board_state/2.
+
+% new_board_handle(++Board, --Handle)
+% Store a board and return its handle
+new_board_handle(Board, Handle) :-
+    flag(board_handle_counter, N, N + 1),
+    Handle is N + 1,
+    assertz(board_state(Handle, Board)).
+
+% copy_board_handle(++Handle, --NewHandle)
+% Store a copy of the board referred to by Handle
+copy_board_handle(Handle, NewHandle) :-
+    board_state(Handle, Board),
+    new_board_handle(Board, NewHandle).
+
+% release_board_handle(++Handle)
+% Forget the board referred to by Handle
+release_board_handle(Handle) :-
+    retractall(board_state(Handle, _)).
+
+% handle_board(++Handle, --Board)
+% Get the stored board
+handle_board(Handle, Board) :-
+    board_state(Handle, Board).
+
+% handle_legal_moves(++Handle, ++Player, --Moves)
+% legal_moves/3 on a stored board
+handle_legal_moves(Handle, Player, Moves) :-
+    board_state(Handle, Board),
+    legal_moves(Board, Player, Moves).
+
+% handle_make_move(++Handle, ++FromX, ++FromY, ++ToX, ++ToY, ++Player)
+% apply_move/7 on a stored board, replacing it with the new board
+handle_make_move(Handle, FromX, FromY, ToX, ToY, Player) :-
+    board_state(Handle, Board),
+    apply_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard),
+    retract(board_state(Handle, _)),
+    assertz(board_state(Handle, NewBoard)).
+
+% AI search
+% Alpha-beta search for black (the AI side) that runs entirely in Prolog:
+% only the chosen move and the resulting board go back to Python
+
+% difficulty_depth(++Difficulty, --Depth)
+% Search depth for each difficulty level
+difficulty_depth(easy, 1).
+difficulty_depth(medium, 3).
+difficulty_depth(hard, 5).
+
+% win_score(--Score)
+% Score of a won position (side to move has no moves left)
+win_score(100000).
+
+% ai_make_move(++Board, ++Difficulty, --NewBoard, --Path)
+% Choose the best move for black and perform it; a capture is continued with
+% the same piece while it can capture, and Path is the list of squares
+% [[FromX, FromY], ..., [ToX, ToY]] of the whole move
+ai_make_move(Board, Difficulty, NewBoard, Path) :-
+    difficulty_depth(Difficulty, Depth),
+    legal_moves(Board, black, Moves),
+    Moves \== [],
+    ai_sequence(Moves, Board, Depth, NewBoard, Path).
+
+% ai_sequence(++Moves, ++Board, ++Depth, --NewBoard, --Path)
+% Perform the best of Moves; after a capture with another capture available
+% from the landing square, search that piece's captures and continue
+ai_sequence(Moves, Board, Depth, NewBoard, [[FromX, FromY] | Rest]) :-
+    initial_best(black, Alpha),
+    initial_best(white, Beta),
+    search_moves(Moves, Board, black, Depth, Alpha, Beta, Alpha, none, _, [FromX, FromY, ToX, ToY]),
+    apply_move(Board, FromX, FromY, ToX, ToY, black, Board1),
+    (   next_turn(Board, Board1, [FromX, FromY, ToX, ToY], black, black, at(ToX, ToY))
+    ->  position_moves(Board1, black, at(ToX, ToY), NextMoves),
+        ai_sequence(NextMoves, Board1, Depth, NewBoard, Rest)
+    ;   NewBoard = Board1,
+        Rest = [[ToX, ToY]]
+    ).
+
+% alpha_beta(++Board, ++Player, ++Piece, ++Depth, ++Alpha, ++Beta, --Score)
+% Minimax value of Board with Player to move; black maximises, white minimises.
+% Piece is at(X, Y) while that piece continues a capture sequence (only its
+% captures are searched) and any otherwise
+alpha_beta(Board, _, _, 0, _, _, Score) :- !,
+    evaluate_board(Board, Score).
+alpha_beta(Board, Player, Piece, Depth, Alpha, Beta, Score) :-
+    position_moves(Board, Player, Piece, Moves),
+    (   Moves == []
+    ->  win_score(Win),
+        (Player == black -> Score is -Win ; Score = Win)
+    ;   initial_best(Player, Best0),
+        search_moves(Moves, Board, Player, Depth, Alpha, Beta, Best0, none, Score, _)
+    ).
+
+% position_moves(++Board, ++Player, ++Piece, --Moves)
+% Moves to search: all legal moves, or the captures of the piece that
+% continues a capture sequence
+position_moves(Board, Player, any, Moves) :-
+    legal_moves(Board, Player, Moves).
+position_moves(Board, Player, at(X, Y), Moves) :-
+    findall([X, Y, ToX, ToY], capture_move_from(Board, Player, X, Y, ToX, ToY), Moves).
+
+% initial_best(++Player, --Best)
+% Starting value that any real score improves on
+initial_best(black, Best) :- win_score(Win), Best is -Win - 1.
+initial_best(white, Best) :- win_score(Win), Best is Win + 1.
+
+% search_moves(++Moves, ++Board, ++Player, ++Depth, ++Alpha, ++Beta, ++Best0, ++BestMove0, --Best, --BestMove)
+% Search the moves in order, keeping the best one and cutting off when Alpha >= Beta
+search_moves([], _, _, _, _, _, Best, BestMove, Best, BestMove).
+search_moves([Move|Moves], Board, Player, Depth, Alpha, Beta, Best0, BestMove0, Best, BestMove) :-
+    child_score(Board, Player, Move, Depth, Alpha, Beta, Score),
+    (   better_score(Player, Score, Best0)
+    ->  Best1 = Score, BestMove1 = Move
+    ;   Best1 = Best0, BestMove1 = BestMove0
+    ),
+    update_window(Player, Score, Alpha, Beta, Alpha1, Beta1),
+    (   Alpha1 >= Beta1
+    ->  Best = Best1, BestMove = BestMove1
+    ;   search_moves(Moves, Board, Player, Depth, Alpha1, Beta1, Best1, BestMove1, Best, BestMove)
+    ).
+
+% child_score(++Board, ++Player, ++Move, ++Depth, ++Alpha, ++Beta, --Score)
+% Perform Move and search the resulting position one ply shallower
+child_score(Board, Player, [FromX, FromY, ToX, ToY], Depth, Alpha, Beta, Score) :-
+    apply_move(Board, FromX, FromY, ToX, ToY, Player, NewBoard),
+    next_turn(Board, NewBoard, [FromX, FromY, ToX, ToY], Player, Next, Piece),
+    ChildDepth is Depth - 1,
+    alpha_beta(NewBoard, Next, Piece, ChildDepth, Alpha, Beta, Score).
+
+% next_turn(++Board, ++NewBoard, ++Move, ++Player, --Next, --Piece)
+% After a capture with another capture available from the landing square
+% the same player moves again with that piece only (Piece = at(ToX, ToY)),
+% otherwise the opponent moves with any piece
+next_turn(Board, NewBoard, [FromX, FromY, ToX, ToY], Player, Player, at(ToX, ToY)) :-
+    valid_capture(Board, FromX, FromY, ToX, ToY, Player),
+    capture_from(NewBoard, Player, ToX, ToY), !.
+next_turn(_, _, _, Player, Next, any) :-
+    opponent(Player, Next).
+
+% capture_from(++Board, ++Player, ++X, ++Y)
+% The piece at (X, Y) can capture
+capture_from(Board, Player, X, Y) :-
+    capture_move_from(Board, Player, X, Y, _, _), !.
+
+% better_score(++Player, ++Score, ++Best)
+% Score is better than Best for Player
+better_score(black, Score, Best) :- Score > Best.
+better_score(white, Score, Best) :- Score < Best.
+
+% update_window(++Player, ++Score, ++Alpha, ++Beta, --NewAlpha, --NewBeta)
+% Narrow the alpha-beta window after a searched move
+update_window(black, Score, Alpha, Beta, NewAlpha, Beta) :- NewAlpha is max(Alpha, Score).
+update_window(white, Score, Alpha, Beta, Alpha, NewBeta) :- NewBeta is min(Beta, Score).
+
+% evaluate_board(++Board, --Score)
+% Static evaluation from black's point of view
+% (same terms as CheckersAI.evaluate_board)
+evaluate_board(Board, Score) :-
+    findall(Value,
+            (nth1(Y, Board, Row), nth1(X, Row, Piece), piece_value(Piece, X, Y, Value)),
+            Values),
+    sum_list(Values, Material),
+    count_captures(Board, black, BlackCaptures),
+    count_captures(Board, white, WhiteCaptures),
+    Score is Material + 50 * (BlackCaptures - WhiteCaptures).
+
+% piece_value(++Piece, ++X, ++Y, --Value)
+% Value of a piece: material, advancement and centre bonus (negative for white)
+piece_value(w, X, Y, Value) :-
+    centre_bonus(X, Y, Bonus),
+    Value is -(100 + (8 - Y) * 5 + Bonus).
+piece_value(wk, _, _, -300).
+piece_value(b, X, Y, Value) :-
+    centre_bonus(X, Y, Bonus),
+    Value is 100 + Y * 5 + Bonus.
+piece_value(bk, _, _, 300).
+
+% centre_bonus(++X, ++Y, --Bonus)
+% Bonus for a man in the centre of the board
+centre_bonus(X, Y, 10) :-
+    X >= 3, X =< 6,
+    Y >= 3, Y =< 6, !.
+centre_bonus(_, _, 0).
+
+% count_captures(++Board, ++Player, --Count)
+% Number of single captures available to Player
+count_captures(Board, Player, Count) :-
+    findall(x, capture_move(Board, Player, _, _, _, _), Captures),
+    length(Captures, Count).
+
 % print_board(++Board)
 % Display board (for testing)
 print_board(Board) :-
@@ -381,6 +671,14 @@ run_extended_tests :-
     writeln('=== Testing king movement ==='),
     test_king_movement.
 
+% run_self_tests
+% Run all self-tests unless the rules are loaded quietly
+% (the checkers_quiet flag is created by the production load path)
+run_self_tests :-
+    current_prolog_flag(checkers_quiet, true), !.
+run_self_tests :-
+    run_basic_tests,
+    run_extended_tests.
+
 % Entry point
-:- initialization(run_basic_tests).
-:- initialization(run_extended_tests).
\ No newline at end of file
+:- initialization(run_self_tests).
\ No newline at end of file
@@ -0,0 +1,218 @@
+# Файл: benchmark.py
+"""
+Порівняння швидкодії пошуку ходу AI.
+
+Вимірює час вибору ходу чорних на однаковому наборі позицій:
+- prolog-search: весь альфа-бета пошук в Prolog (ai_make_move/4), один запит на хід;
+- python[-<алгоритм>]: пошук CheckersAI у Python. Пошук завжди йде на
+  бітбордах SearchBoard, тож бекенд правил на нього не впливає і тут не
+  вибирається.
+
+Приклад:
+    python benchmark.py --difficulty medium --positions 20
+"""
+import argparse
+import random
+import time
+from checkers_backend import get_interface
+from checkers_board import Board
+from checkers_ai import ALGORITHMS, CheckersAI
+from checkers_ordering import MoveOrderer
+from checkers_stats import SearchStats
+
+# Глибина пошуку для кожної складності, як difficulty_depth/2 у Checkers.pl
+SEARCH_DEPTHS = {
+    "easy": 1,
+    "medium": 3,
+    "hard": 5,
+}
+
+
+def generate_positions(count, plies=7, seed=0):
+    """
+    Генерує різні позиції випадковою грою з початкової, з ходом чорних
+
+    Args:
+        count (int): Кількість позицій
+        plies (int): Кількість випадкових півходів (непарна - хід чорних)
+        seed (int): Зерно генератора випадкових чисел
+
+    Returns:
+        list: Дошки у форматі Python (не більше count)
+    """
+    rules = get_interface("bitboard")
+    rng = random.Random(seed)
+    positions = []
+    # Випадкові партії часто приходять до тих самих позицій: повтори
+    # відкидаються за компактною хешованою дошкою (з кількох півходів різних
+    # позицій може бути менше, ніж count)
+    seen = set()
+    for _ in range(count * 100):
+        if len(positions) == count:
+            break
+        board = rules.get_initial_board()
+        player = "white"
+        for _ in range(plies):
+            moves = rules.legal_moves(board, player)
+            if not moves:
+                break
+            from_x, from_y, to_x, to_y = rng.choice(moves)
+            board = rules.make_move(board, from_x, from_y, to_x, to_y, player)
+            player = "black" if player == "white" else "white"
+        key = Board.from_list(board)
+        if player == "black" and key not in seen and rules.legal_moves(board, "black"):
+            seen.add(key)
+            positions.append(board)
+    return positions
+
+
+def run_search(name, search, positions):
+    """
+    Виконує пошук на всіх позиціях і вимірює час
+
+    Args:
+        name (str): Назва варіанту для звіту
+        search (callable): Функція board -> (new_board, move)
+        positions (list): Набір позицій
+
+    Returns:
+        dict: Назва, сумарний і середній час (мс) та вибрані ходи
+    """
+    moves = []
+    started = time.perf_counter()
+    for board in positions:
+        _, move = search(board)
+        moves.append(move)
+    total = time.perf_counter() - started
+    return {
+        "name": name,
+        "total_ms": total * 1000,
+        "mean_ms": total * 1000 / len(positions),
+        "moves": moves,
+    }
+
+
+# Лічильники SearchStats, що підсумовуються за всіма пошуками варіанту
+SUMMED_FIELDS = (
+    "search_nodes", "quiescence_nodes", "leaf_evaluations", "expanded_nodes", "beta_cutoffs",
+    "pvs_researches", "aspiration_researches", "lmr_reductions", "lmr_researches",
+    "null_move_tries", "null_move_cutoffs", "null_move_failures",
+    "ordering_cutoffs", "first_move_cutoffs", "tt_probes", "tt_hits", "elapsed", "movegen_time", "make_time", "eval_time",
+)
+
+
+def print_search_stats(name, searches, profile):
+    """
+    Виводить сумарну статистику пошуків одного варіанту
+
+    Args:
+        name (str): Назва варіанту
+        searches (list): SearchStats кожного пошуку
+        profile (bool): Чи виміряно розподіл часу
+    """
+    total = SearchStats()
+    for stats in searches:
+        for field in SUMMED_FIELDS:
+            setattr(total, field, getattr(total, field) + getattr(stats, field))
+    # Єдиний допустимий хід не шукається - такі позиції не враховуються в глибині
+    depths = [stats.depth for stats in searches if stats.depth]
+    ebfs = [stats.effective_branching_factor() for stats in searches if stats.depth > 1]
+    print(f"Nodes {name}: search {total.search_nodes}, quiescence {total.quiescence_nodes}, "
+          f"leaf evals {total.leaf_evaluations}, {total.nodes_per_second():.0f} nps")
+    print(f"Search {name}: mean depth {sum(depths) / len(depths) if depths else 0.0:.1f}, "
+          f"EBF {sum(ebfs) / len(ebfs) if ebfs else 0.0:.2f}, cutoff rate {total.cutoff_rate():.1%}, "
+          f"TT hit rate {total.tt_hit_rate():.1%}, re-searches PVS {total.pvs_researches} / "
+          f"aspiration {total.aspiration_researches}")
+    if any(stats.selective for stats in searches):
+        print(f"Selective {name}: LMR {total.lmr_reductions} reductions, {total.lmr_researches} re-searches; "
+              f"null move {total.null_move_tries} tries, {total.null_move_cutoffs} cutoffs, "
+              f"{total.null_move_failures} failed verifications")
+    print(f"Ordering {name}: {total.ordering_cutoffs} cutoffs, "
+          f"first move {total.first_move_cutoff_rate():.1%}")
+    if profile:
+        print(f"Time {name}: movegen {total.movegen_time * 1000:.0f} ms, "
+              f"make/unmake {total.make_time * 1000:.0f} ms, eval {total.eval_time * 1000:.0f} ms "
+              f"of {total.elapsed * 1000:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння швидкодії пошуку ходу AI")
+    parser.add_argument("--difficulty", default="medium", choices=("easy", "medium", "hard"))
+    parser.add_argument("--positions", type=int, default=10, help="кількість позицій")
+    parser.add_argument("--plies", type=int, default=7, help="випадкові півходи до позиції")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithms", nargs="+", default=["alphabeta"], choices=ALGORITHMS,
+                        help="алгоритми пошуку CheckersAI для порівняння на тих самих позиціях")
+    parser.add_argument("--selective", action="store_true",
+                        help="скорочення пізніх ходів і нульовий хід з параметрами SELECTIVE_DEFAULTS")
+    parser.add_argument("--tt-mb", type=float, default=16,
+                        help="пам'ять таблиці транспозицій CheckersAI, МБ (0 - без таблиці)")
+    parser.add_argument("--ordering", default="full", choices=("full", "tt-only"),
+                        help="впорядкування ходів: хід з таблиці, вбивці та історія або лише хід з таблиці")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="процеси для паралельного пошуку ходів кореня CheckersAI")
+    parser.add_argument("--no-quiescence", action="store_true",
+                        help="оцінювати листки без пошуку спокою")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="час на хід для CheckersAI, с (за замовчуванням - фіксована глибина)")
+    parser.add_argument("--profile", action="store_true",
+                        help="вимірювати час генерації ходів, виконання ходів і оцінки (сповільнює пошук)")
+    parser.add_argument("--no-prolog-search", action="store_true",
+                        help="не вимірювати пошук в Prolog (ai_make_move/4)")
+    args = parser.parse_args()
+
+    positions = generate_positions(args.positions, args.plies, args.seed)
+    results = []
+
+    if not args.no_prolog_search:
+        prolog = get_interface("prolog")
+
+        def prolog_search(board):
+            # ai_make_move повертає весь шлях; для порівняння досить початку і кінця
+            new_board, path = prolog.ai_make_move(board, args.difficulty)
+            return new_board, path[0] + path[-1] if path else None
+
+        results.append(run_search("prolog-search", prolog_search, positions))
+
+    for algorithm in args.algorithms:
+        # Для порівняння з Prolog пошук іде на ту саму фіксовану глибину,
+        # якщо не задано час на хід
+        full_ordering = args.ordering == "full"
+        orderer = MoveOrderer(use_killers=full_ordering, use_history=full_ordering)
+        ai = CheckersAI(args.difficulty, interface=get_interface("bitboard"), tt_size_mb=args.tt_mb,
+                        orderer=orderer, workers=args.workers, quiescence=not args.no_quiescence,
+                        profile=args.profile, algorithm=algorithm, selective=args.selective)
+        max_depth = None if args.time_budget else SEARCH_DEPTHS[args.difficulty]
+        name = "python" if algorithm == "alphabeta" else f"python-{algorithm}"
+        searches = []
+
+        def search(board):
+            result = ai.make_best_move(board, args.time_budget, max_depth)
+            searches.append(ai.last_stats)
+            return result
+
+        results.append(run_search(name, search, positions))
+        ai.close()
+        print_search_stats(name, searches, args.profile)
+        # З процесами-виконавцями таблиця кореня не використовується: їхні влучання
+        # вже враховано в рядку Search
+        if ai.tt is not None and ai.workers <= 1:
+            stats = ai.tt.stats()
+            print(f"TT {name}: hit rate {stats['hit_rate']:.1%}, "
+                  f"filled {stats['filled']}/{stats['capacity']}, replacements {stats['replacements']}")
+
+    print(f"Позицій: {len(positions)}, складність: {args.difficulty}")
+    print(f"{'variant':<22}{'total ms':>12}{'mean ms':>12}")
+    for result in results:
+        print(f"{result['name']:<22}{result['total_ms']:>12.1f}{result['mean_ms']:>12.2f}")
+
+    # Різні реалізації можуть обирати різні ходи з однаковою оцінкою
+    if len(results) > 1:
+        reference = results[0]
+        for result in results[1:]:
+            same = sum(a == b for a, b in zip(reference["moves"], result["moves"]))
+            print(f"Збіг ходів {reference['name']} / {result['name']}: {same}/{len(positions)}")
+
+
+if __name__ == "__main__":
+    main()
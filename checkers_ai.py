@@ -1,27 +1,301 @@
+import multiprocessing
+import os
 import random
-from checkers_interface import CheckersInterface
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from checkers_backend import get_interface, resolve_backend
+from checkers_tt import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable, ZobristKeys
+from checkers_ordering import MAX_PLY, MoveOrderer
+from checkers_book import OpeningBook
+from checkers_tablebase import DRAW, MAX_DISTANCE, WIN, Tablebases
+from checkers_stats import SearchStats
+from checkers_board import BoardSnapshot
+from checkers_bitboard import SQUARE_COORDS, BitboardInterface, SearchBoard, count_captures
+
+# Найбільша глибина ітеративного поглиблення (на практиці пошук зупиняє час)
+MAX_SEARCH_DEPTH = 64
+# Як часто (у вузлах) пошук перевіряє, чи не вичерпано час
+TIME_CHECK_INTERVAL = 256
+# Як часто (у секундах) паралельний пошук перевіряє скасування, чекаючи на процеси
+CANCEL_POLL_INTERVAL = 0.05
+# Як часто (у вузлах) пошук повідомляє про хід пошуку функції progress
+PROGRESS_INTERVAL = 16384
+# Алгоритми пошуку: альфа-бета з повним вікном у кожному вузлі або пошук
+# головного варіанту (PVS) з нульовими вікнами і вікнами аспірації
+ALGORITHMS = ("alphabeta", "pvs")
+# Напівширина вікна аспірації навколо оцінки попередньої ітерації (PVS)
+ASPIRATION_WINDOW = 50
+# Параметри вибіркового пошуку за замовчуванням (CheckersAI(selective=...)):
+# - lmr_min_depth: з якої залишкової глибини скорочуються пізні ходи
+# - lmr_full_moves: скільки перших ходів вузла шукаються на повну глибину
+# - lmr_reduction: на скільки півходів скорочується пізній тихий хід
+# - null_move_min_depth: з якої залишкової глибини пробується нульовий хід
+# - null_move_reduction: на скільки півходів скорочується пошук після нульового ходу
+# - null_move_min_pieces: з меншою кількістю фігур (ендшпіль, де часто
+#   цугцванг) нульовий хід не пробується
+SELECTIVE_DEFAULTS = {
+    "lmr_min_depth": 3,
+    "lmr_full_moves": 3,
+    "lmr_reduction": 1,
+    "null_move_min_depth": 4,
+    "null_move_reduction": 2,
+    "null_move_min_pieces": 12,
+}
+# Найбільша довжина серії взять у пошуку спокою (запобіжник)
+QUIESCENCE_MAX_DEPTH = 32
+
+# Бонус за кожне можливе взяття
+CAPTURE_BONUS = 50
+
+# Оцінка виграної позиції (як win_score/1 у Checkers.pl); виграш за менше
+# півходів оцінюється вище: WIN_SCORE - ply
+WIN_SCORE = 100000
+# Оцінки, далі від нуля за цю межу, - виграш або програш (з відстанню до кінця гри):
+# пошук оцінює виграш як WIN_SCORE - ply (ply не більше MAX_SEARCH_DEPTH +
+# QUIESCENCE_MAX_DEPTH, що менше за MAX_PLY), а бази ендшпілю ще
+# віднімають відстань до кінця гри за таблицею (не більше MAX_DISTANCE)
+WIN_THRESHOLD = WIN_SCORE - MAX_PLY - MAX_DISTANCE
+
+
+def _piece_square_values():
+    """
+    Будує таблицю оцінок фігур з погляду чорних (ті ж доданки, що в evaluate_board)
+
+    Returns:
+        dict: Фігура -> список оцінок для клітинок 0-63
+    """
+    values = {"w": [], "wk": [], "b": [], "bk": []}
+    for sq in range(64):
+        x, y = SQUARE_COORDS[sq]
+        centre = 10 if 3 <= x <= 6 and 3 <= y <= 6 else 0
+        values["w"].append(-(100 + (8 - y) * 5 + centre))
+        values["wk"].append(-300)
+        values["b"].append(100 + y * 5 + centre)
+        values["bk"].append(300)
+    return values
+
+
+# PIECE_SQUARE_VALUES[piece][sq] - внесок фігури на клітинці в оцінку позиції
+PIECE_SQUARE_VALUES = _piece_square_values()
+
+
+def score_to_tt(score, ply):
+    """
+    Перетворює оцінку виграшу з відліку від кореня на відлік від вузла,
+    щоб запис таблиці транспозицій був правильним на будь-якій відстані
+    від кореня
+
+    Args:
+        score (float): Оцінка пошуку (виграш - WIN_SCORE мінус півходи від кореня)
+        ply (int): Відстань вузла від кореня
+
+    Returns:
+        float: Оцінка для таблиці транспозицій
+    """
+    if score >= WIN_THRESHOLD:
+        return score + ply
+    if score <= -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def score_from_tt(score, ply):
+    """
+    Перетворює оцінку з таблиці транспозицій назад на відлік від кореня
+
+    Args:
+        score (float): Оцінка з таблиці транспозицій
+        ply (int): Відстань вузла від кореня
+
+    Returns:
+        float: Оцінка пошуку
+    """
+    if score >= WIN_THRESHOLD:
+        return score - ply
+    if score <= -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+class SearchTimeout(Exception):
+    """
+    Час на пошук вичерпано посеред ітерації
+    """
+
+
+class _ProfiledSearchBoard(SearchBoard):
+    """
+    Дошка пошуку, що вимірює час генерації, виконання і скасування ходів
+    (лише для CheckersAI(profile=True): виміри сповільнюють пошук)
+    """
+    __slots__ = ("stats",)
+
+    def moves(self, player=None):
+        started = time.perf_counter()
+        moves = SearchBoard.moves(self, player)
+        self.stats.movegen_time += time.perf_counter() - started
+        return moves
+
+    def captures(self):
+        started = time.perf_counter()
+        captures = SearchBoard.captures(self)
+        self.stats.movegen_time += time.perf_counter() - started
+        return captures
+
+    def make(self, move):
+        started = time.perf_counter()
+        SearchBoard.make(self, move)
+        self.stats.make_time += time.perf_counter() - started
+
+    def unmake(self):
+        started = time.perf_counter()
+        SearchBoard.unmake(self)
+        self.stats.make_time += time.perf_counter() - started
+
 
 class CheckersAI:
     """
     Штучний інтелект для гри в шашки
     """
-    def __init__(self, difficulty="medium"):
+    def __init__(self, difficulty="medium", backend=None, interface=None, tt_size_mb=16, orderer=None,
+                 workers=1, quiescence=True, book=None, tablebase=None, profile=False, progress=None,
+                 algorithm="alphabeta", selective=False):
         """
         Ініціалізація AI з вибраним рівнем складності
         
         Args:
             difficulty (str): Рівень складності AI ('easy', 'medium', 'hard')
+            backend (str): Бекенд правил ('prolog' або 'bitboard'), за замовчуванням
+                з змінної середовища CHECKERS_BACKEND
+            interface: Готовий інтерфейс правил; за замовчуванням спільний
+                інтерфейс процесу з get_interface()
+            tt_size_mb (float): Обмеження пам'яті таблиці транспозицій у мегабайтах
+                (0 - без таблиці)
+            orderer: Впорядкування ходів у пошуку (за замовчуванням MoveOrderer)
+            workers (int): Кількість процесів для паралельного пошуку ходів кореня
+                (1 - пошук у поточному процесі, None - за кількістю ядер)
+            quiescence (bool): Чи продовжувати листки пошуку серіями взять
+            book: Дебютна книга (OpeningBook або шлях до файлу); за замовчуванням
+                файл зі змінної середовища CHECKERS_BOOK, якщо вона задана
+            tablebase: Бази ендшпілю (Tablebases або каталог з таблицями); за
+                замовчуванням каталог зі змінної середовища CHECKERS_TABLEBASES
+            profile (bool): Чи вимірювати час генерації ходів, виконання ходів
+                і оцінки (сповільнює пошук)
+            progress (callable): Функція, яка під час пошуку отримує SearchStats
+                після кожної ітерації і кожні PROGRESS_INTERVAL вузлів (у потоці
+                пошуку)
+            algorithm (str): Алгоритм пошуку з ALGORITHMS: 'alphabeta' або 'pvs'
+                (пошук головного варіанту з вікнами аспірації)
+            selective: Вибірковий пошук (скорочення пізніх ходів і нульовий хід):
+                False - вимкнено, True - з SELECTIVE_DEFAULTS, словник - зі
+                зміненими параметрами SELECTIVE_DEFAULTS
         """
-        self.interface = CheckersInterface()
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Невідомий алгоритм пошуку: {algorithm}. Доступні: {', '.join(ALGORITHMS)}")
+        self.interface = interface or get_interface(backend)
+        if interface is None:
+            self.backend = resolve_backend(backend)
+        else:
+            self.backend = "bitboard" if isinstance(interface, BitboardInterface) else "prolog"
         self.difficulty = difficulty
         self.player_color = "black"  # AI завжди грає за чорних
         
-        # Визначення глибини пошуку залежно від складності
-        self.depth_map = {
-            "easy": 1,
-            "medium": 3,
-            "hard": 5
+        # Час на обдумування ходу (секунди) залежно від складності:
+        # глибина пошуку визначається тим, скільки ітерацій встигає завершитися
+        self.time_map = {
+            "easy": 0.05,
+            "medium": 0.2,
+            "hard": 2.0
         }
+        # Глибина і оцінка останнього повністю завершеного пошуку
+        self.last_depth = 0
+        self.last_score = None
+        # Повний шлях останнього ходу AI (для серії взять - усі клітинки)
+        self.last_path = None
+        self._deadline = None
+        # Подія, встановлення якої перериває пошук (для пошуку в іншому потоці)
+        self.cancel_event = None
+        self._nodes = 0
+        
+        # Пошук спокою: у листках досліджуються взяття, доки позиція не стане тихою
+        self.quiescence_enabled = quiescence
+        # Вузли основного пошуку і пошуку спокою останнього ходу
+        self.search_nodes = 0
+        self.quiescence_nodes = 0
+        # Статичні оцінки, розгорнуті вузли і бета-відсікання останнього ходу
+        self.leaf_evaluations = 0
+        self.expanded_nodes = 0
+        self.beta_cutoffs = 0
+        
+        # PVS: ходи після першого перевіряються нульовим вікном і
+        # перешукуються з повним, лише якщо виявилися кращими
+        self.algorithm = algorithm
+        self.pvs = algorithm == "pvs"
+        # Повторні пошуки PVS після нульового вікна і після виходу за вікно аспірації
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        
+        # Вибірковий пошук: пізні тихі ходи шукаються на меншу глибину, а
+        # нульовий хід з перевіркою відсікає явно виграшні для гравця вузли
+        self.selective = None
+        if selective:
+            self.selective = dict(SELECTIVE_DEFAULTS)
+            if isinstance(selective, dict):
+                unknown = set(selective) - set(SELECTIVE_DEFAULTS)
+                if unknown:
+                    raise ValueError(f"Невідомі параметри вибіркового пошуку: {', '.join(sorted(unknown))}")
+                self.selective.update(selective)
+        # Скорочені ходи і ті з них, що перешукувалися на повну глибину;
+        # спроби нульового ходу, відсікання ним і відсікання, не підтверджені перевіркою
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.null_move_tries = 0
+        self.null_move_cutoffs = 0
+        self.null_move_failures = 0
+        
+        # Статистика останнього пошуку (None, якщо хід вибрано без пошуку)
+        self.last_stats = None
+        self.profile = profile
+        self.progress = progress
+        self._search_started = None
+        self._tt_counters = (0, 0)
+        # Лічильники таблиць і впорядкування процесів-виконавців (WORKER_TOTALS)
+        self._worker_totals = SearchStats()
+        # Статистика, у яку пишуться виміри часу (лише з profile=True)
+        self._timing = None
+        
+        # Процеси для паралельного пошуку створюються при першому ході
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.tt_size_mb = tt_size_mb
+        self._pool = None
+        # Подія, що перериває пошук у процесах-виконавцях
+        self._workers_cancel = None
+        # Номер паралельного пошуку: разом з глибиною позначає ітерацію для процесів
+        self._parallel_searches = 0
+        
+        # Таблиця транспозицій зберігається між ходами: позиції з попереднього
+        # пошуку часто повторюються в наступному
+        self.zobrist = ZobristKeys()
+        self.tt = TranspositionTable(tt_size_mb) if tt_size_mb else None
+        self.orderer = orderer or MoveOrderer()
+        
+        # Позиції з дебютної книги не шукаються
+        book = book or os.environ.get("CHECKERS_BOOK")
+        self.book = OpeningBook(book) if isinstance(book, str) else book
+        # Позиції з кількох фігур оцінюються точно за базами ендшпілю
+        tablebase = tablebase or os.environ.get("CHECKERS_TABLEBASES")
+        self.tablebase = Tablebases(tablebase) if isinstance(tablebase, str) else tablebase
+        # Звідки взято останній хід: "book", "tablebase", "search" або "random"
+        self.last_source = None
+    
+    def set_difficulty(self, difficulty):
+        """
+        Змінює рівень складності без повторної ініціалізації бекенду
+        
+        Args:
+            difficulty (str): Рівень складності AI ('easy', 'medium', 'hard')
+        """
+        self.difficulty = difficulty
     
     def make_move(self, board):
         """
@@ -33,10 +307,99 @@ class CheckersAI:
         Returns:
             tuple: Новий стан дошки та інформація про хід (from_x, from_y, to_x, to_y)
         """
+        move = self.choose_move(board)
+        if move is None:
+            return None, (None, None, None, None)
+        return self.apply_move(board, move)
+    
+    def choose_move(self, board, time_budget=None, max_depth=None):
+        """
+        Вибирає хід залежно від складності, не виконуючи його
+        
+        Бекенд правил тут не використовується, тож вибір можна запускати
+        в окремому потоці, а хід виконати apply_move() в основному.
+        
+        Args:
+            board (list): Поточний стан дошки
+            time_budget (float): Час на пошук у секундах (див. choose_best_move)
+            max_depth (int): Найбільша глибина пошуку
+        
+        Returns:
+            Move: Хід або None, якщо допустимих ходів немає
+        """
+        self.last_stats = None
         if self.difficulty == "easy":
-            return self.make_random_move(board)
-        else:
-            return self.make_best_move(board)
+            return self.choose_random_move(board)
+        if self.book is not None:
+            move = self.choose_book_move(board)
+            if move is not None:
+                return move
+        if self.tablebase is not None:
+            move = self.choose_tablebase_move(board)
+            if move is not None:
+                return move
+        return self.choose_best_move(board, time_budget, max_depth)
+    
+    def choose_book_move(self, board):
+        """
+        Вибирає хід з дебютної книги (випадково з урахуванням ваг)
+        
+        Args:
+            board (list): Поточний стан дошки
+        
+        Returns:
+            Move: Хід або None, якщо позиції немає в книзі
+        """
+        position = SearchBoard.from_board(board, self.player_color, self.zobrist)
+        move = self.book.choose(position)
+        if move is not None:
+            self.last_depth = 0
+            self.last_score = None
+            self.last_source = "book"
+        return move
+    
+    def choose_tablebase_move(self, board):
+        """
+        Вибирає хід за базами ендшпілю: найшвидший виграш, нічию або
+        найдовший опір
+        
+        Args:
+            board (list): Поточний стан дошки
+        
+        Returns:
+            Move: Хід або None, якщо позиції немає в таблицях
+        """
+        position = SearchBoard.from_board(board, self.player_color)
+        if bin(position.white | position.black).count("1") > self.tablebase.max_pieces:
+            return None
+        found = self.tablebase.best_move(position)
+        if found is None:
+            return None
+        move, result, distance = found
+        self.last_depth = 0
+        self.last_score = self._tablebase_score(result, distance, True, 0)
+        self.last_source = "tablebase"
+        return move
+    
+    def _tablebase_score(self, result, distance, is_maximizing, ply):
+        """
+        Перетворює результат з таблиць на оцінку пошуку
+        
+        Args:
+            result (int): DRAW, WIN або LOSS для гравця, який ходить
+            distance (int): Півходів до кінця гри
+            is_maximizing (bool): Чи ходить AI
+            ply (int): Відстань від кореня дерева пошуку
+        
+        Returns:
+            int: Оцінка з погляду AI
+        """
+        if result == DRAW:
+            return 0
+        score = WIN_SCORE - ply - distance
+        if result != WIN:
+            score = -score
+        return score if is_maximizing else -score
     
     def make_random_move(self, board):
         """
@@ -48,134 +411,688 @@ class CheckersAI:
         Returns:
             tuple: Новий стан дошки та інформація про хід (from_x, from_y, to_x, to_y)
         """
-        # Отримуємо всі можливі ходи
-        all_moves = self.get_all_possible_moves(board, self.player_color)
-        if not all_moves:
+        move = self.choose_random_move(board)
+        if move is None:
             return None, (None, None, None, None)
+        return self.apply_move(board, move)
+    
+    def choose_random_move(self, board):
+        """
+        Вибирає випадковий допустимий хід, не виконуючи його
         
-        # Віддаємо перевагу взяттям, якщо вони є
-        captures = [move for move in all_moves if abs(move[2] - move[0]) == 2]
+        Args:
+            board (list): Поточний стан дошки
         
-        if captures:
-            # Вибираємо випадкове взяття
-            move = random.choice(captures)
-        else:
-            # Вибираємо випадковий хід
-            move = random.choice(all_moves)
+        Returns:
+            Move: Хід або None, якщо допустимих ходів немає
+        """
+        # Отримуємо всі можливі ходи; взяття обов'язкові, тож якщо вони є,
+        # у списку лише повні серії взять
+        all_moves = SearchBoard.from_board(board, self.player_color).moves()
+        if not all_moves:
+            return None
+        self.last_source = "random"
+        return random.choice(all_moves)
+    
+    def make_best_move(self, board, time_budget=None, max_depth=None):
+        """
+        Вибирає найкращий хід ітеративним поглибленням у межах часу
         
-        from_x, from_y, to_x, to_y = move
-        new_board = self.interface.make_move(board, from_x, from_y, to_x, to_y, self.player_color)
+        Пошук повторюється з глибиною 1, 2, 3, ... доки не вичерпано час.
+        Повертається хід останньої повністю завершеної ітерації, а її
+        найкращий хід перевіряється першим у наступній.
+        
+        Args:
+            board (list): Поточний стан дошки
+            time_budget (float): Час на хід у секундах; за замовчуванням
+                з time_map для поточної складності, None разом з max_depth -
+                без обмеження часу
+            max_depth (int): Найбільша глибина пошуку
         
-        return new_board, move
+        Returns:
+            tuple: Новий стан дошки та інформація про хід (from_x, from_y, to_x, to_y)
+        """
+        move = self.choose_best_move(board, time_budget, max_depth)
+        if move is None:
+            return None, (None, None, None, None)
+        return self.apply_move(board, move)
     
-    def make_best_move(self, board):
+    def choose_best_move(self, board, time_budget=None, max_depth=None):
         """
-        Вибирає найкращий хід за допомогою мінімакс алгоритму
+        Вибирає найкращий хід пошуком (див. make_best_move), не виконуючи його
         
         Args:
             board (list): Поточний стан дошки
+            time_budget (float): Час на хід у секундах
+            max_depth (int): Найбільша глибина пошуку
         
         Returns:
-            tuple: Новий стан дошки та інформація про хід (from_x, from_y, to_x, to_y)
+            Move: Хід або None, якщо допустимих ходів немає
         """
-        depth = self.depth_map[self.difficulty]
-        _, best_move = self.minimax(board, depth, float('-inf'), float('inf'), True)
+        if time_budget is None and max_depth is None:
+            time_budget = self.time_map[self.difficulty]
+        max_depth = max_depth or MAX_SEARCH_DEPTH
         
-        if best_move is None:
-            return None, (None, None, None, None)
+        # Пошук іде на змінній дошці з бітбордами: ходи виконуються і
+        # скасовуються на місці, бекенд правил потрібен лише для кореня
+        board_class = _ProfiledSearchBoard if self.profile else SearchBoard
+        position = board_class.from_board(board, self.player_color, self.zobrist, PIECE_SQUARE_VALUES)
+        stats = SearchStats()
+        if self.profile:
+            position.stats = stats
+            self._timing = stats
+        all_moves = position.moves()
+        if not all_moves:
+            self._timing = None
+            return None
         
-        from_x, from_y, to_x, to_y = best_move
-        new_board = self.interface.make_move(board, from_x, from_y, to_x, to_y, self.player_color)
+        started = time.perf_counter()
+        self.last_depth = 0
+        self.last_score = None
+        self.last_source = "search"
+        self.last_stats = stats
+        self._search_started = started
+        self._reset_counters()
         
-        return new_board, best_move
+        try:
+            # Єдиний допустимий хід не потребує пошуку
+            if len(all_moves) == 1:
+                best_move = all_moves[0]
+            elif self.workers > 1:
+                best_move = self._parallel_search(board, all_moves, started, time_budget, max_depth)
+            else:
+                best_move = self._iterative_search(position, all_moves, started, time_budget, max_depth)
+        finally:
+            self._update_stats()
+            self._search_started = None
+            self._timing = None
+        
+        return best_move
+    
+    def _reset_counters(self):
+        """
+        Обнуляє лічильники пошуку перед новим ходом
+        """
+        self._nodes = 0
+        self.search_nodes = 0
+        self.quiescence_nodes = 0
+        self.leaf_evaluations = 0
+        self.expanded_nodes = 0
+        self.beta_cutoffs = 0
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.null_move_tries = 0
+        self.null_move_cutoffs = 0
+        self.null_move_failures = 0
+        self.orderer.reset_counters()
+        self._worker_totals = SearchStats()
+        if self.tt is not None:
+            self._tt_counters = (self.tt.hits, self.tt.misses)
     
-    def minimax(self, board, depth, alpha, beta, is_maximizing):
+    def _update_stats(self):
         """
-        Алгоритм мінімакс з альфа-бета відсіканням
+        Переносить лічильники поточного пошуку в last_stats
+        
+        Returns:
+            SearchStats: Оновлена статистика
+        """
+        stats = self.last_stats
+        stats.depth = self.last_depth
+        stats.score = self.last_score
+        stats.elapsed = time.perf_counter() - self._search_started
+        stats.search_nodes = self.search_nodes
+        stats.quiescence_nodes = self.quiescence_nodes
+        stats.leaf_evaluations = self.leaf_evaluations
+        stats.expanded_nodes = self.expanded_nodes
+        stats.beta_cutoffs = self.beta_cutoffs
+        stats.pvs_researches = self.pvs_researches
+        stats.aspiration_researches = self.aspiration_researches
+        stats.selective = self.selective
+        stats.lmr_reductions = self.lmr_reductions
+        stats.lmr_researches = self.lmr_researches
+        stats.null_move_tries = self.null_move_tries
+        stats.null_move_cutoffs = self.null_move_cutoffs
+        stats.null_move_failures = self.null_move_failures
+        workers = self._worker_totals
+        stats.ordering_cutoffs = self.orderer.cutoffs + workers.ordering_cutoffs
+        stats.first_move_cutoffs = self.orderer.first_move_cutoffs + workers.first_move_cutoffs
+        stats.tt_hits = workers.tt_hits
+        stats.tt_probes = workers.tt_probes
+        if self.tt is not None:
+            hits, misses = self._tt_counters
+            stats.tt_hits += self.tt.hits - hits
+            stats.tt_probes += self.tt.hits - hits + self.tt.misses - misses
+        return stats
+    
+    def _report_progress(self):
+        """
+        Передає поточну статистику функції progress
+        """
+        if self.progress is not None and self._search_started is not None:
+            self.progress(self._update_stats())
+    
+    def apply_move(self, board, move, handle=None):
+        """
+        Виконує хід пошуку через бекенд правил, стрибок за стрибком
         
         Args:
             board (list): Поточний стан дошки
+            move (Move): Хід (для серії взять - увесь шлях)
+            handle (int): Дескриптор збереженої дошки (див. new_board_handle);
+                якщо задано, стрибки виконуються на ній і дошка передається
+                назад лише один раз
+        
+        Returns:
+            tuple: Новий стан дошки та хід (from_x, from_y, to_x, to_y) від
+                початкової до кінцевої клітинки; повний шлях - у last_path
+        """
+        if handle is not None:
+            for hop in move.hops():
+                if not self.interface.handle_make_move(handle, *hop, self.player_color):
+                    return None, None
+            new_board = self.interface.get_handle_board(handle)
+        else:
+            new_board = board
+            for hop in move.hops():
+                new_board = self.interface.make_move(new_board, *hop, self.player_color)
+        self.last_path = move.coords()
+        return new_board, self.last_path[0] + self.last_path[-1]
+    
+    def _iterative_search(self, position, all_moves, started, time_budget, max_depth):
+        """
+        Ітеративне поглиблення в поточному процесі
+        
+        Returns:
+            Move: Найкращий хід
+        """
+        best_move = all_moves[0]
+        self.orderer.new_search()
+        nodes_before = 0
+        for depth in range(1, max_depth + 1):
+            # Перша ітерація без обмеження часу, щоб мати хід (перервати її
+            # може лише скасування пошуку)
+            if time_budget is not None and depth > 1:
+                self._deadline = started + time_budget
+            try:
+                score, move = self._search_root(position, depth, best_move)
+            except SearchTimeout:
+                # Кожен вузол скасовує свій хід і при перериванні, тож
+                # позиція вже повернулася до кореня
+                break
+            finally:
+                self._deadline = None
+            if move is not None:
+                best_move = move
+            self.last_depth = depth
+            self.last_score = score
+            nodes = self.search_nodes + self.quiescence_nodes
+            self.last_stats.iteration_nodes.append(nodes - nodes_before)
+            nodes_before = nodes
+            self._report_progress()
+            # Виграш знайдено або час майже вичерпано - глибша ітерація не встигне
+            if score >= WIN_SCORE - MAX_SEARCH_DEPTH:
+                break
+            if time_budget is not None and time.perf_counter() - started >= time_budget / 2:
+                break
+        return best_move
+    
+    def _search_root(self, position, depth, best_move):
+        """
+        Одна ітерація пошуку з кореня
+        
+        Для PVS пошук починається з вікна аспірації навколо оцінки
+        попередньої ітерації; якщо оцінка виходить за вікно, межа, яку
+        перетнуто, знімається і пошук повторюється.
+        
+        Returns:
+            tuple: Оцінка і найкращий хід
+        """
+        alpha, beta = float('-inf'), float('inf')
+        if self.pvs and depth > 1 and abs(self.last_score) < WIN_SCORE - MAX_SEARCH_DEPTH:
+            alpha = self.last_score - ASPIRATION_WINDOW
+            beta = self.last_score + ASPIRATION_WINDOW
+        while True:
+            score, move = self.minimax(position, depth, alpha, beta, True, best_move)
+            if score <= alpha:
+                alpha = float('-inf')
+            elif score >= beta:
+                beta = float('inf')
+            else:
+                return score, move
+            self.aspiration_researches += 1
+    
+    def _parallel_search(self, board, all_moves, started, time_budget, max_depth):
+        """
+        Ітеративне поглиблення з розподілом ходів кореня між процесами
+        
+        На кожній глибині кожен хід кореня шукається окремим завданням у
+        ProcessPoolExecutor (кожен процес має власний бекенд правил і таблицю
+        транспозицій), а найкращий хід вибирається в корені. Ходи кореня
+        впорядковуються за оцінками попередньої глибини.
+        
+        Returns:
+            Move: Найкращий хід
+        """
+        pool = self._get_pool()
+        self._parallel_searches += 1
+        ordered = list(all_moves)
+        best_move = ordered[0]
+        for depth in range(1, max_depth + 1):
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                break
+            remaining = None
+            if time_budget is not None and depth > 1:
+                remaining = started + time_budget - time.perf_counter()
+                if remaining <= 0:
+                    break
+            iteration = (self._parallel_searches, depth)
+            futures = [pool.submit(_search_root_move, board, move, depth, remaining, iteration)
+                       for move in ordered]
+            completed = self._wait_workers(futures)
+            results = [future.result() for future in futures if not future.cancelled()]
+            nodes_before = self.search_nodes + self.quiescence_nodes
+            for _, stats in results:
+                self._merge_worker_stats(stats)
+            if not completed or any(score is None for score, _ in results):
+                # Пошук скасовано або хоча б один хід не встиг - глибина не завершена
+                break
+            scores = {move: score for move, (score, _) in zip(ordered, results)}
+            # Стабільне сортування: за рівних оцінок попередній кращий хід лишається першим
+            ordered.sort(key=lambda move: scores[move], reverse=True)
+            best_move = ordered[0]
+            self.last_depth = depth
+            self.last_score = scores[best_move]
+            self.last_stats.iteration_nodes.append(self.search_nodes + self.quiescence_nodes - nodes_before)
+            self._report_progress()
+            if self.last_score >= WIN_SCORE - MAX_SEARCH_DEPTH:
+                break
+            if time_budget is not None and time.perf_counter() - started >= time_budget / 2:
+                break
+        return best_move
+    
+    def _merge_worker_stats(self, stats):
+        """
+        Додає статистику завдання процесу-виконавця до лічильників пошуку
+        
+        Args:
+            stats (SearchStats): Статистика пошуку одного ходу кореня
+        """
+        for name in SEARCH_COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(stats, name))
+        for name in WORKER_TOTALS:
+            setattr(self._worker_totals, name, getattr(self._worker_totals, name) + getattr(stats, name))
+        if self.profile:
+            self.last_stats.movegen_time += stats.movegen_time
+            self.last_stats.make_time += stats.make_time
+            self.last_stats.eval_time += stats.eval_time
+    
+    def _wait_workers(self, futures):
+        """
+        Чекає на завдання процесів-виконавців, перевіряючи скасування пошуку
+        
+        Після скасування завдання, що ще в черзі, скасовуються, а пошук у
+        процесах переривається подією, яку процеси перевіряють разом з часом.
+        
+        Args:
+            futures (list): Завдання _search_root_move
+        
+        Returns:
+            bool: True, якщо всі завдання завершилися, False, якщо пошук скасовано
+        """
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL)
+            if pending and self.cancel_event is not None and self.cancel_event.is_set():
+                for future in pending:
+                    future.cancel()
+                self._workers_cancel.set()
+                try:
+                    wait(pending)
+                finally:
+                    self._workers_cancel.clear()
+                return False
+        return True
+    
+    def _get_pool(self):
+        """
+        Повертає пул процесів для паралельного пошуку, створюючи його при потребі
+        """
+        if self._pool is None:
+            self._workers_cancel = multiprocessing.Event()
+            tablebase = self.tablebase.directory if self.tablebase is not None else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.backend, self.tt_size_mb, self.quiescence_enabled, self.algorithm, self.selective,
+                          self.profile, tablebase, self._workers_cancel)
+            )
+        return self._pool
+    
+    def close(self):
+        """
+        Зупиняє процеси паралельного пошуку
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    def minimax(self, position, depth, alpha, beta, is_maximizing, first_move=None, ply=0, allow_null=True):
+        """
+        Алгоритм мінімакс з альфа-бета відсіканням і таблицею транспозицій
+        
+        З algorithm='pvs' повним вікном шукається лише перший хід, решта -
+        нульовим вікном з повторним пошуком, якщо хід виявився кращим.
+        З selective пізні тихі ходи спершу шукаються на меншу глибину, а
+        вузол може бути відсічено нульовим ходом (див. _null_move_cutoff).
+        
+        Args:
+            position (SearchBoard): Поточна позиція (змінюється під час пошуку
+                і відновлюється перед поверненням)
             depth (int): Глибина пошуку
             alpha (float): Альфа значення
             beta (float): Бета значення
             is_maximizing (bool): True, якщо це хід AI, False для людини
+            first_move (Move): Хід, який слід перевірити першим (найкращий хід
+                попередньої ітерації)
+            ply (int): Відстань від кореня дерева пошуку
+            allow_null (bool): Чи можна пробувати нульовий хід (не двічі поспіль)
         
         Returns:
-            tuple: Оцінка позиції та найкращий хід
+            tuple: Оцінка позиції та найкращий хід (Move)
         """
-        # Базовий випадок: досягнуто максимальну глибину або гра закінчена
-        if depth == 0 or self.is_game_over(board):
-            return self.evaluate_board(board), None
+        self.search_nodes += 1
+        self._check_time()
+        
+        # Базовий випадок: досягнуто максимальну глибину - оцінюємо позицію,
+        # спершу довівши до кінця серію взять
+        if depth == 0:
+            if self.quiescence_enabled:
+                return self.quiescence(position, alpha, beta, is_maximizing), None
+            return self.evaluate_position(position), None
         
-        current_player = self.player_color if is_maximizing else "white"
-        all_moves = self.get_all_possible_moves(board, current_player)
+        current_player = position.player
         
+        # Позиція з кількох фігур - точний результат з баз ендшпілю
+        if (self.tablebase is not None and ply > 0
+                and bin(position.white | position.black).count("1") <= self.tablebase.max_pieces):
+            found = self.tablebase.probe(position.white, position.black, position.kings, current_player)
+            if found is not None:
+                return self._tablebase_score(found[0], found[1], is_maximizing, ply), None
+        
+        # Позиція вже досліджена на достатню глибину - беремо результат з таблиці
+        tt_move = None
+        if self.tt is not None:
+            entry = self.tt.probe(position.key)
+            if entry is not None:
+                _, entry_depth, flag, score, tt_move = entry
+                score = score_from_tt(score, ply)
+                if entry_depth >= depth and (
+                    flag == EXACT
+                    or (flag == LOWER_BOUND and score >= beta)
+                    or (flag == UPPER_BOUND and score <= alpha)
+                ):
+                    return score, tt_move
+        
+        # Ходи генеруються один раз: порожній список означає кінець гри -
+        # гравець, який ходить, програв
+        all_moves = position.moves()
         if not all_moves:
-            # Якщо немає можливих ходів, це програш для поточного гравця
-            return float('-inf') if is_maximizing else float('inf'), None
+            return (ply - WIN_SCORE if is_maximizing else WIN_SCORE - ply), None
+        
+        selective = self.selective
+        if selective is not None and allow_null and ply > 0:
+            score = self._null_move_cutoff(position, all_moves, depth, alpha, beta, is_maximizing, ply)
+            if score is not None:
+                return score, None
+        
+        # Найкращий хід з таблиці або попередньої ітерації перевіряємо першим,
+        # далі ходи-вбивці та історія
+        all_moves = self.orderer.order(all_moves, current_player, ply, tt_move, first_move)
         
+        self.expanded_nodes += 1
+        alpha_original = alpha
+        beta_original = beta
         best_move = None
+        best_eval = float('-inf') if is_maximizing else float('inf')
+        kings = position.kings
         
-        if is_maximizing:
-            max_eval = float('-inf')
-            for move in all_moves:
-                from_x, from_y, to_x, to_y = move
-                new_board = self.interface.make_move(board, from_x, from_y, to_x, to_y, current_player)
-                
-                # Перевіряємо на додаткові взяття
-                additional_captures = False
-                if abs(to_x - from_x) == 2:  # Було взяття
-                    next_moves = self.get_possible_captures_from(new_board, to_x, to_y, current_player)
-                    if next_moves:
-                        additional_captures = True
-                
-                # Якщо є додаткові взяття, не змінюємо гравця
-                if additional_captures:
-                    eval_val, _ = self.minimax(new_board, depth - 1, alpha, beta, True)
-                else:
-                    eval_val, _ = self.minimax(new_board, depth - 1, alpha, beta, False)
-                
-                if eval_val > max_eval:
-                    max_eval = eval_val
+        for index, move in enumerate(all_moves):
+            # Серія взять - один хід, після нього завжди ходить суперник
+            position.make(move)
+            try:
+                eval_val = None
+                # Пізній тихий хід спершу шукається на меншу глибину
+                if (selective is not None and index >= selective["lmr_full_moves"]
+                        and depth >= selective["lmr_min_depth"] and self._is_quiet(move, position, kings)):
+                    eval_val = self._reduced_search(position, depth, alpha, beta, is_maximizing, ply)
+                if eval_val is None and (index == 0 or not self.pvs):
+                    eval_val, _ = self.minimax(position, depth - 1, alpha, beta, not is_maximizing, ply=ply + 1)
+                elif eval_val is None:
+                    # Нульове вікно лише перевіряє, чи хід кращий за вже знайдений
+                    # (оцінки цілі); якщо так - точна оцінка повторним пошуком
+                    if is_maximizing:
+                        eval_val, _ = self.minimax(position, depth - 1, alpha, alpha + 1, False, ply=ply + 1)
+                    else:
+                        eval_val, _ = self.minimax(position, depth - 1, beta - 1, beta, True, ply=ply + 1)
+                    if alpha < eval_val < beta:
+                        self.pvs_researches += 1
+                        eval_val, _ = self.minimax(position, depth - 1, alpha, beta, not is_maximizing,
+                                                   ply=ply + 1)
+            finally:
+                position.unmake()
+            
+            if is_maximizing:
+                if eval_val > best_eval:
+                    best_eval = eval_val
                     best_move = move
-                
                 alpha = max(alpha, eval_val)
-                if beta <= alpha:
-                    break
-            
-            return max_eval, best_move
-        else:
-            min_eval = float('inf')
-            for move in all_moves:
-                from_x, from_y, to_x, to_y = move
-                new_board = self.interface.make_move(board, from_x, from_y, to_x, to_y, current_player)
-                
-                # Перевіряємо на додаткові взяття
-                additional_captures = False
-                if abs(to_x - from_x) == 2:  # Було взяття
-                    next_moves = self.get_possible_captures_from(new_board, to_x, to_y, current_player)
-                    if next_moves:
-                        additional_captures = True
-                
-                # Якщо є додаткові взяття, не змінюємо гравця
-                if additional_captures:
-                    eval_val, _ = self.minimax(new_board, depth - 1, alpha, beta, False)
-                else:
-                    eval_val, _ = self.minimax(new_board, depth - 1, alpha, beta, True)
-                
-                if eval_val < min_eval:
-                    min_eval = eval_val
+            else:
+                if eval_val < best_eval:
+                    best_eval = eval_val
                     best_move = move
-                
                 beta = min(beta, eval_val)
-                if beta <= alpha:
-                    break
+            if beta <= alpha:
+                self.beta_cutoffs += 1
+                self.orderer.record_cutoff(move, current_player, ply, depth, index)
+                break
+        
+        if self.tt is not None:
+            if best_eval <= alpha_original:
+                flag = UPPER_BOUND
+            elif best_eval >= beta_original:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.tt.store(position.key, depth, flag, score_to_tt(best_eval, ply), best_move)
+        
+        return best_eval, best_move
+    
+    def _is_quiet(self, move, position, kings):
+        """
+        Чи можна скоротити пошук ходу: не взяття, не перетворення в дамку і
+        не віддає фігуру (після ходу у суперника немає взять)
+        
+        Args:
+            move (Move): Щойно виконаний хід
+            position (SearchBoard): Позиція після ходу
+            kings (int): Бітборд дамок до ходу
+        
+        Returns:
+            bool: True для тихого ходу
+        """
+        if move.captured:
+            return False
+        if position.kings >> move.to_sq & 1 and not kings >> move.from_sq & 1:
+            return False
+        return not count_captures(position.white, position.black, position.player)
+    
+    def _reduced_search(self, position, depth, alpha, beta, is_maximizing, ply):
+        """
+        Шукає пізній тихий хід на скорочену глибину з нульовим вікном
+        
+        Args:
+            position (SearchBoard): Позиція після ходу
+            depth (int): Глибина вузла, з якого зроблено хід
+            alpha (float): Альфа значення вузла
+            beta (float): Бета значення вузла
+            is_maximizing (bool): Чи максимізує вузол, з якого зроблено хід
+            ply (int): Відстань вузла від кореня
+        
+        Returns:
+            float: Оцінка ходу або None, якщо хід виявився кращим за вже
+                знайдені і його треба перешукати на повну глибину
+        """
+        self.lmr_reductions += 1
+        reduced = max(0, depth - 1 - self.selective["lmr_reduction"])
+        if is_maximizing:
+            eval_val, _ = self.minimax(position, reduced, alpha, alpha + 1, False, ply=ply + 1)
+            improved = eval_val > alpha
+        else:
+            eval_val, _ = self.minimax(position, reduced, beta - 1, beta, True, ply=ply + 1)
+            improved = eval_val < beta
+        if improved:
+            self.lmr_researches += 1
+            return None
+        return eval_val
+    
+    def _null_move_cutoff(self, position, all_moves, depth, alpha, beta, is_maximizing, ply):
+        """
+        Нульовий хід з перевіркою: якщо навіть після пропуску ходу оцінка
+        виходить за межу вікна, вузол, найімовірніше, відсікається
+        
+        Пропустити хід за правилами не можна, а в шашках часто цугцванг, тож
+        нульовий хід не пробується, коли є взяття, у ендшпілі і біля оцінок
+        виграшу; відсікання підтверджується звичайним пошуком на скорочену глибину.
+        
+        Args:
+            position (SearchBoard): Позиція вузла
+            all_moves (list): Допустимі ходи вузла
+            depth (int): Глибина вузла
+            alpha (float): Альфа значення
+            beta (float): Бета значення
+            is_maximizing (bool): Чи максимізує вузол
+            ply (int): Відстань від кореня
+        
+        Returns:
+            float: Оцінка для відсікання або None
+        """
+        selective = self.selective
+        bound = beta if is_maximizing else alpha
+        if (depth < selective["null_move_min_depth"] or all_moves[0].captured
+                or abs(bound) >= WIN_SCORE - MAX_SEARCH_DEPTH
+                or bin(position.white | position.black).count("1") < selective["null_move_min_pieces"]):
+            return None
+        self.null_move_tries += 1
+        reduced = max(0, depth - 1 - selective["null_move_reduction"])
+        if is_maximizing:
+            window = (beta - 1, beta)
+        else:
+            window = (alpha, alpha + 1)
+        position.make_null()
+        try:
+            score, _ = self.minimax(position, reduced, *window, not is_maximizing, ply=ply + 1, allow_null=False)
+        finally:
+            position.unmake_null()
+        if (score < beta) if is_maximizing else (score > alpha):
+            return None
+        # Перевірка: звичайний пошук вузла на скорочену глибину без нульових ходів
+        verified, _ = self.minimax(position, depth - selective["null_move_reduction"], *window, is_maximizing,
+                                   ply=ply, allow_null=False)
+        if (verified < beta) if is_maximizing else (verified > alpha):
+            self.null_move_failures += 1
+            return None
+        self.null_move_cutoffs += 1
+        return verified
+    
+    def quiescence(self, position, alpha, beta, is_maximizing, depth=0):
+        """
+        Пошук спокою: продовжує листок лише взяттями
+        
+        Взяття в цих правилах обов'язкові, тому гравець, який може брати,
+        не може "залишитися" при статичній оцінці: його взяття досліджуються
+        завжди. Статична оцінка (stand pat) повертається, коли у гравця,
+        який ходить, взять немає - позиція тиха.
+        
+        Args:
+            position (SearchBoard): Позиція пошуку
+            alpha (float): Альфа значення
+            beta (float): Бета значення
+            is_maximizing (bool): True, якщо ходять чорні (AI)
+            depth (int): Кількість взять від листка основного пошуку
+        
+        Returns:
+            float: Оцінка позиції
+        """
+        self.quiescence_nodes += 1
+        self._check_time()
+        
+        captures = position.captures()
+        if not captures or depth >= QUIESCENCE_MAX_DEPTH:
+            return self.evaluate_position(position)
+        
+        best_eval = float('-inf') if is_maximizing else float('inf')
+        for move in captures:
+            position.make(move)
+            try:
+                eval_val = self.quiescence(position, alpha, beta, not is_maximizing, depth + 1)
+            finally:
+                position.unmake()
             
-            return min_eval, best_move
+            if is_maximizing:
+                best_eval = max(best_eval, eval_val)
+                alpha = max(alpha, eval_val)
+            else:
+                best_eval = min(best_eval, eval_val)
+                beta = min(beta, eval_val)
+            if beta <= alpha:
+                break
+        
+        return best_eval
+    
+    def _check_time(self):
+        """
+        Перериває пошук, якщо час вичерпано або пошук скасовано (годинник і
+        cancel_event перевіряються не в кожному вузлі, а раз на TIME_CHECK_INTERVAL)
+        """
+        self._nodes += 1
+        if self._nodes % TIME_CHECK_INTERVAL == 0:
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise SearchTimeout()
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise SearchTimeout()
+            if self._nodes % PROGRESS_INTERVAL == 0:
+                self._report_progress()
+    
+    def evaluate_position(self, position):
+        """
+        Оцінює позицію пошуку (ті ж доданки, що evaluate_board)
+        
+        Матеріал, просування і центр SearchBoard підтримує інкрементально
+        в position.score, тому тут лише підраховуються взяття на бітбордах.
+        
+        Args:
+            position (SearchBoard): Позиція пошуку, створена з PIECE_SQUARE_VALUES
+        
+        Returns:
+            float: Оцінка позиції з погляду чорних
+        """
+        self.leaf_evaluations += 1
+        timing = self._timing
+        if timing is not None:
+            started = time.perf_counter()
+        # Додатковий бонус за можливість взяття
+        black_captures = count_captures(position.white, position.black, "black")
+        white_captures = count_captures(position.white, position.black, "white")
+        score = position.score + (black_captures - white_captures) * CAPTURE_BONUS
+        if timing is not None:
+            timing.eval_time += time.perf_counter() - started
+        return score
     
     def get_all_possible_moves(self, board, player):
         """
-        Отримує всі можливі ходи для гравця
+        Отримує всі можливі ходи для гравця (взяття обов'язкове)
         
         Args:
             board (list): Поточний стан дошки
@@ -184,50 +1101,10 @@ class CheckersAI:
         Returns:
             list: Список ходів у вигляді (from_x, from_y, to_x, to_y)
         """
-        all_moves = []
-        captures_required = False
-        
-        # Спочатку перевіряємо, чи є можливі взяття
-        for y in range(1, 9):
-            for x in range(1, 9):
-                piece = self.interface.get_piece(board, x, y)
-                is_player_piece = False
-                
-                if player == "white" and (piece == "w" or piece == "wk"):
-                    is_player_piece = True
-                elif player == "black" and (piece == "b" or piece == "bk"):
-                    is_player_piece = True
-                
-                if is_player_piece:
-                    # Перевіряємо можливі взяття для цієї шашки
-                    captures = self.get_possible_captures_from(board, x, y, player)
-                    if captures:
-                        if not captures_required:
-                            # Якщо це перше знайдене взяття, очищаємо список ходів
-                            all_moves = []
-                            captures_required = True
-                        all_moves.extend(captures)
-        
-        # Якщо немає взять, збираємо звичайні ходи
-        if not captures_required:
-            for y in range(1, 9):
-                for x in range(1, 9):
-                    piece = self.interface.get_piece(board, x, y)
-                    is_player_piece = False
-                    
-                    if player == "white" and (piece == "w" or piece == "wk"):
-                        is_player_piece = True
-                    elif player == "black" and (piece == "b" or piece == "bk"):
-                        is_player_piece = True
-                    
-                    if is_player_piece:
-                        # Перевіряємо можливі ходи для цієї шашки
-                        moves = self.get_possible_moves_from(board, x, y, player)
-                        all_moves.extend(moves)
-        
-        return all_moves
-    
-    def get_possible_moves_from(self, board, x, y, player):
+        # Один запит до бекенду замість перебору 64 клітинок з get_piece
+        return self.interface.legal_moves(board, player)
+    
+    def get_possible_moves_from(self, board, x, y, player, snapshot=None):
         """
         Отримує всі можливі ходи для шашки на позиції (x, y)
         
@@ -236,12 +1113,13 @@ class CheckersAI:
             x (int): Координата X (1-8)
             y (int): Координата Y (1-8)
             player (str): Гравець ('white' або 'black')
+            snapshot (BoardSnapshot): Готовий знімок дошки, якщо вже є
         
         Returns:
             list: Список ходів у вигляді (from_x, from_y, to_x, to_y)
         """
         moves = []
-        piece = self.interface.get_piece(board, x, y)
+        piece = (snapshot or BoardSnapshot(board)).get_piece(x, y)
         
         # Перевіряємо всі можливі напрямки руху
         directions = []
@@ -273,7 +1151,7 @@ class CheckersAI:
         
         return moves
     
-    def get_possible_captures_from(self, board, x, y, player):
+    def get_possible_captures_from(self, board, x, y, player, snapshot=None):
         """
         Отримує всі можливі взяття для шашки на позиції (x, y)
         
@@ -282,12 +1160,13 @@ class CheckersAI:
             x (int): Координата X (1-8)
             y (int): Координата Y (1-8)
             player (str): Гравець ('white' або 'black')
+            snapshot (BoardSnapshot): Готовий знімок дошки, якщо вже є
         
         Returns:
             list: Список взять у вигляді (from_x, from_y, to_x, to_y)
         """
         captures = []
-        piece = self.interface.get_piece(board, x, y)
+        piece = (snapshot or BoardSnapshot(board)).get_piece(x, y)
         
         # Перевіряємо всі можливі напрямки взяття
         directions = []
@@ -333,32 +1212,33 @@ class CheckersAI:
         white_score = 0
         black_score = 0
         
+        # Знімок дошки читається без запитів до бекенду правил
+        snapshot = BoardSnapshot(board)
+        
         # Підраховуємо кількість шашок кожного кольору та їх розташування
-        for y in range(1, 9):
-            for x in range(1, 9):
-                piece = self.interface.get_piece(board, x, y)
-                if piece == "w":
-                    white_score += 100
-                    # Бонус за просування вперед
-                    white_score += (8 - y) * 5
-                    # Бонус за центральні позиції
-                    if 3 <= x <= 6 and 3 <= y <= 6:
-                        white_score += 10
-                elif piece == "wk":
-                    white_score += 300  # Королі коштують більше
-                elif piece == "b":
-                    black_score += 100
-                    # Бонус за просування вперед
-                    black_score += y * 5
-                    # Бонус за центральні позиції
-                    if 3 <= x <= 6 and 3 <= y <= 6:
-                        black_score += 10
-                elif piece == "bk":
-                    black_score += 300  # Королі коштують більше
+        for x, y, piece in snapshot.pieces():
+            if piece == "w":
+                white_score += 100
+                # Бонус за просування вперед
+                white_score += (8 - y) * 5
+                # Бонус за центральні позиції
+                if 3 <= x <= 6 and 3 <= y <= 6:
+                    white_score += 10
+            elif piece == "wk":
+                white_score += 300  # Королі коштують більше
+            elif piece == "b":
+                black_score += 100
+                # Бонус за просування вперед
+                black_score += y * 5
+                # Бонус за центральні позиції
+                if 3 <= x <= 6 and 3 <= y <= 6:
+                    black_score += 10
+            elif piece == "bk":
+                black_score += 300  # Королі коштують більше
         
         # Додатковий бонус за можливість взяття
-        white_captures = self.count_possible_captures(board, "white")
-        black_captures = self.count_possible_captures(board, "black")
+        white_captures = self.count_possible_captures(board, "white", snapshot)
+        black_captures = self.count_possible_captures(board, "black", snapshot)
         
         white_score += white_captures * 50
         black_score += black_captures * 50
@@ -366,31 +1246,96 @@ class CheckersAI:
         # Повертаємо різницю з точки зору AI (чорний гравець)
         return black_score - white_score
     
-    def count_possible_captures(self, board, player):
+    def count_possible_captures(self, board, player, snapshot=None):
         """
         Підраховує кількість можливих взять для гравця
         
         Args:
             board (list): Поточний стан дошки
             player (str): Гравець ('white' або 'black')
+            snapshot (BoardSnapshot): Готовий знімок дошки, якщо вже є
         
         Returns:
             int: Кількість можливих взять
         """
         captures = 0
+        snapshot = snapshot or BoardSnapshot(board)
         
-        for y in range(1, 9):
-            for x in range(1, 9):
-                piece = self.interface.get_piece(board, x, y)
-                is_player_piece = False
-                
-                if player == "white" and (piece == "w" or piece == "wk"):
-                    is_player_piece = True
-                elif player == "black" and (piece == "b" or piece == "bk"):
-                    is_player_piece = True
-                
-                if is_player_piece:
-                    captures_list = self.get_possible_captures_from(board, x, y, player)
-                    captures += len(captures_list)
-        
-        return captures
\ No newline at end of file
+        for x, y, _ in snapshot.pieces(player):
+            captures_list = self.get_possible_captures_from(board, x, y, player, snapshot)
+            captures += len(captures_list)
+        
+        return captures
+
+
+# Лічильники пошуку, які процеси-виконавці передають у корінь
+SEARCH_COUNTERS = ("search_nodes", "quiescence_nodes", "leaf_evaluations", "expanded_nodes", "beta_cutoffs",
+                   "pvs_researches", "lmr_reductions", "lmr_researches", "null_move_tries", "null_move_cutoffs",
+                   "null_move_failures")
+# Лічильники таблиці транспозицій і впорядкування процесів-виконавців, які
+# корінь додає до власних у SearchStats
+WORKER_TOTALS = ("tt_hits", "tt_probes", "ordering_cutoffs", "first_move_cutoffs")
+
+# AI процесу-виконавця паралельного пошуку (створюється в _init_worker)
+_worker_ai = None
+
+
+def _init_worker(backend, tt_size_mb, quiescence, algorithm, selective, profile, tablebase, cancel_event):
+    """
+    Ініціалізує процес-виконавець: власний бекенд правил через get_interface
+    і власний AI з таблицею транспозицій, що зберігається між завданнями, і
+    з власним відображенням баз ендшпілю з каталогу tablebase (дебютна книга
+    потрібна лише в корені, до пошуку). Встановлення cancel_event перериває
+    пошук у процесі.
+    """
+    global _worker_ai
+    _worker_ai = CheckersAI(backend=backend, tt_size_mb=tt_size_mb, quiescence=quiescence, algorithm=algorithm,
+                            selective=selective or False, profile=profile, tablebase=tablebase)
+    _worker_ai.cancel_event = cancel_event
+    # Ітерація, для якої процес востаннє готував впорядкування ходів
+    _worker_ai.worker_iteration = None
+
+
+def _search_root_move(board, move, depth, time_budget, iteration):
+    """
+    Шукає один хід кореня в процесі-виконавці
+    
+    Args:
+        board (list): Позиція кореня (хід чорних)
+        move (Move): Хід кореня
+        depth (int): Глибина пошуку, враховуючи хід кореня
+        time_budget (float): Залишок часу в секундах або None
+        iteration (tuple): Номер пошуку і глибина; впорядкування ходів
+            готується до нової ітерації один раз, з першим її завданням
+    
+    Returns:
+        tuple: Оцінка ходу (None, якщо час вичерпано або пошук скасовано) і
+            SearchStats цього завдання (лічильники, таблиця транспозицій,
+            впорядкування і, з profile, розподіл часу)
+    """
+    ai = _worker_ai
+    if iteration != ai.worker_iteration:
+        ai.orderer.new_search()
+        ai.worker_iteration = iteration
+    board_class = _ProfiledSearchBoard if ai.profile else SearchBoard
+    position = board_class.from_board(board, ai.player_color, ai.zobrist, PIECE_SQUARE_VALUES)
+    stats = SearchStats()
+    if ai.profile:
+        position.stats = stats
+        ai._timing = stats
+    position.make(move)
+    ai.last_stats = stats
+    ai._search_started = time.perf_counter()
+    ai._reset_counters()
+    if time_budget is not None:
+        ai._deadline = ai._search_started + time_budget
+    try:
+        score, _ = ai.minimax(position, depth - 1, float('-inf'), float('inf'), False, ply=1)
+    except SearchTimeout:
+        score = None
+    finally:
+        ai._deadline = None
+        ai._timing = None
+        ai._update_stats()
+        ai._search_started = None
+    return score, stats
@@ -0,0 +1,237 @@
+# Файл: checkers_async.py
+"""
+Пошук ходу AI у фоновому потоці.
+
+Графічний інтерфейс запускає пошук і далі малює кадри та обробляє події,
+перевіряючи в кожному кадрі, чи хід уже готовий. У потоці лише вибирається
+хід (CheckersAI.choose_move працює на бітбордах і не звертається до бекенду
+правил), а виконує його основний потік через CheckersAI.apply_move - запити
+до Prolog завжди йдуть з того самого потоку.
+
+Поки думає людина, Ponderer передбачає її хід і в тому самому потоці вибирає
+відповідь на нього так само, як choose_move (книга, бази ендшпілю, пошук),
+заповнюючи таблицю транспозицій.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from checkers_ai import MAX_SEARCH_DEPTH, PIECE_SQUARE_VALUES, SearchTimeout
+from checkers_bitboard import SearchBoard
+
+# Найбільший час обдумування під час ходу людини, с
+PONDER_MAX_TIME = 60.0
+
+
+class AsyncSearch:
+    """
+    Фоновий пошук ходу з можливістю скасування
+    """
+    def __init__(self, ai):
+        """
+        Створює потік для пошуку
+
+        Args:
+            ai (CheckersAI): AI, який вибирає ходи
+        """
+        self.ai = ai
+        # Один потік: новий пошук чекає, доки скасований попередній не
+        # звільнить AI (таблицю транспозицій, впорядкування ходів)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkers-ai")
+        self._future = None
+        self._cancel = None
+        self.started = None
+
+    def start(self, board, task=None):
+        """
+        Починає пошук ходу (попередній пошук скасовується)
+
+        Args:
+            board (list): Поточний стан дошки
+            task (callable): Що виконати в потоці замість ai.choose_move(board)
+        """
+        self.cancel()
+        self._cancel = threading.Event()
+        self.started = time.perf_counter()
+        self._future = self._executor.submit(self._search, task or self.ai.choose_move, board, self._cancel)
+
+    def _search(self, task, board, cancel):
+        if cancel.is_set():
+            return None
+        self.ai.cancel_event = cancel
+        try:
+            return task(board)
+        finally:
+            self.ai.cancel_event = None
+
+    @property
+    def running(self):
+        """
+        bool: True, якщо пошук запущено і результат ще не забрано
+        """
+        return self._future is not None
+
+    def elapsed(self):
+        """
+        Час від початку поточного пошуку
+
+        Returns:
+            float: Секунди або 0.0, якщо пошук не запущено
+        """
+        return time.perf_counter() - self.started if self.running else 0.0
+
+    def poll(self):
+        """
+        Перевіряє, чи завершився пошук, не чекаючи на нього
+
+        Returns:
+            tuple: (True, хід Move або None без допустимих ходів), якщо пошук
+                завершено (результат забирається), інакше (False, None)
+        """
+        if self._future is None or not self._future.done():
+            return False, None
+        future = self._future
+        self._future = None
+        return True, future.result()
+
+    def stop(self):
+        """
+        Перериває поточний пошук і чекає на його результат (пошук перевіряє
+        скасування кожні TIME_CHECK_INTERVAL вузлів, тож чекати недовго)
+
+        Returns:
+            Результат пошуку або None, якщо пошук не запущено
+        """
+        if self._future is None:
+            return None
+        self._cancel.set()
+        future = self._future
+        self._future = None
+        return future.result()
+
+    def cancel(self):
+        """
+        Скасовує поточний пошук; його результат буде відкинуто
+        """
+        if self._future is not None:
+            self._cancel.set()
+            self._future.cancel()
+            self._future = None
+
+    def shutdown(self):
+        """
+        Скасовує пошук і зупиняє потік
+        """
+        self.cancel()
+        self._executor.shutdown(wait=True)
+
+
+class Ponderer:
+    """
+    Обдумування під час ходу людини
+
+    Передбачений хід людини - найкращий за коротким пошуком. Поки людина
+    думає, AI шукає відповідь на нього (не довше за max_time). Якщо людина
+    зіграла передбачений хід, готова відповідь повертається одразу (коли на
+    неї витрачено не менше часу, ніж дав би звичайний пошук); інакше
+    звичайний пошук починається з уже заповненою таблицею транспозицій.
+    """
+    def __init__(self, search, predict_depth=2, max_time=PONDER_MAX_TIME):
+        """
+        Args:
+            search (AsyncSearch): Фоновий пошук, потік якого використовується
+            predict_depth (int): Глибина пошуку для передбачення ходу людини
+            max_time (float): Найбільший час обдумування в секундах
+        """
+        self.search = search
+        self.ai = search.ai
+        self.predict_depth = predict_depth
+        self.max_time = max_time
+        self.predicted_board = None
+        self.pondered_time = 0.0
+        # Звідки взято готову відповідь (CheckersAI.last_source)
+        self.pondered_source = None
+        self._active = False
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, board, player="white"):
+        """
+        Починає обдумування, поки ходить людина
+
+        Args:
+            board (list): Поточний стан дошки
+            player (str): Колір людини
+        """
+        self.predicted_board = None
+        self.pondered_time = 0.0
+        self.pondered_source = None
+        self._active = True
+        self.search.start(board, lambda board: self._ponder(board, player))
+
+    def _ponder(self, board, player):
+        ai = self.ai
+        position = SearchBoard.from_board(board, player, ai.zobrist, PIECE_SQUARE_VALUES)
+        try:
+            # Людина - суперник AI, тож її найкращий хід мінімізує оцінку
+            _, predicted = ai.minimax(position, self.predict_depth, float('-inf'), float('inf'),
+                                      player == ai.player_color)
+        except SearchTimeout:
+            return None
+        if predicted is None:
+            return None
+        position.make(predicted)
+        self.predicted_board = position.to_board()
+        started = time.perf_counter()
+        # Зазвичай обдумування перериває хід людини, але й без нього пошук
+        # не триває довше за max_time
+        move = ai.choose_move(self.predicted_board, time_budget=self.max_time, max_depth=MAX_SEARCH_DEPTH)
+        self.pondered_time = time.perf_counter() - started
+        self.pondered_source = ai.last_source
+        return move
+
+    def finish(self, board):
+        """
+        Зупиняє обдумування після ходу людини
+
+        Args:
+            board (list): Дошка після ходу людини
+
+        Returns:
+            Move: Готова відповідь AI або None, якщо потрібен звичайний пошук
+        """
+        if not self._active:
+            return None
+        self._active = False
+        move = self.search.stop()
+        # Обдумування без передбачення (не встигло або ходів немає) не рахується
+        if self.predicted_board is None:
+            return None
+        if board != self.predicted_board:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if move is None:
+            return None
+        # Хід з книги, баз ендшпілю чи випадковий (easy) готовий одразу, а
+        # пошук має тривати не менше, ніж звичайний
+        if self.pondered_source != "search" or self.pondered_time >= self.ai.time_map[self.ai.difficulty]:
+            return move
+        return None
+
+    def cancel(self):
+        """
+        Скасовує обдумування (наприклад, при новій грі)
+        """
+        if self._active:
+            self._active = False
+            self.search.cancel()
+
+    def hit_rate(self):
+        """
+        Частка ходів людини, які було передбачено
+
+        Returns:
+            float: Від 0.0 до 1.0
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
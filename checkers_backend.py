@@ -0,0 +1,105 @@
+# Файл: checkers_backend.py
+"""
+Вибір бекенду правил гри: Prolog (CheckersInterface) або бітборди (BitboardInterface).
+
+Бекенд обирається параметром backend або змінною середовища CHECKERS_BACKEND.
+get_interface() повертає спільний для всього процесу екземпляр, тому файл
+правил консультується лише один раз, при першому зверненні.
+"""
+import os
+import threading
+
+BACKEND_ENV_VAR = "CHECKERS_BACKEND"
+# CHECKERS_INSTRUMENT=1 вмикає статистику запитів у Prolog-бекенді
+INSTRUMENT_ENV_VAR = "CHECKERS_INSTRUMENT"
+DEFAULT_BACKEND = "prolog"
+BACKENDS = ("prolog", "bitboard")
+# Файл правил поруч з модулями гри (ім'я з великої літери важливе на
+# файлових системах, чутливих до регістру)
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Checkers.pl")
+
+# Спільні інтерфейси процесу: (клас інтерфейсу, файл правил) -> екземпляр
+_shared_interfaces = {}
+_shared_lock = threading.Lock()
+
+
+def resolve_backend(backend=None):
+    """
+    Визначає назву бекенду з параметра або змінної середовища
+
+    Args:
+        backend (str): Назва бекенду ('prolog' або 'bitboard') або None
+
+    Returns:
+        str: Назва бекенду
+    """
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV_VAR, DEFAULT_BACKEND)
+    backend = backend.strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Невідомий бекенд правил: {backend}. Доступні: {', '.join(BACKENDS)}")
+    return backend
+
+
+def create_interface(backend=None, prolog_file=RULES_FILE):
+    """
+    Створює інтерфейс правил гри для вибраного бекенду
+
+    Args:
+        backend (str): Назва бекенду ('prolog' або 'bitboard') або None
+        prolog_file (str): Файл з правилами для Prolog-бекенду
+
+    Returns:
+        CheckersInterface або BitboardInterface: Інтерфейс правил гри
+    """
+    backend = resolve_backend(backend)
+    interface_class = _interface_class(backend)
+    if backend == "bitboard":
+        return interface_class()
+    # Робочий шлях завантаження: скомпільовані правила без самотестів
+    instrument = os.environ.get(INSTRUMENT_ENV_VAR, "") not in ("", "0")
+    return interface_class(prolog_file, quiet=True, precompiled=True, instrument=instrument)
+
+
+def get_interface(backend=None, prolog_file=RULES_FILE):
+    """
+    Повертає спільний інтерфейс правил, створюючи його лише при першому зверненні
+
+    GUI, AI та зміна рівня складності використовують один і той самий
+    екземпляр, тому Prolog не ініціалізується повторно.
+
+    Args:
+        backend (str): Назва бекенду ('prolog' або 'bitboard') або None
+        prolog_file (str): Файл з правилами для Prolog-бекенду
+
+    Returns:
+        CheckersInterface або BitboardInterface: Спільний інтерфейс правил гри
+    """
+    backend = resolve_backend(backend)
+    key = (_interface_class(backend), prolog_file)
+    with _shared_lock:
+        interface = _shared_interfaces.get(key)
+        if interface is None:
+            interface = create_interface(backend, prolog_file)
+            _shared_interfaces[key] = interface
+    return interface
+
+
+def reset_interfaces():
+    """
+    Забуває всі спільні інтерфейси (наступний get_interface створить новий)
+    """
+    with _shared_lock:
+        _shared_interfaces.clear()
+
+
+def _interface_class(backend):
+    """
+    Імпортує клас інтерфейсу лише для вибраного бекенду
+    """
+    if backend == "bitboard":
+        from checkers_bitboard import BitboardInterface
+        return BitboardInterface
+
+    from checkers_interface import CheckersInterface
+    return CheckersInterface
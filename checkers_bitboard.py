@@ -0,0 +1,980 @@
+# Файл: checkers_bitboard.py
+"""
+Бекенд правил гри в шашки на бітбордах без Prolog.
+
+Дошка зберігається трьома числами: білі фігури, чорні фігури та дамки
+(обох кольорів). Біт з номером (Y - 1) * 8 + (X - 1) відповідає клітинці (X, Y).
+
+Правила повторюють Checkers.pl предикат за предикатом. Prolog-правила не
+обмежують гру темними клітинками (їхні власні тести ставлять фігури на (4,4)),
+тому бітборди охоплюють усі 64 клітинки, а не лише 32 темні.
+"""
+
+# Кількість клітинок дошки
+SQUARES = 64
+FULL_MASK = (1 << SQUARES) - 1
+
+# Напрямки руху по діагоналі: 0, 1 - вгору (хід білих), 2, 3 - вниз (хід чорних)
+DIRECTIONS = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+FORWARD_DIRECTIONS = {
+    "white": (0, 1),
+    "black": (2, 3),
+}
+
+# Ряди перетворення на дамку: білі - ряд 1, чорні - ряд 8
+PROMOTION_MASK = {
+    "white": 0xFF,
+    "black": 0xFF << 56,
+}
+
+# Клітинки, з яких взяття вліво (X - 2) або вправо (X + 2) не виходить за дошку
+JUMP_LEFT_MASK = sum(1 << (y * 8 + x) for y in range(8) for x in range(2, 8))
+JUMP_RIGHT_MASK = sum(1 << (y * 8 + x) for y in range(8) for x in range(6))
+
+
+def square_index(x, y):
+    """
+    Перетворює координати клітинки на номер біта
+
+    Args:
+        x (int): Координата X (1-8)
+        y (int): Координата Y (1-8)
+
+    Returns:
+        int: Номер клітинки (0-63) або -1 для клітинки поза дошкою
+    """
+    if not (1 <= x <= 8 and 1 <= y <= 8):
+        return -1
+    return (y - 1) * 8 + (x - 1)
+
+
+def _build_tables():
+    """
+    Будує таблиці координат, сусідніх клітинок, стрибків і променів
+    """
+    coords = tuple((sq % 8 + 1, sq // 8 + 1) for sq in range(SQUARES))
+
+    steps = []
+    jumps = []
+    rays = []
+    for dx, dy in DIRECTIONS:
+        step_row = []
+        jump_row = []
+        ray_row = []
+        for x, y in coords:
+            step_row.append(square_index(x + dx, y + dy))
+            jump_row.append(square_index(x + 2 * dx, y + 2 * dy))
+            ray = []
+            dist = 1
+            while square_index(x + dx * dist, y + dy * dist) >= 0:
+                ray.append(square_index(x + dx * dist, y + dy * dist))
+                dist += 1
+            ray_row.append(tuple(ray))
+        steps.append(tuple(step_row))
+        jumps.append(tuple(jump_row))
+        rays.append(tuple(ray_row))
+
+    return coords, tuple(steps), tuple(jumps), tuple(rays)
+
+
+# SQUARE_COORDS[sq] - координати (x, y) клітинки
+# STEP[d][sq] - сусідня клітинка в напрямку d або -1
+# JUMP[d][sq] - клітинка приземлення після взяття в напрямку d або -1
+# RAY[d][sq] - усі клітинки в напрямку d до краю дошки
+SQUARE_COORDS, STEP, JUMP, RAY = _build_tables()
+
+
+def board_to_bitboards(board):
+    """
+    Перетворює дошку у форматі Python на бітборди
+
+    Args:
+        board (list): Дошка у форматі Python (список списків)
+
+    Returns:
+        tuple: Бітборди (white, black, kings)
+    """
+    white = 0
+    black = 0
+    kings = 0
+    for sq in range(SQUARES):
+        x, y = SQUARE_COORDS[sq]
+        cell = board[y - 1][x - 1]
+        if cell == "empty":
+            continue
+        bit = 1 << sq
+        if cell == "w":
+            white |= bit
+        elif cell == "b":
+            black |= bit
+        elif cell == "wk":
+            white |= bit
+            kings |= bit
+        elif cell == "bk":
+            black |= bit
+            kings |= bit
+    return white, black, kings
+
+
+def bitboards_to_board(white, black, kings):
+    """
+    Перетворює бітборди на дошку у форматі Python
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+
+    Returns:
+        list: Дошка у форматі Python (список списків)
+    """
+    board = [["empty"] * 8 for _ in range(8)]
+    for sq in range(SQUARES):
+        piece = piece_at(white, black, kings, sq)
+        if piece != "empty":
+            x, y = SQUARE_COORDS[sq]
+            board[y - 1][x - 1] = piece
+    return board
+
+
+def piece_at(white, black, kings, sq):
+    """
+    Повертає фігуру на клітинці
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+        sq (int): Номер клітинки (0-63)
+
+    Returns:
+        str: Фігура ('empty', 'w', 'b', 'wk', 'bk')
+    """
+    bit = 1 << sq
+    if white & bit:
+        return "wk" if kings & bit else "w"
+    if black & bit:
+        return "bk" if kings & bit else "b"
+    return "empty"
+
+
+def _own_and_opponent(white, black, player):
+    """
+    Повертає бітборди фігур гравця та суперника
+    """
+    if player == "white":
+        return white, black
+    if player == "black":
+        return black, white
+    return 0, 0
+
+
+def valid_simple_move(white, black, kings, from_sq, to_sq, player):
+    """
+    Аналог valid_simple_move/6: хід на одну клітинку вперед по діагоналі
+
+    Returns:
+        bool: True, якщо хід допустимий
+    """
+    if from_sq < 0 or to_sq < 0:
+        return False
+    own, _ = _own_and_opponent(white, black, player)
+    if not own & (1 << from_sq) or (white | black) & (1 << to_sq):
+        return False
+    for d in FORWARD_DIRECTIONS[player]:
+        if STEP[d][from_sq] == to_sq:
+            return True
+    return False
+
+
+def valid_king_move(white, black, kings, from_sq, to_sq, player):
+    """
+    Аналог valid_king_move/6: хід дамки на будь-яку відстань по вільній діагоналі
+
+    Returns:
+        bool: True, якщо хід допустимий
+    """
+    if from_sq < 0 or to_sq < 0:
+        return False
+    own, _ = _own_and_opponent(white, black, player)
+    from_bit = 1 << from_sq
+    if not own & kings & from_bit:
+        return False
+    occupied = white | black
+    for d in range(4):
+        for sq in RAY[d][from_sq]:
+            if occupied & (1 << sq):
+                break
+            if sq == to_sq:
+                return True
+    return False
+
+
+def valid_capture(white, black, kings, from_sq, to_sq, player):
+    """
+    Аналог valid_capture/6: взяття через одну клітинку в будь-якому напрямку
+
+    Returns:
+        bool: True, якщо взяття допустиме
+    """
+    if from_sq < 0 or to_sq < 0:
+        return False
+    own, opponent = _own_and_opponent(white, black, player)
+    if not own & (1 << from_sq) or (white | black) & (1 << to_sq):
+        return False
+    for d in range(4):
+        if JUMP[d][from_sq] == to_sq:
+            return bool(opponent & (1 << STEP[d][from_sq]))
+    return False
+
+
+def classify_move(white, black, kings, from_sq, to_sq, player):
+    """
+    Аналог apply_move/7 з Checkers.pl: спочатку взяття, потім хід дамкою
+    або простий хід
+
+    Returns:
+        int: Клітинка взятої фігури, -1 для ходу без взяття
+             або None, якщо хід неможливий
+    """
+    if valid_capture(white, black, kings, from_sq, to_sq, player):
+        return (from_sq + to_sq) // 2
+    if from_sq >= 0 and kings & (1 << from_sq):
+        if valid_king_move(white, black, kings, from_sq, to_sq, player):
+            return -1
+        return None
+    if valid_simple_move(white, black, kings, from_sq, to_sq, player):
+        return -1
+    return None
+
+
+def generate_captures(white, black, kings, player):
+    """
+    Генерує всі одиночні взяття гравця (аналог capture_move/6)
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+        player (str): Гравець ('white' або 'black')
+
+    Returns:
+        list: Ходи у вигляді (from_sq, to_sq, captured_sq)
+    """
+    own, opponent = _own_and_opponent(white, black, player)
+    empty = ~(white | black) & FULL_MASK
+    moves = []
+    pieces = own
+    while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        sq = bit.bit_length() - 1
+        for d in range(4):
+            to_sq = JUMP[d][sq]
+            if to_sq >= 0 and empty >> to_sq & 1 and opponent >> STEP[d][sq] & 1:
+                moves.append((sq, to_sq, STEP[d][sq]))
+    return moves
+
+
+def count_captures(white, black, player):
+    """
+    Підраховує одиночні взяття гравця зсувами бітбордів, без генерації ходів
+
+    Кожна пара (фігура, напрямок) має власну клітинку приземлення, тому
+    кількість взять дорівнює кількості біт у клітинках приземлення.
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        player (str): Гравець ('white' або 'black')
+
+    Returns:
+        int: Кількість взять (те саме, що len(generate_captures(...)))
+    """
+    own, opponent = _own_and_opponent(white, black, player)
+    empty = ~(white | black) & FULL_MASK
+    left = own & JUMP_LEFT_MASK
+    right = own & JUMP_RIGHT_MASK
+    # Зсув на 9 - діагональ (X+1, Y+1), на 7 - діагональ (X-1, Y+1)
+    return (
+        bin(((left >> 9) & opponent) >> 9 & empty).count("1")
+        + bin(((right >> 7) & opponent) >> 7 & empty).count("1")
+        + bin(((left << 7) & opponent) << 7 & empty).count("1")
+        + bin(((right << 9) & opponent) << 9 & empty).count("1")
+    )
+
+
+def generate_quiet_moves(white, black, kings, player):
+    """
+    Генерує всі ходи без взяття (аналог quiet_move/6)
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+        player (str): Гравець ('white' або 'black')
+
+    Returns:
+        list: Ходи у вигляді (from_sq, to_sq, -1)
+    """
+    own, _ = _own_and_opponent(white, black, player)
+    occupied = white | black
+    forward = FORWARD_DIRECTIONS.get(player, ())
+    moves = []
+    pieces = own
+    while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        sq = bit.bit_length() - 1
+        if kings & bit:
+            for d in range(4):
+                for to_sq in RAY[d][sq]:
+                    if occupied >> to_sq & 1:
+                        break
+                    moves.append((sq, to_sq, -1))
+        else:
+            for d in forward:
+                to_sq = STEP[d][sq]
+                if to_sq >= 0 and not occupied >> to_sq & 1:
+                    moves.append((sq, to_sq, -1))
+    return moves
+
+
+def generate_moves(white, black, kings, player):
+    """
+    Генерує всі допустимі ходи гравця з обов'язковим взяттям (аналог legal_moves/3)
+
+    Returns:
+        list: Ходи у вигляді (from_sq, to_sq, captured_sq)
+    """
+    captures = generate_captures(white, black, kings, player)
+    if captures:
+        return captures
+    return generate_quiet_moves(white, black, kings, player)
+
+
+def moves_to_coords(moves):
+    """
+    Перетворює ходи з номерами клітинок на ходи з координатами
+
+    Args:
+        moves (list): Ходи у вигляді (from_sq, to_sq, captured_sq)
+
+    Returns:
+        list: Ходи у вигляді (from_x, from_y, to_x, to_y)
+    """
+    return [SQUARE_COORDS[from_sq] + SQUARE_COORDS[to_sq] for from_sq, to_sq, _ in moves]
+
+
+def apply_move(white, black, kings, from_sq, to_sq, captured_sq, player):
+    """
+    Переставляє фігуру, знімає взяту фігуру та перетворює шашку на дамку
+
+    Перевірку допустимості ходу має виконати викликач.
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+        from_sq (int): Початкова клітинка
+        to_sq (int): Кінцева клітинка
+        captured_sq (int): Клітинка взятої фігури або -1
+        player (str): Гравець ('white' або 'black')
+
+    Returns:
+        tuple: Нові бітборди (white, black, kings)
+    """
+    from_bit = 1 << from_sq
+    to_bit = 1 << to_sq
+    is_king = kings & from_bit
+    if captured_sq >= 0:
+        captured_mask = ~(1 << captured_sq)
+        white &= captured_mask
+        black &= captured_mask
+        kings &= captured_mask
+    if player == "white":
+        white = (white & ~from_bit) | to_bit
+    else:
+        black = (black & ~from_bit) | to_bit
+    kings &= ~from_bit
+    if is_king or to_bit & PROMOTION_MASK[player]:
+        kings |= to_bit
+    return white, black, kings
+
+
+def generate_capture_sequences(white, black, kings, player, from_sq=None):
+    """
+    Генерує повні серії взять: фігура бере, доки з кінцевої клітинки є взяття
+
+    Args:
+        white (int): Бітборд білих фігур
+        black (int): Бітборд чорних фігур
+        kings (int): Бітборд дамок
+        player (str): Гравець ('white' або 'black')
+        from_sq (int): Лише серії фігури з цієї клітинки або None для всіх фігур
+
+    Returns:
+        list: Ходи Move з повним шляхом і взятими клітинками
+    """
+    own, opponent = _own_and_opponent(white, black, player)
+    occupied = white | black
+    pieces = own if from_sq is None else own & (1 << from_sq)
+    sequences = []
+    while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        sq = bit.bit_length() - 1
+        # Клітинка, з якої фігура почала серію, звільняється
+        _extend_captures((sq,), (), sq, opponent, occupied & ~bit, sequences)
+    return sequences
+
+
+def _extend_captures(path, captured, sq, opponent, occupied, sequences):
+    """
+    Дописує в sequences усі продовження серії взять з клітинки sq
+    (взяті фігури знімаються з дошки одразу, як в apply_move/7)
+    """
+    extended = False
+    for d in range(4):
+        to_sq = JUMP[d][sq]
+        if to_sq < 0:
+            continue
+        over = STEP[d][sq]
+        if opponent >> over & 1 and not occupied >> to_sq & 1:
+            extended = True
+            over_mask = ~(1 << over)
+            _extend_captures(path + (to_sq,), captured + (over,), to_sq,
+                             opponent & over_mask, occupied & over_mask, sequences)
+    if not extended and captured:
+        sequences.append(Move(path, captured))
+
+
+def generate_search_moves(white, black, kings, player):
+    """
+    Генерує ходи для пошуку: повні серії взять (обов'язкові) або тихі ходи
+
+    Returns:
+        list: Ходи Move
+    """
+    sequences = generate_capture_sequences(white, black, kings, player)
+    if sequences:
+        return sequences
+    return [Move((from_sq, to_sq)) for from_sq, to_sq, _ in generate_quiet_moves(white, black, kings, player)]
+
+
+class Move(tuple):
+    """
+    Хід пошуку: шлях фігури (from, проміжні клітинки, to) і взяті клітинки
+
+    Серія взять - один хід, тож пошук витрачає на неї один півхід.
+    Незмінний і хешований, як кортеж (path, captured).
+    """
+    __slots__ = ()
+
+    def __new__(cls, path, captured=()):
+        """
+        Створює хід
+
+        Args:
+            path (tuple): Клітинки, які проходить фігура, від початкової до кінцевої
+            captured (tuple): Клітинки взятих фігур у порядку взяття
+        """
+        return super().__new__(cls, (tuple(path), tuple(captured)))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return f"Move(path={self[0]}, captured={self[1]})"
+
+    @property
+    def path(self):
+        return self[0]
+
+    @property
+    def captured(self):
+        return self[1]
+
+    @property
+    def from_sq(self):
+        return self[0][0]
+
+    @property
+    def to_sq(self):
+        return self[0][-1]
+
+    def coords(self):
+        """
+        Повертає шлях у координатах
+
+        Returns:
+            list: Клітинки (x, y) від початкової до кінцевої
+        """
+        return [SQUARE_COORDS[sq] for sq in self[0]]
+
+    def hops(self):
+        """
+        Розбиває хід на окремі стрибки для make_move бекенду правил
+
+        Returns:
+            list: Стрибки (from_x, from_y, to_x, to_y)
+        """
+        path = self[0]
+        return [SQUARE_COORDS[path[i]] + SQUARE_COORDS[path[i + 1]] for i in range(len(path) - 1)]
+
+
+class SearchBoard:
+    """
+    Змінна дошка для пошуку: ходи виконуються і скасовуються на місці
+
+    Замість нової дошки на кожен вузол дерева make() змінює бітборди і
+    кладе в стек короткий запис для скасування (чи була фігура дамкою,
+    взяті фігури і дамки серед них, попередній хеш), а unmake() відновлює
+    позицію з цього запису. Ходи - об'єкти Move, серія взять виконується
+    одним make().
+
+    Якщо задано таблицю оцінок фігур за клітинками, score - сума оцінок
+    усіх фігур - оновлюється тими ж make() і unmake().
+    """
+    __slots__ = ("white", "black", "kings", "player", "key", "zobrist", "values", "score", "_undo")
+
+    def __init__(self, white, black, kings, player, zobrist=None, values=None):
+        """
+        Створює дошку для пошуку з бітбордів
+
+        Args:
+            white (int): Бітборд білих фігур
+            black (int): Бітборд чорних фігур
+            kings (int): Бітборд дамок
+            player (str): Гравець, який ходить ('white' або 'black')
+            zobrist (ZobristKeys): Ключі для хешу позиції або None без хешу
+            values (dict): Фігура -> оцінки для клітинок 0-63 або None без оцінки
+        """
+        self.white = white
+        self.black = black
+        self.kings = kings
+        self.player = player
+        self.zobrist = zobrist
+        self.key = zobrist.hash_bitboards(white, black, kings, player) if zobrist else 0
+        self.values = values
+        self.score = self.static_score(values) if values else 0
+        self._undo = []
+
+    @classmethod
+    def from_board(cls, board, player, zobrist=None, values=None):
+        """
+        Створює дошку для пошуку з дошки у форматі Python
+
+        Args:
+            board (list): Дошка у форматі Python (список списків)
+            player (str): Гравець, який ходить ('white' або 'black')
+            zobrist (ZobristKeys): Ключі для хешу позиції або None
+            values (dict): Фігура -> оцінки для клітинок 0-63 або None
+
+        Returns:
+            SearchBoard: Дошка для пошуку
+        """
+        return cls(*board_to_bitboards(board), player, zobrist, values)
+
+    def static_score(self, values):
+        """
+        Обчислює суму оцінок фігур з нуля (перебором фігур)
+
+        Args:
+            values (dict): Фігура -> оцінки для клітинок 0-63
+
+        Returns:
+            int: Сума оцінок усіх фігур
+        """
+        score = 0
+        for pieces, man, king in ((self.white, "w", "wk"), (self.black, "b", "bk")):
+            while pieces:
+                bit = pieces & -pieces
+                pieces ^= bit
+                sq = bit.bit_length() - 1
+                score += values[king if self.kings & bit else man][sq]
+        return score
+
+    def to_board(self):
+        """
+        Повертає поточну позицію у форматі Python
+
+        Returns:
+            list: Дошка у форматі Python
+        """
+        return bitboards_to_board(self.white, self.black, self.kings)
+
+    def moves(self, player=None):
+        """
+        Генерує допустимі ходи: повні серії взять (обов'язкові) або тихі ходи
+
+        Args:
+            player (str): Гравець; за замовчуванням той, хто ходить
+
+        Returns:
+            list: Ходи Move
+        """
+        return generate_search_moves(self.white, self.black, self.kings, player or self.player)
+
+    def captures(self):
+        """
+        Генерує повні серії взять гравця, який ходить
+
+        Returns:
+            list: Ходи Move
+        """
+        return generate_capture_sequences(self.white, self.black, self.kings, self.player)
+
+    def make(self, move):
+        """
+        Виконує хід (включно з усією серією взять) на місці; після нього
+        ходить суперник
+
+        Args:
+            move (Move): Хід
+        """
+        path, captured = move
+        from_sq = path[0]
+        to_sq = path[-1]
+        player = self.player
+        from_bit = 1 << from_sq
+        to_bit = 1 << to_sq
+        old_key = self.key
+        old_score = self.score
+        was_king = self.kings & from_bit
+        captured_mask = 0
+        for sq in captured:
+            captured_mask |= 1 << sq
+        captured_kings = self.kings & captured_mask
+
+        # Початкова і кінцева клітинки серії можуть збігатися
+        if player == "white":
+            self.white = (self.white & ~from_bit) | to_bit
+            self.black &= ~captured_mask
+            own_man, own_king, enemy_man, enemy_king = "w", "wk", "b", "bk"
+        else:
+            self.black = (self.black & ~from_bit) | to_bit
+            self.white &= ~captured_mask
+            own_man, own_king, enemy_man, enemy_king = "b", "bk", "w", "wk"
+
+        promoted = False
+        if was_king:
+            self.kings = (self.kings & ~from_bit & ~captured_mask) | to_bit
+        else:
+            self.kings &= ~captured_mask
+            # Шашка стає дамкою, якщо будь-який стрибок закінчився в ряду перетворення
+            promotion = PROMOTION_MASK[player]
+            for sq in path[1:]:
+                if promotion >> sq & 1:
+                    promoted = True
+                    self.kings |= to_bit
+                    break
+
+        self.player = "black" if player == "white" else "white"
+
+        moved = own_king if was_king else own_man
+        arrived = own_king if was_king or promoted else own_man
+
+        zobrist = self.zobrist
+        if zobrist is not None:
+            pieces = zobrist.pieces
+            key = old_key ^ pieces[moved][from_sq] ^ pieces[arrived][to_sq] ^ zobrist.black_to_move
+            for sq in captured:
+                key ^= pieces[enemy_king if captured_kings >> sq & 1 else enemy_man][sq]
+            self.key = key
+
+        values = self.values
+        if values is not None:
+            score = old_score - values[moved][from_sq] + values[arrived][to_sq]
+            for sq in captured:
+                score -= values[enemy_king if captured_kings >> sq & 1 else enemy_man][sq]
+            self.score = score
+
+        self._undo.append((from_bit, to_bit, player, was_king, captured_mask, captured_kings, old_key, old_score))
+
+    def unmake(self):
+        """
+        Скасовує останній виконаний make()
+        """
+        from_bit, to_bit, player, was_king, captured_mask, captured_kings, old_key, old_score = self._undo.pop()
+
+        if player == "white":
+            self.white = (self.white & ~to_bit) | from_bit
+            self.black |= captured_mask
+        else:
+            self.black = (self.black & ~to_bit) | from_bit
+            self.white |= captured_mask
+
+        self.kings = (self.kings & ~to_bit) | (from_bit if was_king else 0) | captured_kings
+
+        self.player = player
+        self.key = old_key
+        self.score = old_score
+
+    def make_null(self):
+        """
+        Передає хід суперникові без ходу (нульовий хід для відсікання в
+        пошуку; за правилами пропустити хід не можна)
+        """
+        self.player = "black" if self.player == "white" else "white"
+        if self.zobrist is not None:
+            self.key ^= self.zobrist.black_to_move
+
+    def unmake_null(self):
+        """
+        Скасовує make_null()
+        """
+        self.make_null()
+
+
+class BitboardInterface:
+    """
+    Бекенд правил на бітбордах з тими ж публічними методами, що й CheckersInterface
+    """
+    def __init__(self):
+        # Збережені дошки: дескриптор -> (white, black, kings)
+        self._handles = {}
+        self._next_handle = 1
+        print("Bitboard backend initialized successfully")
+
+    def get_initial_board(self):
+        """
+        Повертає початкову позицію дошки
+
+        Returns:
+            list: Початкова дошка у форматі Python
+        """
+        board = [["empty"] * 8 for _ in range(8)]
+        for y in range(1, 9):
+            for x in range(1, 9):
+                if (x + y) % 2 == 1:
+                    if y <= 3:
+                        board[y - 1][x - 1] = "b"
+                    elif y >= 6:
+                        board[y - 1][x - 1] = "w"
+        return board
+
+    def get_empty_board(self):
+        """
+        Повертає порожню дошку
+
+        Returns:
+            list: Порожня дошка у форматі Python
+        """
+        return [["empty"] * 8 for _ in range(8)]
+
+    def get_piece(self, board, x, y):
+        """
+        Отримує фігуру на вказаній позиції
+
+        Args:
+            board (list): Поточна дошка
+            x (int): Координата X (1-8)
+            y (int): Координата Y (1-8)
+
+        Returns:
+            str: Фігура на вказаній позиції ('empty', 'w', 'b', 'wk', 'bk')
+        """
+        if not (1 <= x <= 8 and 1 <= y <= 8):
+            raise Exception(f"Не вдалося отримати фігуру на позиції ({x}, {y})")
+        return board[y - 1][x - 1]
+
+    def is_valid_move(self, board, from_x, from_y, to_x, to_y, player):
+        """
+        Перевіряє, чи є простий хід допустимим (аналог valid_simple_move/6)
+
+        Returns:
+            bool: True, якщо хід допустимий, інакше False
+        """
+        white, black, kings = board_to_bitboards(board)
+        return valid_simple_move(white, black, kings, square_index(from_x, from_y),
+                                 square_index(to_x, to_y), player)
+
+    def is_valid_king_move(self, board, from_x, from_y, to_x, to_y, player):
+        """
+        Перевіряє, чи є хід дамкою допустимим (аналог valid_king_move/6)
+
+        Returns:
+            bool: True, якщо хід допустимий, інакше False
+        """
+        white, black, kings = board_to_bitboards(board)
+        return valid_king_move(white, black, kings, square_index(from_x, from_y),
+                               square_index(to_x, to_y), player)
+
+    def is_valid_capture(self, board, from_x, from_y, to_x, to_y, player):
+        """
+        Перевіряє, чи є взяття допустимим (аналог valid_capture/6)
+
+        Returns:
+            bool: True, якщо взяття допустиме, інакше False
+        """
+        white, black, kings = board_to_bitboards(board)
+        return valid_capture(white, black, kings, square_index(from_x, from_y),
+                             square_index(to_x, to_y), player)
+
+    def make_move(self, board, from_x, from_y, to_x, to_y, player):
+        """
+        Виконує хід у тому ж порядку, що й CheckersInterface.make_move:
+        спочатку взяття, потім хід дамкою або простий хід
+
+        Args:
+            board (list): Поточна дошка
+            from_x (int): Початкова координата X (1-8)
+            from_y (int): Початкова координата Y (1-8)
+            to_x (int): Кінцева координата X (1-8)
+            to_y (int): Кінцева координата Y (1-8)
+            player (str): Гравець ('white' або 'black')
+
+        Returns:
+            list: Нова дошка після ходу або None, якщо хід неможливий
+        """
+        # Як і get_piece у Prolog-бекенді, кидає виняток для клітинки поза дошкою
+        self.get_piece(board, from_x, from_y)
+        white, black, kings = board_to_bitboards(board)
+        from_sq = square_index(from_x, from_y)
+        to_sq = square_index(to_x, to_y)
+
+        captured_sq = classify_move(white, black, kings, from_sq, to_sq, player)
+        if captured_sq is None:
+            return None
+
+        white, black, kings = apply_move(white, black, kings, from_sq, to_sq, captured_sq, player)
+
+        return bitboards_to_board(white, black, kings)
+
+    def legal_moves(self, board, player):
+        """
+        Отримує всі допустимі ходи гравця (див. CheckersInterface.legal_moves)
+
+        Args:
+            board (list): Поточна дошка
+            player (str): Гравець ('white' або 'black')
+
+        Returns:
+            list: Список ходів у вигляді (from_x, from_y, to_x, to_y)
+        """
+        return moves_to_coords(generate_moves(*board_to_bitboards(board), player))
+
+    def capture_sequences(self, board, x, y, player):
+        """
+        Отримує повні серії взять фігури (див. CheckersInterface.capture_sequences)
+
+        Args:
+            board (list): Поточна дошка
+            x (int): Координата X фігури (1-8)
+            y (int): Координата Y фігури (1-8)
+            player (str): Гравець ('white' або 'black')
+
+        Returns:
+            list: Шляхи - списки клітинок (x, y) від фігури до кінця серії
+        """
+        sq = square_index(x, y)
+        if sq < 0:
+            return []
+        return [move.coords() for move in generate_capture_sequences(*board_to_bitboards(board), player, sq)]
+
+    def new_board_handle(self, board):
+        """
+        Зберігає дошку і повертає її дескриптор (див. CheckersInterface.new_board_handle)
+
+        Args:
+            board (list): Дошка у форматі Python
+
+        Returns:
+            int: Дескриптор збереженої дошки
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._handles[handle] = board_to_bitboards(board)
+        return handle
+
+    def copy_board_handle(self, handle):
+        """
+        Створює копію збереженої дошки
+
+        Args:
+            handle (int): Дескриптор дошки
+
+        Returns:
+            int: Дескриптор копії
+        """
+        new_handle = self._next_handle
+        self._next_handle += 1
+        self._handles[new_handle] = self._handle_state(handle)
+        return new_handle
+
+    def release_board_handle(self, handle):
+        """
+        Видаляє збережену дошку
+
+        Args:
+            handle (int): Дескриптор дошки
+        """
+        self._handles.pop(handle, None)
+
+    def get_handle_board(self, handle):
+        """
+        Отримує збережену дошку у форматі Python
+
+        Args:
+            handle (int): Дескриптор дошки
+
+        Returns:
+            list: Дошка у форматі Python
+        """
+        return bitboards_to_board(*self._handle_state(handle))
+
+    def handle_legal_moves(self, handle, player):
+        """
+        Отримує всі допустимі ходи гравця на збереженій дошці (див. legal_moves)
+        """
+        return moves_to_coords(generate_moves(*self._handle_state(handle), player))
+
+    def handle_make_move(self, handle, from_x, from_y, to_x, to_y, player):
+        """
+        Виконує хід на збереженій дошці, змінюючи її на місці
+
+        Returns:
+            bool: True, якщо хід виконано, False, якщо хід неможливий
+        """
+        white, black, kings = self._handle_state(handle)
+        from_sq = square_index(from_x, from_y)
+        to_sq = square_index(to_x, to_y)
+
+        captured_sq = classify_move(white, black, kings, from_sq, to_sq, player)
+        if captured_sq is None:
+            return False
+
+        self._handles[handle] = apply_move(white, black, kings, from_sq, to_sq, captured_sq, player)
+        return True
+
+    def _handle_state(self, handle):
+        """
+        Повертає бітборди збереженої дошки
+        """
+        try:
+            return self._handles[handle]
+        except KeyError:
+            raise Exception(f"Невідомий дескриптор дошки: {handle}")
+
+    def print_board(self, board):
+        """
+        Виводить дошку в консоль
+
+        Args:
+            board (list): Дошка для виведення
+        """
+        symbols = {"empty": ".", "w": "w", "b": "b", "wk": "W", "bk": "B"}
+        print("  1 2 3 4 5 6 7 8")
+        for i, row in enumerate(board):
+            print(f"{i+1} " + "".join(f"{symbols[cell]} " for cell in row if cell in symbols))
+
+    def ai_make_move(self, board, difficulty):
+        """Виконує хід через CheckersAI на цьому ж бекенді"""
+        from checkers_ai import CheckersAI
+
+        ai = CheckersAI(difficulty, interface=self)
+        new_board, move = ai.make_move(board)
+        if new_board is None:
+            return None, None
+        return new_board, ai.last_path
@@ -0,0 +1,209 @@
+# Файл: checkers_board.py
+"""
+Незмінні представлення дошки для читання без запитів до бекенду правил.
+
+BoardSnapshot - розкодована дошка для швидкого читання клітинок (рендеринг),
+Board - компактна хешована дошка з трьох бітбордів для кешів, дерев пошуку
+та журналів партій.
+"""
+import struct
+from checkers_bitboard import board_to_bitboards, bitboards_to_board, piece_at, square_index
+
+PLAYER_PIECES = {
+    "white": ("w", "wk"),
+    "black": ("b", "bk"),
+}
+
+
+class BoardSnapshot(tuple):
+    """
+    Незмінний знімок дошки: 64 клітинки підряд, рядок за рядком
+
+    Доступ до будь-якої клітинки виконується за O(1) без запитів до Prolog.
+    """
+    __slots__ = ()
+
+    def __new__(cls, board):
+        """
+        Створює знімок з дошки у форматі Python
+
+        Args:
+            board (list): Дошка у форматі Python (список списків)
+        """
+        return super().__new__(cls, (cell for row in board for cell in row))
+
+    def get_piece(self, x, y):
+        """
+        Отримує фігуру на вказаній позиції
+
+        Args:
+            x (int): Координата X (1-8)
+            y (int): Координата Y (1-8)
+
+        Returns:
+            str: Фігура на вказаній позиції ('empty', 'w', 'b', 'wk', 'bk')
+        """
+        if not (1 <= x <= 8 and 1 <= y <= 8):
+            raise Exception(f"Не вдалося отримати фігуру на позиції ({x}, {y})")
+        return self[(y - 1) * 8 + x - 1]
+
+    def pieces(self, player=None):
+        """
+        Перебирає фігури на дошці рядок за рядком
+
+        Args:
+            player (str): Гравець ('white' або 'black') або None для всіх фігур
+
+        Yields:
+            tuple: (x, y, piece) для кожної непорожньої клітинки
+        """
+        wanted = PLAYER_PIECES[player] if player else None
+        for index, piece in enumerate(self):
+            if piece == "empty" or (wanted and piece not in wanted):
+                continue
+            yield index % 8 + 1, index // 8 + 1, piece
+
+    def to_list(self):
+        """
+        Повертає дошку у форматі Python (новий список списків)
+
+        Returns:
+            list: Дошка у форматі Python
+        """
+        return [list(self[row * 8:row * 8 + 8]) for row in range(8)]
+
+
+class Board:
+    """
+    Компактна незмінна дошка: три 64-бітні бітборди (білі, чорні, дамки)
+
+    Займає кілька десятків байтів замість списку списків рядків, порівнюється
+    і хешується за O(1), тому придатна як ключ словника.
+    """
+    __slots__ = ("white", "black", "kings", "_hash")
+
+    # Формат бінарного кодування: три 64-бітні числа, 24 байти
+    _STRUCT = struct.Struct("<QQQ")
+    BYTES_SIZE = _STRUCT.size
+
+    def __init__(self, white=0, black=0, kings=0):
+        """
+        Створює дошку з бітбордів
+
+        Args:
+            white (int): Бітборд білих фігур
+            black (int): Бітборд чорних фігур
+            kings (int): Бітборд дамок
+        """
+        object.__setattr__(self, "white", white)
+        object.__setattr__(self, "black", black)
+        object.__setattr__(self, "kings", kings)
+        object.__setattr__(self, "_hash", hash((white, black, kings)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Board є незмінним")
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.white == other.white and self.black == other.black and self.kings == other.kings
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"Board(white={self.white:#x}, black={self.black:#x}, kings={self.kings:#x})"
+
+    def __reduce__(self):
+        return Board, (self.white, self.black, self.kings)
+
+    @classmethod
+    def from_list(cls, board):
+        """
+        Створює дошку з формату Python (список списків)
+
+        Args:
+            board (list): Дошка у форматі Python
+
+        Returns:
+            Board: Компактна дошка
+        """
+        return cls(*board_to_bitboards(board))
+
+    def to_list(self):
+        """
+        Повертає дошку у форматі Python (новий список списків)
+
+        Returns:
+            list: Дошка у форматі Python
+        """
+        return bitboards_to_board(self.white, self.black, self.kings)
+
+    @classmethod
+    def from_prolog(cls, prolog_board):
+        """
+        Створює дошку з Prolog-терміну, отриманого через pyswip
+
+        Args:
+            prolog_board: Дошка у форматі Prolog (список списків атомів)
+
+        Returns:
+            Board: Компактна дошка
+        """
+        return cls.from_list([[str(cell) for cell in row] for row in prolog_board])
+
+    def to_prolog(self):
+        """
+        Повертає Prolog-термін дошки для підстановки в запит
+
+        Returns:
+            str: Prolog-термін для представлення дошки
+        """
+        return "[" + ",".join("[" + ",".join(row) + "]" for row in self.to_list()) + "]"
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Розкодовує дошку з 24 байтів
+
+        Args:
+            data (bytes): Результат to_bytes()
+
+        Returns:
+            Board: Компактна дошка
+        """
+        return cls(*cls._STRUCT.unpack(data))
+
+    def to_bytes(self):
+        """
+        Кодує дошку у 24 байти
+
+        Returns:
+            bytes: Бінарне представлення дошки
+        """
+        return self._STRUCT.pack(self.white, self.black, self.kings)
+
+    def get_piece(self, x, y):
+        """
+        Отримує фігуру на вказаній позиції за O(1)
+
+        Args:
+            x (int): Координата X (1-8)
+            y (int): Координата Y (1-8)
+
+        Returns:
+            str: Фігура на вказаній позиції ('empty', 'w', 'b', 'wk', 'bk')
+        """
+        sq = square_index(x, y)
+        if sq < 0:
+            raise Exception(f"Не вдалося отримати фігуру на позиції ({x}, {y})")
+        return piece_at(self.white, self.black, self.kings, sq)
+
+    def snapshot(self):
+        """
+        Розкодовує дошку у знімок для швидкого читання клітинок
+
+        Returns:
+            BoardSnapshot: Знімок дошки
+        """
+        return BoardSnapshot(self.to_list())
@@ -0,0 +1,220 @@
+# Файл: checkers_book.py
+"""
+Дебютна книга для AI.
+
+Книга - відсортований бінарний файл записів (хеш позиції, хід, вага).
+Хеш - ключ Зобріста позиції разом з чергою ходу (ZobristKeys із зерном
+за замовчуванням, як у пошуку CheckersAI). Файл відкривається через mmap і
+шукається бінарним пошуком, тож у пам'ять не читається.
+
+Книга будується самогрою з початкової позиції: у кожній новій позиції всі
+ходи оцінюються глибоким пошуком, у книгу потрапляють ходи, не гірші за
+найкращий більше ніж на margin, з вагою тим більшою, чим ближчий хід до
+найкращого. Далі партія продовжується випадковим ходом з цих ваг.
+
+Приклад:
+    python checkers_book.py --output opening_book.bin --games 200 --plies 8 --depth 6
+"""
+import argparse
+import mmap
+import random
+import struct
+from checkers_bitboard import BitboardInterface, SearchBoard
+from checkers_tt import ZobristKeys
+
+# Заголовок файлу книги
+BOOK_MAGIC = b"CKBOOK\x00\x01"
+# Запис: хеш позиції, початкова і кінцева клітинки ходу, вага
+RECORD = struct.Struct("<QBBH")
+KEY = struct.Struct("<Q")
+# Найбільша вага, яку вміщує запис
+MAX_WEIGHT = 0xFFFF
+
+
+class OpeningBook:
+    """
+    Дебютна книга, відкрита з файлу через mmap
+    """
+    def __init__(self, path):
+        """
+        Відкриває файл книги
+
+        Args:
+            path (str): Шлях до файлу книги
+        """
+        self.path = path
+        with open(path, "rb") as book_file:
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(BOOK_MAGIC)] != BOOK_MAGIC:
+            self._map.close()
+            raise Exception(f"Файл {path} не є дебютною книгою")
+        self.size = (len(self._map) - len(BOOK_MAGIC)) // RECORD.size
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """
+        Закриває відображення файлу
+        """
+        self._map.close()
+
+    def __len__(self):
+        return self.size
+
+    def _key_at(self, index):
+        return KEY.unpack_from(self._map, len(BOOK_MAGIC) + index * RECORD.size)[0]
+
+    def probe(self, key):
+        """
+        Шукає ходи позиції бінарним пошуком
+
+        Args:
+            key (int): Хеш позиції
+
+        Returns:
+            list: Пари ((from_sq, to_sq), вага); порожній список, якщо позиції немає
+        """
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        entries = []
+        index = low
+        while index < self.size and self._key_at(index) == key:
+            _, from_sq, to_sq, weight = RECORD.unpack_from(self._map, len(BOOK_MAGIC) + index * RECORD.size)
+            entries.append(((from_sq, to_sq), weight))
+            index += 1
+        if entries:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entries
+
+    def choose(self, position, rng=random):
+        """
+        Вибирає хід книги для позиції випадково з урахуванням ваг
+
+        Args:
+            position (SearchBoard): Позиція з хешем Зобріста
+            rng: Генератор випадкових чисел
+
+        Returns:
+            Move: Хід або None, якщо позиції немає в книзі
+        """
+        entries = self.probe(position.key)
+        if not entries:
+            return None
+        # Хід книги зіставляється з допустимими ходами за кінцевими клітинками
+        moves = {(move.from_sq, move.to_sq): move for move in reversed(position.moves())}
+        candidates = [(moves[squares], weight) for squares, weight in entries if squares in moves]
+        if not candidates:
+            return None
+        return rng.choices([move for move, _ in candidates], [weight for _, weight in candidates])[0]
+
+
+def write_book(path, book):
+    """
+    Записує книгу у файл
+
+    Args:
+        path (str): Шлях до файлу
+        book (dict): Хеш позиції -> список пар (Move, вага)
+    """
+    records = sorted(
+        (key, move.from_sq, move.to_sq, min(weight, MAX_WEIGHT))
+        for key, entries in book.items()
+        for move, weight in entries
+    )
+    with open(path, "wb") as book_file:
+        book_file.write(BOOK_MAGIC)
+        for record in records:
+            book_file.write(RECORD.pack(*record))
+
+
+def analyse_position(ai, position, depth, margin):
+    """
+    Оцінює всі ходи позиції пошуком і відбирає ходи для книги
+
+    Args:
+        ai (CheckersAI): AI, чий пошук оцінює ходи
+        position (SearchBoard): Позиція
+        depth (int): Глибина пошуку
+        margin (int): Наскільки хід може бути гіршим за найкращий
+
+    Returns:
+        list: Пари (Move, вага), від найкращого ходу
+    """
+    # Оцінки пошуку - з погляду чорних
+    maximizing = position.player == "black"
+    sign = 1 if maximizing else -1
+    ai.orderer.new_search()
+    scored = []
+    for move in position.moves():
+        position.make(move)
+        try:
+            score, _ = ai.minimax(position, depth - 1, float('-inf'), float('inf'), not maximizing, ply=1)
+        finally:
+            position.unmake()
+        scored.append((sign * score, move))
+    best = max(score for score, _ in scored)
+    selected = [(move, int(margin + 1 - (best - score))) for score, move in scored if best - score <= margin]
+    selected.sort(key=lambda entry: entry[1], reverse=True)
+    return selected
+
+
+def build_book(games=200, plies=8, depth=6, margin=30, seed=0):
+    """
+    Будує книгу самогрою з початкової позиції
+
+    Args:
+        games (int): Кількість партій самогри
+        plies (int): Скільки півходів кожної партії потрапляє в книгу
+        depth (int): Глибина пошуку, яким оцінюються ходи
+        margin (int): Наскільки хід книги може бути гіршим за найкращий
+        seed (int): Зерно генератора випадкових чисел
+
+    Returns:
+        dict: Хеш позиції -> список пар (Move, вага)
+    """
+    from checkers_ai import PIECE_SQUARE_VALUES, CheckersAI
+
+    interface = BitboardInterface()
+    ai = CheckersAI("hard", interface=interface)
+    zobrist = ZobristKeys()
+    rng = random.Random(seed)
+    book = {}
+    for _ in range(games):
+        position = SearchBoard.from_board(interface.get_initial_board(), "white", zobrist, PIECE_SQUARE_VALUES)
+        for _ in range(plies):
+            if position.key not in book:
+                if not position.moves():
+                    break
+                book[position.key] = analyse_position(ai, position, depth, margin)
+            entries = book[position.key]
+            move = rng.choices([move for move, _ in entries], [weight for _, weight in entries])[0]
+            position.make(move)
+    ai.close()
+    return book
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Побудова дебютної книги самогрою")
+    parser.add_argument("--output", default="opening_book.bin", help="файл книги")
+    parser.add_argument("--games", type=int, default=200, help="кількість партій самогри")
+    parser.add_argument("--plies", type=int, default=8, help="півходи кожної партії в книзі")
+    parser.add_argument("--depth", type=int, default=6, help="глибина пошуку для оцінки ходів")
+    parser.add_argument("--margin", type=int, default=30,
+                        help="наскільки хід книги може бути гіршим за найкращий")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    book = build_book(args.games, args.plies, args.depth, args.margin, args.seed)
+    write_book(args.output, book)
+    print(f"Позицій: {len(book)}, ходів: {sum(len(entries) for entries in book.values())} -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
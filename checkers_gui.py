@@ -1,7 +1,8 @@
 # Файл: checkers_gui.py
 import pygame
 import sys
-from checkers_interface import CheckersInterface
+from checkers_backend import get_interface
+from checkers_board import BoardSnapshot
 
 # Константи
 WINDOW_SIZE = 800
@@ -19,9 +20,13 @@ class CheckersGUI:
     """
     Графічний інтерфейс користувача для гри в шашки з використанням PyGame
     """
-    def __init__(self):
+    def __init__(self, backend=None):
         """
         Ініціалізація графічного інтерфейсу
+        
+        Args:
+            backend (str): Бекенд правил ('prolog' або 'bitboard'), за замовчуванням
+                з змінної середовища CHECKERS_BACKEND
         """
         # Ініціалізація PyGame
         pygame.init()
@@ -29,13 +34,15 @@ class CheckersGUI:
         pygame.display.set_caption("Шашки")
         
         # Логіка гри
-        self.interface = CheckersInterface()
+        self.interface = get_interface(backend)
         self.board = self.interface.get_initial_board()
         self.current_player = "white"
         
         # Змінні стану гри
         self.selected_piece = None
         self.possible_moves = []
+        # Повні серії взять вибраної шашки (списки клітинок (x, y))
+        self.capture_paths = []
         self.game_over = False
         
         # Завантаження та масштабування зображень шашок
@@ -111,16 +118,15 @@ class CheckersGUI:
         """
         Малює шашки на дошці
         """
-        for row in range(8):
-            for col in range(8):
-                piece = self.interface.get_piece(self.board, col + 1, row + 1)
-                if piece != "empty":
-                    # Центруємо шашку в клітинці
-                    image = self.images.get(piece)
-                    if image:
-                        x = col * CELL_SIZE + (CELL_SIZE - image.get_width()) // 2
-                        y = row * CELL_SIZE + (CELL_SIZE - image.get_height()) // 2
-                        self.screen.blit(image, (x, y))
+        # Знімок дошки читається без запитів до Prolog на кожному кадрі
+        snapshot = BoardSnapshot(self.board)
+        for col, row, piece in snapshot.pieces():
+            # Центруємо шашку в клітинці
+            image = self.images.get(piece)
+            if image:
+                x = (col - 1) * CELL_SIZE + (CELL_SIZE - image.get_width()) // 2
+                y = (row - 1) * CELL_SIZE + (CELL_SIZE - image.get_height()) // 2
+                self.screen.blit(image, (x, y))
     
     def highlight_selected(self):
         """
@@ -148,6 +154,13 @@ class CheckersGUI:
                 move_highlight = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
                 pygame.draw.rect(move_highlight, (0, 255, 0, 128), move_highlight.get_rect())
                 self.screen.blit(move_highlight, (screen_x, screen_y))
+            
+            # Блідіше підсвічуємо подальші клітинки серій взять
+            for path in self.capture_paths:
+                for path_x, path_y in path[2:]:
+                    path_highlight = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+                    pygame.draw.rect(path_highlight, (0, 255, 0, 64), path_highlight.get_rect())
+                    self.screen.blit(path_highlight, ((path_x - 1) * CELL_SIZE, (path_y - 1) * CELL_SIZE))
     
     def get_cell_from_mouse(self, pos):
         """
@@ -249,6 +262,7 @@ class CheckersGUI:
                                    (piece == "b" or piece == "bk") and self.current_player == "black"):
                 self.selected_piece = (x, y)
                 self.possible_moves = self.get_possible_moves(x, y)
+                self.capture_paths = self.interface.capture_sequences(self.board, x, y, self.current_player)
         else:
             # Якщо шашка вже вибрана, намагаємося зробити хід
             from_x, from_y = self.selected_piece
@@ -275,6 +289,8 @@ class CheckersGUI:
                             # Якщо є додаткові взяття, вибираємо нову позицію
                             self.selected_piece = (to_x, to_y)
                             self.possible_moves = captures_only
+                            self.capture_paths = self.interface.capture_sequences(self.board, to_x, to_y,
+                                                                                  self.current_player)
                             return
                     
                     # Перемикаємо гравця, якщо не було взяття або немає додаткових взять
@@ -283,6 +299,7 @@ class CheckersGUI:
             # Скидаємо виділення
             self.selected_piece = None
             self.possible_moves = []
+            self.capture_paths = []
     
     def check_game_over(self):
         """
@@ -348,6 +365,7 @@ class CheckersGUI:
         self.current_player = "white"
         self.selected_piece = None
         self.possible_moves = []
+        self.capture_paths = []
         self.game_over = False
     
     def run(self):
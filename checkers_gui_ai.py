@@ -1,8 +1,9 @@
 import pygame
 import sys
-import time
-from checkers_interface import CheckersInterface
+from checkers_backend import get_interface
+from checkers_board import BoardSnapshot
 from checkers_ai import CheckersAI
+from checkers_async import AsyncSearch, Ponderer
 
 # Константи
 WINDOW_SIZE = 600
@@ -22,12 +23,15 @@ class CheckersGUIAI:
     """
     Графічний інтерфейс користувача для гри в шашки проти AI з використанням PyGame
     """
-    def __init__(self, difficulty="medium"):
+    def __init__(self, difficulty="medium", backend=None, ponder=True):
         """
         Ініціалізація графічного інтерфейсу
         
         Args:
             difficulty (str): Рівень складності AI ('easy', 'medium', 'hard')
+            backend (str): Бекенд правил ('prolog' або 'bitboard'), за замовчуванням
+                з змінної середовища CHECKERS_BACKEND
+            ponder (bool): Чи обдумувати відповідь, поки ходить людина
         """
         # Ініціалізація PyGame
         pygame.init()
@@ -36,9 +40,23 @@ class CheckersGUIAI:
         pygame.display.set_caption(f"Шашки проти AI (Складність: {difficulty})")
         
         # Логіка гри
-        self.interface = CheckersInterface()
+        self.interface = get_interface(backend)
         self.board = self.interface.get_initial_board()
-        self.ai = CheckersAI(difficulty)
+        # Дошка партії зберігається і в бекенді правил: запити ходів передають
+        # лише дескриптор, а не всю дошку (self.board - копія для малювання і AI)
+        self.board_handle = self.interface.new_board_handle(self.board)
+        # Статистика пошуку надходить з потоку пошуку і показується під час обдумування
+        self.search_progress = None
+        # Вибірковий пошук дає глибші ітерації за той самий час на хід
+        self.ai = CheckersAI(difficulty, interface=self.interface, progress=self._on_search_progress,
+                             selective=True)
+        # AI шукає хід у фоновому потоці, а вікно тим часом оновлюється
+        self.search = AsyncSearch(self.ai)
+        # Поки ходить людина, AI шукає відповідь на її передбачений хід
+        self.ponder = ponder
+        self.ponderer = Ponderer(self.search)
+        # Відповідь, готова одразу після ходу людини (вгадано її хід)
+        self.ready_move = None
         
         # Гравець завжди грає за білих, AI за чорних
         self.current_player = "white"
@@ -46,6 +64,8 @@ class CheckersGUIAI:
         # Змінні стану гри
         self.selected_piece = None
         self.possible_moves = []
+        # Повні серії взять вибраної шашки (списки клітинок (x, y))
+        self.capture_paths = []
         self.game_over = False
         self.winner = None
         self.ai_thinking = False
@@ -78,6 +98,9 @@ class CheckersGUIAI:
             button_height = SCREEN_HEIGHT // 20
             button_start_height = SCREEN_HEIGHT // 10 + i * button_height
             self.difficulty_buttons.append(pygame.Rect(button_start_width, button_start_height, button_width, button_height))
+        
+        # Людина ходить першою - AI одразу починає обдумувати відповідь
+        self.start_pondering()
     
     def _scale_image(self, image_path):
         """
@@ -141,16 +164,15 @@ class CheckersGUIAI:
         """
         Малює шашки на дошці
         """
-        for row in range(8):
-            for col in range(8):
-                piece = self.interface.get_piece(self.board, col + 1, row + 1)
-                if piece != "empty":
-                    # Центруємо шашку в клітинці
-                    image = self.images.get(piece)
-                    if image:
-                        x = col * CELL_SIZE + (CELL_SIZE - image.get_width()) // 2
-                        y = row * CELL_SIZE + (CELL_SIZE - image.get_height()) // 2
-                        self.screen.blit(image, (x, y))
+        # Знімок дошки читається без запитів до Prolog на кожному кадрі
+        snapshot = BoardSnapshot(self.board)
+        for col, row, piece in snapshot.pieces():
+            # Центруємо шашку в клітинці
+            image = self.images.get(piece)
+            if image:
+                x = (col - 1) * CELL_SIZE + (CELL_SIZE - image.get_width()) // 2
+                y = (row - 1) * CELL_SIZE + (CELL_SIZE - image.get_height()) // 2
+                self.screen.blit(image, (x, y))
     
     def highlight_selected(self):
         """
@@ -178,6 +200,13 @@ class CheckersGUIAI:
                 move_highlight = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
                 pygame.draw.rect(move_highlight, (0, 255, 0, 128), move_highlight.get_rect())
                 self.screen.blit(move_highlight, (screen_x, screen_y))
+            
+            # Блідіше підсвічуємо подальші клітинки серій взять
+            for path in self.capture_paths:
+                for path_x, path_y in path[2:]:
+                    path_highlight = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+                    pygame.draw.rect(path_highlight, (0, 255, 0, 64), path_highlight.get_rect())
+                    self.screen.blit(path_highlight, ((path_x - 1) * CELL_SIZE, (path_y - 1) * CELL_SIZE))
     
     def get_cell_from_mouse(self, pos):
         """
@@ -205,23 +234,10 @@ class CheckersGUIAI:
         Returns:
             list: Список координат (x, y) можливих ходів
         """
-        possible_moves = []
-        
-        # Перевіряємо всі можливі ходи
-        for to_x in range(1, 9):
-            for to_y in range(1, 9):
-                # Спочатку перевіряємо взяття
-                if self.interface.is_valid_capture(self.board, x, y, to_x, to_y, self.current_player):
-                    possible_moves.append((to_x, to_y))
-        
-        # Якщо немає можливих взять, перевіряємо звичайні ходи
-        if not possible_moves:
-            for to_x in range(1, 9):
-                for to_y in range(1, 9):
-                    if self.interface.is_valid_move(self.board, x, y, to_x, to_y, self.current_player):
-                        possible_moves.append((to_x, to_y))
-        
-        return possible_moves
+        # Один запит до збереженої дошки замість перевірки кожної клітинки;
+        # взяття обов'язкові, тому за наявності взять інші ходи не повертаються
+        legal_moves = self.interface.handle_legal_moves(self.board_handle, self.current_player)
+        return [(to_x, to_y) for from_x, from_y, to_x, to_y in legal_moves if (from_x, from_y) == (x, y)]
     
     def handle_click(self, pos):
         """
@@ -239,7 +255,9 @@ class CheckersGUIAI:
         for i, button in enumerate(self.difficulty_buttons):
             if button.collidepoint(pos):
                 self.current_difficulty = i
-                self.ai = CheckersAI(self.difficulties[i])
+                # AI використовує той самий інтерфейс, тому Prolog не перезавантажується
+                # (пошук, що вже йде, складність не змінює - його скасує reset_game)
+                self.ai.set_difficulty(self.difficulties[i])
                 pygame.display.set_caption(f"Шашки проти AI (Складність: {self.difficulties[i]})")
                 self.reset_game()
                 return
@@ -261,6 +279,7 @@ class CheckersGUIAI:
             if piece == "w" or piece == "wk":
                 self.selected_piece = (x, y)
                 self.possible_moves = self.get_possible_moves(x, y)
+                self.capture_paths = self.interface.capture_sequences(self.board, x, y, self.current_player)
         else:
             # Якщо шашка вже вибрана, намагаємося зробити хід
             from_x, from_y = self.selected_piece
@@ -268,9 +287,9 @@ class CheckersGUIAI:
             
             if (x, y) in self.possible_moves:
                 # Виконуємо хід
-                new_board = self.interface.make_move(self.board, from_x, from_y, to_x, to_y, self.current_player)
-                if new_board:
-                    self.board = new_board
+                if self.interface.handle_make_move(self.board_handle, from_x, from_y, to_x, to_y,
+                                                   self.current_player):
+                    self.board = self.interface.get_handle_board(self.board_handle)
                     
                     # Перевіряємо, чи було взяття
                     was_capture = abs(to_x - from_x) == 2 and abs(to_y - from_y) == 2
@@ -288,6 +307,8 @@ class CheckersGUIAI:
                             # Якщо є додаткові взяття, вибираємо нову позицію
                             self.selected_piece = (to_x, to_y)
                             self.possible_moves = captures_only
+                            self.capture_paths = self.interface.capture_sequences(self.board, to_x, to_y,
+                                                                                  self.current_player)
                             return
                     
                     # Перевіряємо чи закінчилася гра після ходу гравця
@@ -302,24 +323,57 @@ class CheckersGUIAI:
                     # Скидаємо виділення
                     self.selected_piece = None
                     self.possible_moves = []
+                    self.capture_paths = []
                     
-                    # Запускаємо хід AI з невеликою затримкою
-                    self.ai_thinking = True
+                    # Передаємо хід AI: відповідь з обдумування або фоновий пошук
+                    self.start_ai_turn()
             else:
                 # Скидаємо виділення, якщо клікнули на недозволене місце
                 self.selected_piece = None
                 self.possible_moves = []
+                self.capture_paths = []
+    
+    def _on_search_progress(self, stats):
+        """
+        Запам'ятовує статистику пошуку (викликається в потоці пошуку)
+        
+        Args:
+            stats (SearchStats): Поточна статистика
+        """
+        self.search_progress = stats
+    
+    def start_pondering(self):
+        """
+        Починає обдумування на час ходу людини
+        """
+        if self.ponder and self.ai.difficulty != "easy" and not self.game_over:
+            self.ponderer.start(self.board, "white")
+    
+    def start_ai_turn(self):
+        """
+        Передає хід AI: якщо хід людини вгадано, відповідь уже готова,
+        інакше запускається фоновий пошук
+        """
+        self.ai_thinking = True
+        self.search_progress = None
+        self.ready_move = self.ponderer.finish(self.board)
+        if self.ready_move is None:
+            self.search.start(self.board)
     
     def ai_make_move(self):
         """
-        Виконує хід AI
+        Виконує хід AI, якщо фоновий пошук уже завершився
         """
-        # Симулюємо "роздуми" AI для кращого UX (коротка пауза)
-        pygame.display.flip()
-        time.sleep(0.5)
+        if self.ready_move is not None:
+            move = self.ready_move
+            self.ready_move = None
+        else:
+            done, move = self.search.poll()
+            if not done:
+                return
         
-        # AI робить хід
-        new_board, move = self.ai.make_move(self.board)
+        # Хід виконується в основному потоці, як і всі запити до бекенду правил
+        new_board = self.ai.apply_move(self.board, move, self.board_handle)[0] if move is not None else None
         
         if new_board is not None:
             self.board = new_board
@@ -329,8 +383,10 @@ class CheckersGUIAI:
                 self.game_over = True
                 self.winner = "black"
             else:
-                # Перемикаємо гравця назад на людину
+                # Перемикаємо гравця назад на людину і обдумуємо її хід
                 self.current_player = "white"
+                self.ai_thinking = False
+                self.start_pondering()
         else:
             # Якщо AI не може зробити хід, гра закінчена
             self.game_over = True
@@ -367,6 +423,20 @@ class CheckersGUIAI:
             text_rect = text.get_rect(center=button.center)
             self.screen.blit(text, text_rect)
     
+    def show_ponder_stats(self):
+        """
+        Показує, яку частку ходів людини AI вгадав під час обдумування
+        """
+        if not self.ponder:
+            return
+        font = pygame.font.SysFont('Arial', 16)
+        guessed = self.ponderer.hits
+        total = guessed + self.ponderer.misses
+        text = font.render(f"Вгадано ходів: {guessed}/{total} ({self.ponderer.hit_rate():.0%})", True, BLACK)
+        text_rect = text.get_rect(center=(SCREEN_HEIGHT + (SCREEN_WIDTH - SCREEN_HEIGHT) // 2, SCREEN_HEIGHT // 3))
+        self.screen.fill((206, 196, 194), text_rect.inflate(40, 4))
+        self.screen.blit(text, text_rect)
+    
     def show_game_over(self):
         """
         Показує повідомлення про закінчення гри
@@ -395,7 +465,13 @@ class CheckersGUIAI:
         font = pygame.font.SysFont('Arial', 20)
         
         if self.ai_thinking:
-            text = font.render("AI думає...", True, BLACK)
+            # Крапки змінюються щокадру, тож видно, що вікно не зависло
+            dots = "." * (pygame.time.get_ticks() // 400 % 3 + 1)
+            status = f"AI думає{dots:<3} {self.search.elapsed():.1f} с"
+            progress = self.search_progress
+            if progress is not None and progress.depth:
+                status += f", глибина {progress.depth}, {progress.nodes_per_second() / 1000:.0f}k вузлів/с"
+            text = font.render(status, True, BLACK)
         else:
             text = font.render(f"Хід: {'ваш' if self.current_player == 'white' else 'AI'}", True, BLACK)
         
@@ -410,12 +486,20 @@ class CheckersGUIAI:
         Скидає гру до початкового стану
         """
         self.board = self.interface.get_initial_board()
+        self.interface.release_board_handle(self.board_handle)
+        self.board_handle = self.interface.new_board_handle(self.board)
         self.current_player = "white"
         self.selected_piece = None
         self.possible_moves = []
+        self.capture_paths = []
         self.game_over = False
         self.winner = None
+        # Пошук для попередньої партії більше не потрібен
+        self.ponderer.cancel()
+        self.search.cancel()
+        self.ready_move = None
         self.ai_thinking = False
+        self.start_pondering()
     
     def run(self):
         """
@@ -445,15 +529,16 @@ class CheckersGUIAI:
             
             # Малюємо кнопки
             self.draw_buttons()
+            self.show_ponder_stats()
             
             # Показуємо поточного гравця
             self.show_current_player()
             
             # Якщо зараз хід AI і гра не закінчена
             if self.current_player == "black" and not self.game_over and not self.ai_thinking:
-                self.ai_thinking = True
+                self.start_ai_turn()
             
-            # Якщо AI думає, робимо хід
+            # Якщо AI вже знайшов хід, робимо його
             if self.ai_thinking and not self.game_over:
                 self.ai_make_move()
             
@@ -467,6 +552,11 @@ class CheckersGUIAI:
             # Обмеження частоти кадрів
             self.clock.tick(60)
         
+        # Зупиняємо фоновий пошук і процеси AI
+        self.search.shutdown()
+        self.ai.close()
+        self.interface.release_board_handle(self.board_handle)
+        
         # Завершення роботи PyGame
         pygame.quit()
         sys.exit()
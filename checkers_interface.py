@@ -1,23 +1,139 @@
 # Файл: checkers_interface.py
+import os
+import time
 from pyswip import Prolog
 import numpy as np
+from checkers_backend import RULES_FILE
+from checkers_stats import QueryStats
 
 class CheckersInterface:
     """
     Клас для інтерфейсу між Python і Prolog для гри в шашки
     """
-    def __init__(self, prolog_file="checkers.pl"):
+    def __init__(self, prolog_file=RULES_FILE, quiet=False, precompiled=False, instrument=False):
+        """
+        Ініціалізація Prolog і завантаження правил
+        
+        Args:
+            prolog_file (str): Файл з правилами
+            quiet (bool): Не запускати самотести з директиви initialization
+            precompiled (bool): Завантажувати скомпільований .qlf-файл правил,
+                створюючи його, якщо він відсутній, застарів або не завантажується
+                (наприклад, створений іншою версією SWI-Prolog)
+            instrument (bool): Збирати статистику запитів за предикатами (self.stats)
+        """
+        self.stats = QueryStats() if instrument else None
         try:
             self.prolog = Prolog()
             # Збільшимо стек для SWI-Prolog
             self.prolog.query("set_prolog_flag(stack_limit, 32_000_000)")
             self.prolog.query("set_prolog_flag(toplevel_print_options, [quoted(true), portray(true), max_depth(100)])")
-            self.prolog.consult(prolog_file)
-            print("Prolog initialized successfully")
+            self.load_time = self._load_rules(prolog_file, quiet, precompiled)
+            print(f"Prolog initialized successfully ({self.load_time * 1000:.1f} ms)")
         except Exception as e:
             print(f"Помилка ініціалізації Prolog: {e}")
             raise
     
+    def _load_rules(self, prolog_file, quiet, precompiled):
+        """
+        Завантажує файл правил у Prolog
+        
+        Args:
+            prolog_file (str): Файл з правилами
+            quiet (bool): Не запускати самотести з директиви initialization
+            precompiled (bool): Використовувати скомпільований .qlf-файл
+        
+        Returns:
+            float: Час завантаження в секундах
+        """
+        start = time.perf_counter()
+        # Прапорець перевіряє run_self_tests/0 у Checkers.pl
+        quiet_flag = "true" if quiet else "false"
+        list(self.prolog.query(f"create_prolog_flag(checkers_quiet, {quiet_flag}, [type(boolean)])"))
+        
+        if precompiled and os.path.exists(prolog_file):
+            qlf_file = os.path.splitext(prolog_file)[0] + ".qlf"
+            if not (os.path.exists(qlf_file) and os.path.getmtime(qlf_file) >= os.path.getmtime(prolog_file)
+                    and self._load_qlf(qlf_file)):
+                # qcompile/1 завантажує правила і водночас створює .qlf для наступних запусків
+                list(self.prolog.query(f"qcompile({self._prolog_atom(prolog_file)})"))
+        else:
+            self.prolog.consult(prolog_file)
+        return time.perf_counter() - start
+    
+    def _load_qlf(self, qlf_file):
+        """
+        Завантажує скомпільовані правила
+        
+        Args:
+            qlf_file (str): Файл .qlf
+        
+        Returns:
+            bool: True, якщо файл завантажено, False, якщо його треба перекомпілювати
+        """
+        try:
+            list(self.prolog.query(f"load_files({self._prolog_atom(qlf_file)}, [])"))
+        except Exception as e:
+            print(f"Не вдалося завантажити {qlf_file}, правила буде перекомпільовано: {e}")
+            return False
+        return True
+    
+    @staticmethod
+    def _prolog_atom(text):
+        """
+        Записує рядок (наприклад, шлях до файлу) як Prolog-атом у лапках
+        """
+        return "'" + text.replace("\\", "/").replace("'", "\\'") + "'"
+    
+    def enable_instrumentation(self):
+        """
+        Вмикає збір статистики запитів (наприклад, для спільного інтерфейсу)
+        
+        Returns:
+            QueryStats: Об'єкт статистики
+        """
+        if self.stats is None:
+            self.stats = QueryStats()
+        return self.stats
+    
+    def disable_instrumentation(self):
+        """
+        Вимикає збір статистики запитів
+        """
+        self.stats = None
+    
+    def _query(self, predicate, query, started=None):
+        """
+        Виконує запит до Prolog і, якщо увімкнено, записує його статистику
+        
+        Args:
+            predicate (str): Назва предиката для статистики
+            query (str): Текст запиту
+            started (float): Момент початку серіалізації (time.perf_counter)
+        
+        Returns:
+            list: Усі розв'язки запиту
+        """
+        if self.stats is None:
+            return list(self.prolog.query(query))
+        query_started = time.perf_counter()
+        result = list(self.prolog.query(query))
+        finished = time.perf_counter()
+        serialise_time = query_started - started if started is not None else 0.0
+        self.stats.record(predicate, serialise_time, finished - query_started)
+        return result
+    
+    def _decode_board(self, predicate, prolog_board):
+        """
+        Перетворює дошку з Prolog у Python, записуючи час розбору в статистику
+        """
+        if self.stats is None:
+            return self._board_prolog_to_python(prolog_board)
+        started = time.perf_counter()
+        board = self._board_prolog_to_python(prolog_board)
+        self.stats.record_decode(predicate, time.perf_counter() - started)
+        return board
+    
     def _board_prolog_to_python(self, prolog_board):
         """
         Конвертує представлення дошки з Prolog у Python (список списків)
@@ -69,9 +185,9 @@ class CheckersInterface:
         Returns:
             list: Початкова дошка у форматі Python
         """
-        result = list(self.prolog.query("initial_board(Board)"))
+        result = self._query("initial_board", "initial_board(Board)")
         if result:
-            return self._board_prolog_to_python(result[0]["Board"])
+            return self._decode_board("initial_board", result[0]["Board"])
         else:
             raise Exception("Не вдалося отримати початкову дошку")
     
@@ -82,9 +198,9 @@ class CheckersInterface:
         Returns:
             list: Порожня дошка у форматі Python
         """
-        result = list(self.prolog.query("empty_board(Board)"))
+        result = self._query("empty_board", "empty_board(Board)")
         if result:
-            return self._board_prolog_to_python(result[0]["Board"])
+            return self._decode_board("empty_board", result[0]["Board"])
         else:
             raise Exception("Не вдалося отримати порожню дошку")
     
@@ -100,9 +216,10 @@ class CheckersInterface:
         Returns:
             str: Фігура на вказаній позиції ('empty', 'w', 'b', 'wk', 'bk')
         """
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
         query = f"get_piece({board_term}, {x}, {y}, Piece)"
-        result = list(self.prolog.query(query))
+        result = self._query("get_piece", query, started)
         if result:
             return str(result[0]["Piece"])
         else:
@@ -123,14 +240,16 @@ class CheckersInterface:
         Returns:
             bool: True, якщо хід допустимий, інакше False
         """
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
         query = f"valid_simple_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player})"
-        return bool(list(self.prolog.query(query)))
+        return bool(self._query("valid_simple_move", query, started))
     
     def is_valid_king_move(self, board, from_x, from_y, to_x, to_y, player):
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
         query = f"valid_king_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player})"
-        return bool(list(self.prolog.query(query)))
+        return bool(self._query("valid_king_move", query, started))
 
     def is_valid_capture(self, board, from_x, from_y, to_x, to_y, player):
         """
@@ -147,9 +266,10 @@ class CheckersInterface:
         Returns:
             bool: True, якщо взяття допустиме, інакше False
         """
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
         query = f"valid_capture({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player})"
-        return bool(list(self.prolog.query(query)))
+        return bool(self._query("valid_capture", query, started))
     
     def make_move(self, board, from_x, from_y, to_x, to_y, player):
         """
@@ -166,31 +286,152 @@ class CheckersInterface:
         Returns:
             list: Нова дошка після ходу або None, якщо хід неможливий
         """
+        if not (1 <= from_x <= 8 and 1 <= from_y <= 8):
+            raise Exception(f"Не вдалося отримати фігуру на позиції ({from_x}, {from_y})")
+
+        # apply_move/7 сам обирає взяття, хід дамкою або простий хід,
+        # тому дошка серіалізується лише один раз
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
-        piece = self.get_piece(board, from_x, from_y)
+        query = f"apply_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player}, NewBoard)"
+        result = self._query("apply_move", query, started)
+        if result:
+            return self._decode_board("apply_move", result[0]["NewBoard"])
+        return None
 
-        # Спроба виконати взяття (для всіх типів фігур)
-        capture_query = f"make_capture_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player}, NewBoard)"
-        capture_result = list(self.prolog.query(capture_query))
+    def legal_moves(self, board, player):
+        """
+        Отримує всі допустимі ходи гравця одним запитом до Prolog
         
-        if capture_result:
-            return self._board_prolog_to_python(capture_result[0]["NewBoard"])
-
-        # Якщо фігура - дамка, використовуємо окрему логіку
-        if piece in ["wk", "bk"]:
-            # Спроба зробити хід дамкою (можливі довгі ходи)
-            king_query = f"make_king_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player}, NewBoard)"
-            king_result = list(self.prolog.query(king_query))
-            if king_result:
-                return self._board_prolog_to_python(king_result[0]["NewBoard"])
+        Якщо є хоча б одне взяття, повертаються лише взяття (взяття обов'язкове).
+        
+        Args:
+            board (list): Поточна дошка
+            player (str): Гравець ('white' або 'black')
+        
+        Returns:
+            list: Список ходів у вигляді (from_x, from_y, to_x, to_y)
+        """
+        started = time.perf_counter()
+        board_term = self._board_python_to_prolog(board)
+        result = self._query("legal_moves", f"legal_moves({board_term}, {player}, Moves)", started)
+        if result:
+            return [tuple(move) for move in result[0]["Moves"]]
+        return []
+    
+    def capture_sequences(self, board, x, y, player):
+        """
+        Отримує всі повні серії взять фігури одним запитом до Prolog
+        
+        Серія продовжується, доки з кінцевої клітинки фігура може брати далі.
+        
+        Args:
+            board (list): Поточна дошка
+            x (int): Координата X фігури (1-8)
+            y (int): Координата Y фігури (1-8)
+            player (str): Гравець ('white' або 'black')
+        
+        Returns:
+            list: Шляхи - списки клітинок (x, y) від фігури до кінця серії
+        """
+        started = time.perf_counter()
+        board_term = self._board_python_to_prolog(board)
+        result = self._query(
+            "capture_sequences",
+            f"capture_sequences({board_term}, {x}, {y}, {player}, Paths)",
+            started
+        )
+        if result:
+            return [[tuple(square) for square in path] for path in result[0]["Paths"]]
+        return []
+    
+    def new_board_handle(self, board):
+        """
+        Зберігає дошку в Prolog і повертає її дескриптор
+        
+        Після цього запити до дошки передають лише дескриптор, а не весь термін дошки.
+        
+        Args:
+            board (list): Дошка у форматі Python
+        
+        Returns:
+            int: Дескриптор збереженої дошки
+        """
+        started = time.perf_counter()
+        board_term = self._board_python_to_prolog(board)
+        result = self._query("new_board_handle", f"new_board_handle({board_term}, Handle)", started)
+        if result:
+            return int(result[0]["Handle"])
         else:
-            # Звичайний хід для простих шашок
-            move_query = f"make_simple_move({board_term}, {from_x}, {from_y}, {to_x}, {to_y}, {player}, NewBoard)"
-            move_result = list(self.prolog.query(move_query))
-            if move_result:
-                return self._board_prolog_to_python(move_result[0]["NewBoard"])
-
-        return None
+            raise Exception("Не вдалося зберегти дошку в Prolog")
+    
+    def copy_board_handle(self, handle):
+        """
+        Створює копію збереженої дошки
+        
+        Args:
+            handle (int): Дескриптор дошки
+        
+        Returns:
+            int: Дескриптор копії
+        """
+        result = self._query("copy_board_handle", f"copy_board_handle({handle}, NewHandle)")
+        if result:
+            return int(result[0]["NewHandle"])
+        else:
+            raise Exception(f"Невідомий дескриптор дошки: {handle}")
+    
+    def release_board_handle(self, handle):
+        """
+        Видаляє збережену дошку з Prolog
+        
+        Args:
+            handle (int): Дескриптор дошки
+        """
+        self._query("release_board_handle", f"release_board_handle({handle})")
+    
+    def get_handle_board(self, handle):
+        """
+        Отримує збережену дошку у форматі Python
+        
+        Args:
+            handle (int): Дескриптор дошки
+        
+        Returns:
+            list: Дошка у форматі Python
+        """
+        result = self._query("handle_board", f"handle_board({handle}, Board)")
+        if result:
+            return self._decode_board("handle_board", result[0]["Board"])
+        else:
+            raise Exception(f"Невідомий дескриптор дошки: {handle}")
+    
+    def handle_legal_moves(self, handle, player):
+        """
+        Отримує всі допустимі ходи гравця на збереженій дошці (див. legal_moves)
+        """
+        result = self._query("handle_legal_moves", f"handle_legal_moves({handle}, {player}, Moves)")
+        if result:
+            return [tuple(move) for move in result[0]["Moves"]]
+        return []
+    
+    def handle_make_move(self, handle, from_x, from_y, to_x, to_y, player):
+        """
+        Виконує хід на збереженій дошці, змінюючи її на місці
+        
+        Args:
+            handle (int): Дескриптор дошки
+            from_x (int): Початкова координата X (1-8)
+            from_y (int): Початкова координата Y (1-8)
+            to_x (int): Кінцева координата X (1-8)
+            to_y (int): Кінцева координата Y (1-8)
+            player (str): Гравець ('white' або 'black')
+        
+        Returns:
+            bool: True, якщо хід виконано, False, якщо хід неможливий
+        """
+        query = f"handle_make_move({handle}, {from_x}, {from_y}, {to_x}, {to_y}, {player})"
+        return bool(self._query("handle_make_move", query))
     
     def print_board(self, board):
         """
@@ -216,15 +457,33 @@ class CheckersInterface:
             print()
 
     def ai_make_move(self, board, difficulty):
-        """Виконує хід через Prolog AI"""
+        """
+        Виконує хід чорних через альфа-бета пошук в Prolog (ai_make_move/4)
+        
+        Весь пошук виконується одним запитом: у Python повертаються лише
+        вибраний хід і нова дошка. Серію взять Prolog доводить до кінця тією ж
+        шашкою, тому повторно запитувати продовження не потрібно.
+        
+        Args:
+            board (list): Поточний стан дошки
+            difficulty (str): Рівень складності ('easy', 'medium', 'hard')
+        
+        Returns:
+            tuple: Новий стан дошки та шлях ходу - список клітинок (x, y) від
+                початкової до кінцевої (для серії взять - усі проміжні)
+                або (None, None), якщо ходів немає
+        """
+        started = time.perf_counter()
         board_term = self._board_python_to_prolog(board)
         try:
-            result = list(self.prolog.query(
-                f"ai_make_move({board_term}, {difficulty}, NewBoard, (FromX, FromY, ToX, ToY))"
-            ))[0]
+            result = self._query(
+                "ai_make_move",
+                f"ai_make_move({board_term}, {difficulty}, NewBoard, Path)",
+                started
+            )[0]
             return (
-                self._board_prolog_to_python(result["NewBoard"]),
-                (result["FromX"], result["FromY"], result["ToX"], result["ToY"])
+                self._decode_board("ai_make_move", result["NewBoard"]),
+                [tuple(square) for square in result["Path"]]
             )
         except Exception as e:
             print(f"AI error: {e}")
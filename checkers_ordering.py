@@ -0,0 +1,134 @@
+# Файл: checkers_ordering.py
+"""
+Впорядкування ходів для альфа-бета пошуку.
+
+Що раніше перевірено найкращий хід, то раніше відбувається відсікання.
+Порядок: хід з таблиці транспозицій, найкращий хід попередньої ітерації,
+ходи-вбивці (killer moves) цього рівня дерева, далі за таблицею історії.
+Взяття в цих правилах обов'язкові, тому список ходів вузла складається або
+лише зі взять, або лише з тихих ходів, і окремо ставити взяття першими не треба.
+
+Впорядкування підключається до CheckersAI параметром orderer: підходить
+будь-який об'єкт з методами new_search, reset_counters, order і record_cutoff
+та лічильниками cutoffs і first_move_cutoffs.
+"""
+
+# Найбільша глибина дерева, для якої зберігаються ходи-вбивці
+MAX_PLY = 128
+# Скільки ходів-вбивць пам'ятати на кожному рівні
+KILLERS_PER_PLY = 2
+
+# Пріоритети ходів (більше - раніше)
+TT_MOVE_PRIORITY = 3_000_000_000
+FIRST_MOVE_PRIORITY = 2_000_000_000
+KILLER_PRIORITY = 1_000_000_000
+
+
+class MoveOrderer:
+    """
+    Впорядкування ходів: хід з таблиці, ходи-вбивці, евристика історії
+    """
+    def __init__(self, use_killers=True, use_history=True):
+        """
+        Створює впорядкування з порожніми таблицями
+
+        Args:
+            use_killers (bool): Чи використовувати ходи-вбивці
+            use_history (bool): Чи використовувати таблицю історії
+        """
+        self.use_killers = use_killers
+        self.use_history = use_history
+        self.killers = [[] for _ in range(MAX_PLY)]
+        # (гравець, хід) -> накопичена вага відсікань
+        self.history = {}
+        self.reset_counters()
+
+    def reset_counters(self):
+        """
+        Обнуляє статистику відсікань
+        """
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self):
+        """
+        Готує таблиці до нового пошуку: ходи-вбивці забуваються,
+        вага історії зменшується вдвічі, щоб старі позиції важили менше
+        """
+        self.killers = [[] for _ in range(MAX_PLY)]
+        self.history = {move: weight // 2 for move, weight in self.history.items() if weight > 1}
+
+    def order(self, moves, player, ply, tt_move=None, first_move=None):
+        """
+        Повертає ходи у порядку перевірки
+
+        Args:
+            moves (list): Допустимі ходи Move (шлях і взяті клітинки)
+            player (str): Гравець, який ходить
+            ply (int): Відстань від кореня дерева пошуку
+            tt_move (Move): Найкращий хід з таблиці транспозицій
+            first_move (Move): Найкращий хід попередньої ітерації
+
+        Returns:
+            list: Ті самі ходи, відсортовані від найперспективнішого
+        """
+        killers = self.killers[ply] if self.use_killers and ply < MAX_PLY else ()
+        history = self.history if self.use_history else {}
+
+        def priority(move):
+            if move == tt_move:
+                return TT_MOVE_PRIORITY
+            if move == first_move:
+                return FIRST_MOVE_PRIORITY
+            if move in killers:
+                return KILLER_PRIORITY - killers.index(move)
+            return history.get((player, move), 0)
+
+        # Стабільне сортування зберігає порядок генерації для рівних ходів
+        return sorted(moves, key=priority, reverse=True)
+
+    def record_cutoff(self, move, player, ply, depth, move_index):
+        """
+        Запам'ятовує хід, що спричинив відсікання
+
+        Args:
+            move (Move): Хід (шлях і взяті клітинки)
+            player (str): Гравець, який ходив
+            ply (int): Відстань від кореня дерева пошуку
+            depth (int): Залишкова глибина вузла
+            move_index (int): Номер ходу у впорядкованому списку (0 - перший)
+        """
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if self.use_killers and ply < MAX_PLY:
+            killers = self.killers[ply]
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[KILLERS_PER_PLY:]
+        if self.use_history:
+            key = (player, move)
+            # Відсікання ближче до кореня відсікає більше дерева
+            self.history[key] = self.history.get(key, 0) + depth * depth
+
+    def first_move_cutoff_rate(self):
+        """
+        Частка відсікань, спричинених першим перевіреним ходом
+
+        Returns:
+            float: Від 0.0 до 1.0 (близько до 1.0 - майже ідеальний порядок)
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def stats(self):
+        """
+        Повертає статистику відсікань
+
+        Returns:
+            dict: Кількість відсікань, з них першим ходом, і їх частка
+        """
+        return {
+            "cutoffs": self.cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate(),
+        }
@@ -0,0 +1,290 @@
+# Файл: checkers_stats.py
+"""
+Статистика запитів до бекенду правил: кількість викликів і затримки для
+кожного предиката окремо, з розділенням часу на серіалізацію дошки,
+сам запит до Prolog і розбір результату.
+
+Статистика пошуку AI (SearchStats): вузли, листки, швидкість, ефективний
+коефіцієнт розгалуження, частка відсікань, влучання в таблицю транспозицій
+і розподіл часу між генерацією ходів, виконанням ходів і оцінкою.
+"""
+import json
+import threading
+
+
+class PredicateStats:
+    """
+    Накопичена статистика одного предиката
+    """
+    __slots__ = ("calls", "serialise_time", "query_time", "decode_time", "latencies")
+
+    def __init__(self):
+        self.calls = 0
+        self.serialise_time = 0.0
+        self.query_time = 0.0
+        self.decode_time = 0.0
+        # Затримка кожного виклику (серіалізація + запит) у секундах
+        self.latencies = []
+
+    def percentile(self, percent):
+        """
+        Обчислює перцентиль затримки (найближчий ранг)
+
+        Args:
+            percent (float): Перцентиль (0-100)
+
+        Returns:
+            float: Затримка в секундах або 0.0, якщо викликів не було
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def to_dict(self):
+        """
+        Повертає статистику у вигляді словника (час у мілісекундах)
+
+        Returns:
+            dict: Статистика предиката
+        """
+        total = self.serialise_time + self.query_time + self.decode_time
+        return {
+            "calls": self.calls,
+            "total_ms": total * 1000,
+            "serialise_ms": self.serialise_time * 1000,
+            "query_ms": self.query_time * 1000,
+            "decode_ms": self.decode_time * 1000,
+            "mean_ms": total * 1000 / self.calls if self.calls else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": max(self.latencies) * 1000 if self.latencies else 0.0,
+        }
+
+
+class QueryStats:
+    """
+    Статистика запитів, згрупована за предикатами
+    """
+    def __init__(self):
+        self.predicates = {}
+        self._lock = threading.Lock()
+
+    def record(self, predicate, serialise_time, query_time):
+        """
+        Записує один виклик предиката
+
+        Args:
+            predicate (str): Назва предиката
+            serialise_time (float): Час побудови запиту (серіалізація дошки), с
+            query_time (float): Час виконання запиту в Prolog, с
+        """
+        with self._lock:
+            stats = self.predicates.get(predicate)
+            if stats is None:
+                stats = self.predicates[predicate] = PredicateStats()
+            stats.calls += 1
+            stats.serialise_time += serialise_time
+            stats.query_time += query_time
+            stats.latencies.append(serialise_time + query_time)
+
+    def record_decode(self, predicate, decode_time):
+        """
+        Додає час розбору результату (перетворення дошки з Prolog у Python)
+
+        Args:
+            predicate (str): Назва предиката
+            decode_time (float): Час розбору, с
+        """
+        with self._lock:
+            stats = self.predicates.get(predicate)
+            if stats is None:
+                stats = self.predicates[predicate] = PredicateStats()
+            stats.decode_time += decode_time
+
+    def reset(self):
+        """
+        Очищає всю накопичену статистику
+        """
+        with self._lock:
+            self.predicates.clear()
+
+    def to_dict(self):
+        """
+        Повертає статистику всіх предикатів, відсортовану за сумарним часом
+
+        Returns:
+            dict: Назва предиката -> статистика
+        """
+        with self._lock:
+            summary = {name: stats.to_dict() for name, stats in self.predicates.items()}
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+    def to_json(self, indent=2):
+        """
+        Серіалізує статистику в JSON
+
+        Returns:
+            str: JSON-рядок
+        """
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def dump(self, path):
+        """
+        Записує статистику в JSON-файл
+
+        Args:
+            path (str): Шлях до файлу
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+    def print_summary(self):
+        """
+        Виводить таблицю статистики в консоль
+        """
+        print(f"{'predicate':<28}{'calls':>8}{'total ms':>11}{'ser ms':>9}{'query ms':>10}{'p50':>8}{'p99':>8}")
+        for name, stats in self.to_dict().items():
+            print(f"{name:<28}{stats['calls']:>8}{stats['total_ms']:>11.1f}{stats['serialise_ms']:>9.1f}"
+                  f"{stats['query_ms']:>10.1f}{stats['p50_ms']:>8.3f}{stats['p99_ms']:>8.3f}")
+
+
+class SearchStats:
+    """
+    Статистика одного пошуку ходу CheckersAI
+    """
+    def __init__(self):
+        # Найбільша повністю завершена глибина і її оцінка
+        self.depth = 0
+        self.score = None
+        self.elapsed = 0.0
+        # Вузли основного пошуку і пошуку спокою
+        self.search_nodes = 0
+        self.quiescence_nodes = 0
+        # Статичні оцінки позицій (листки дерева)
+        self.leaf_evaluations = 0
+        # Вузли, у яких перебиралися ходи, і ті з них, де сталося бета-відсікання
+        self.expanded_nodes = 0
+        self.beta_cutoffs = 0
+        # Повторні пошуки PVS після нульового вікна і після виходу за вікно аспірації
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        # Параметри вибіркового пошуку (None, якщо вимкнено), скорочені пізні
+        # ходи і ті з них, що перешукувалися на повну глибину, спроби нульового
+        # ходу, відсікання ним і відсікання, не підтверджені перевіркою
+        self.selective = None
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.null_move_tries = 0
+        self.null_move_cutoffs = 0
+        self.null_move_failures = 0
+        # Відсікання, записані у впорядкування ходів, і ті з них, що спричинив
+        # перший перевірений хід
+        self.ordering_cutoffs = 0
+        self.first_move_cutoffs = 0
+        # Запити до таблиці транспозицій і влучання
+        self.tt_probes = 0
+        self.tt_hits = 0
+        # Вузли кожної завершеної ітерації (для коефіцієнта розгалуження)
+        self.iteration_nodes = []
+        # Час генерації ходів, виконання і скасування ходів та оцінки, с
+        # (вимірюється лише з CheckersAI(profile=True))
+        self.movegen_time = 0.0
+        self.make_time = 0.0
+        self.eval_time = 0.0
+
+    @property
+    def nodes(self):
+        """
+        int: Усі вузли пошуку
+        """
+        return self.search_nodes + self.quiescence_nodes
+
+    def nodes_per_second(self):
+        """
+        Швидкість пошуку
+
+        Returns:
+            float: Вузлів за секунду або 0.0, якщо час не виміряно
+        """
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def effective_branching_factor(self):
+        """
+        Ефективний коефіцієнт розгалуження: у скільки разів остання ітерація
+        більша за попередню (з однієї ітерації - корінь степеня depth з вузлів)
+
+        Returns:
+            float: Коефіцієнт або 0.0, якщо жодна ітерація не завершилася
+        """
+        if len(self.iteration_nodes) >= 2 and self.iteration_nodes[-2]:
+            return self.iteration_nodes[-1] / self.iteration_nodes[-2]
+        if self.depth and self.nodes:
+            return self.nodes ** (1 / self.depth)
+        return 0.0
+
+    def cutoff_rate(self):
+        """
+        Частка розгорнутих вузлів з бета-відсіканням
+
+        Returns:
+            float: Від 0.0 до 1.0
+        """
+        return self.beta_cutoffs / self.expanded_nodes if self.expanded_nodes else 0.0
+
+    def first_move_cutoff_rate(self):
+        """
+        Частка відсікань, спричинених першим перевіреним ходом
+
+        Returns:
+            float: Від 0.0 до 1.0
+        """
+        return self.first_move_cutoffs / self.ordering_cutoffs if self.ordering_cutoffs else 0.0
+
+    def tt_hit_rate(self):
+        """
+        Частка запитів до таблиці транспозицій, що знайшли позицію
+
+        Returns:
+            float: Від 0.0 до 1.0
+        """
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    def to_dict(self):
+        """
+        Повертає статистику у вигляді словника (час у мілісекундах)
+
+        Returns:
+            dict: Статистика пошуку
+        """
+        return {
+            "depth": self.depth,
+            "score": self.score,
+            "elapsed_ms": self.elapsed * 1000,
+            "nodes": self.nodes,
+            "search_nodes": self.search_nodes,
+            "quiescence_nodes": self.quiescence_nodes,
+            "leaf_evaluations": self.leaf_evaluations,
+            "nps": self.nodes_per_second(),
+            "ebf": self.effective_branching_factor(),
+            "beta_cutoffs": self.beta_cutoffs,
+            "cutoff_rate": self.cutoff_rate(),
+            "pvs_researches": self.pvs_researches,
+            "aspiration_researches": self.aspiration_researches,
+            "selective": dict(self.selective) if self.selective else None,
+            "lmr_reductions": self.lmr_reductions,
+            "lmr_researches": self.lmr_researches,
+            "null_move_tries": self.null_move_tries,
+            "null_move_cutoffs": self.null_move_cutoffs,
+            "null_move_failures": self.null_move_failures,
+            "ordering_cutoffs": self.ordering_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate(),
+            "tt_probes": self.tt_probes,
+            "tt_hit_rate": self.tt_hit_rate(),
+            "iteration_nodes": list(self.iteration_nodes),
+            "movegen_ms": self.movegen_time * 1000,
+            "make_ms": self.make_time * 1000,
+            "eval_ms": self.eval_time * 1000,
+        }
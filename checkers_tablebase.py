@@ -0,0 +1,503 @@
+# Файл: checkers_tablebase.py
+"""
+Бази ендшпілю для AI, побудовані ретроградним аналізом.
+
+Для кожного складу фігур (білі шашки, білі дамки, чорні шашки, чорні дамки)
+з не більше ніж N фігурами будується окремий файл: один байт на позицію з
+відомим результатом для гравця, який ходить (виграш, програш або нічия) і
+кількістю півходів до кінця гри при найкращій грі обох сторін.
+
+Позиція має номер у комбінаторній системі числення: кожна група фігур -
+сполучення клітинок серед 32 темних клітинок, ще не зайнятих попередніми
+групами; до номера додається черга ходу. Файли відкриваються через mmap,
+тож у пам'ять не читаються.
+
+Склади будуються за зростанням кількості фігур, а серед рівних - шашок:
+взяття зменшує кількість фігур, перетворення на дамку - кількість шашок,
+тож ходи, що виходять зі складу, ведуть у вже побудовані таблиці.
+
+Приклад:
+    python checkers_tablebase.py --directory tablebases --pieces 4
+"""
+import argparse
+import heapq
+import mmap
+import os
+from array import array
+from math import comb
+from checkers_bitboard import PROMOTION_MASK, SearchBoard, generate_search_moves
+
+# Заголовок файлу таблиці; за ним - склад фігур (4 байти) і по байту на позицію
+TABLE_MAGIC = b"CKTB\x00\x01"
+HEADER_SIZE = len(TABLE_MAGIC) + 4
+
+# Результат для гравця, який ходить
+DRAW = 0
+WIN = 1
+LOSS = 2
+
+# Байт позиції: 0 - нічия, 1-127 - виграш за стільки півходів,
+# 128 + d - програш за d півходів; довші відстані обрізаються до 127
+MAX_DISTANCE = 127
+LOSS_OFFSET = 128
+
+# Темні клітинки, на яких стоять фігури (X + Y непарне)
+DARK_SQUARES = [sq for sq in range(64) if (sq % 8 + sq // 8) % 2 == 1]
+DARK_INDEX = {sq: index for index, sq in enumerate(DARK_SQUARES)}
+DARK_MASK = sum(1 << sq for sq in DARK_SQUARES)
+
+
+def encode_result(result, distance):
+    """
+    Пакує результат і відстань в один байт
+    """
+    if result == DRAW:
+        return 0
+    distance = min(distance, MAX_DISTANCE)
+    return distance if result == WIN else LOSS_OFFSET + distance
+
+
+def decode_result(value):
+    """
+    Розпаковує байт позиції
+
+    Returns:
+        tuple: Результат (DRAW, WIN або LOSS) і кількість півходів до кінця гри
+    """
+    if value == 0:
+        return DRAW, 0
+    if value < LOSS_OFFSET:
+        return WIN, value
+    return LOSS, value - LOSS_OFFSET
+
+
+def _popcount(bits):
+    return bin(bits).count("1")
+
+
+def material_of(white, black, kings):
+    """
+    Визначає склад фігур позиції
+
+    Returns:
+        tuple: (білі шашки, білі дамки, чорні шашки, чорні дамки)
+    """
+    return (_popcount(white & ~kings), _popcount(white & kings),
+            _popcount(black & ~kings), _popcount(black & kings))
+
+
+def table_name(material):
+    """
+    Повертає ім'я файлу таблиці складу фігур
+    """
+    return "tb_{}_{}_{}_{}.bin".format(*material)
+
+
+def all_materials(max_pieces):
+    """
+    Перелічує склади, де в обох сторін є фігури, у порядку побудови
+
+    Args:
+        max_pieces (int): Найбільша кількість фігур на дошці
+
+    Returns:
+        list: Склади (wm, wk, bm, bk)
+    """
+    materials = []
+    for total in range(2, max_pieces + 1):
+        for white_count in range(1, total):
+            black_count = total - white_count
+            for white_men in range(white_count + 1):
+                for black_men in range(black_count + 1):
+                    materials.append((white_men, white_count - white_men, black_men, black_count - black_men))
+    materials.sort(key=lambda material: (sum(material), material[0] + material[2]))
+    return materials
+
+
+class MaterialIndex:
+    """
+    Нумерація позицій одного складу фігур
+    """
+    def __init__(self, material):
+        """
+        Args:
+            material (tuple): Склад (wm, wk, bm, bk)
+        """
+        self.material = material
+        # Скільки вільних клітинок лишається для кожної групи
+        self.group_sizes = []
+        free = len(DARK_SQUARES)
+        for count in material:
+            self.group_sizes.append(comb(free, count))
+            free -= count
+        self.positions = 1
+        for size in self.group_sizes:
+            self.positions *= size
+        # Кожна позиція - двічі: з ходом білих і з ходом чорних
+        self.size = self.positions * 2
+
+    def index(self, white, black, kings, player):
+        """
+        Обчислює номер позиції
+
+        Returns:
+            int: Номер від 0 до size - 1 або None, якщо фігура стоїть на світлій
+                клітинці (такої позиції немає в таблиці)
+        """
+        if (white | black) & ~DARK_MASK:
+            return None
+        groups = (white & ~kings, white & kings, black & ~kings, black & kings)
+        placed = 0
+        number = 0
+        for group, size in zip(groups, self.group_sizes):
+            rank = 0
+            i = 0
+            bits = group
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                # Позиція клітинки серед ще вільних темних клітинок
+                position = DARK_INDEX[bit.bit_length() - 1] - _popcount(placed & (bit - 1))
+                i += 1
+                rank += comb(position, i)
+            number = number * size + rank
+            placed |= group
+        return number * 2 + (player == "black")
+
+    def position(self, number):
+        """
+        Відновлює позицію за номером
+
+        Returns:
+            tuple: Бітборди (white, black, kings) і гравець, який ходить
+        """
+        player = "black" if number & 1 else "white"
+        number //= 2
+        ranks = []
+        for size in reversed(self.group_sizes):
+            ranks.append(number % size)
+            number //= size
+        ranks.reverse()
+        free = list(DARK_SQUARES)
+        groups = []
+        for rank, count in zip(ranks, self.material):
+            chosen = []
+            for i in range(count, 0, -1):
+                # Найбільше c, для якого comb(c, i) <= rank
+                c = i - 1
+                while comb(c + 1, i) <= rank:
+                    c += 1
+                rank -= comb(c, i)
+                chosen.append(c)
+            bits = 0
+            for position in chosen:
+                bits |= 1 << free[position]
+            for position in sorted(chosen, reverse=True):
+                del free[position]
+            groups.append(bits)
+        white_men, white_kings, black_men, black_kings = groups
+        return white_men | white_kings, black_men | black_kings, white_kings | black_kings, player
+
+
+def dependencies(material):
+    """
+    Перелічує склади, у які можна потрапити зі складу взяттями і
+    перетвореннями на дамку (разом із самим складом), у порядку побудови
+
+    Args:
+        material (tuple): Склад (wm, wk, bm, bk)
+
+    Returns:
+        list: Склади (wm, wk, bm, bk)
+    """
+    white_men, white_kings, black_men, black_kings = material
+    return [
+        other for other in all_materials(sum(material))
+        if other[0] <= white_men and other[0] + other[1] <= white_men + white_kings
+        and other[2] <= black_men and other[2] + other[3] <= black_men + black_kings
+    ]
+
+
+def build_table(material, tables):
+    """
+    Будує таблицю складу ретроградним аналізом
+
+    Спершу кожна позиція один раз генерує ходи: ходи в інші склади одразу
+    дають результат з уже побудованих таблиць, ходи в межах складу
+    запам'ятовуються як ребра. Далі результати поширюються від відомих
+    позицій до їх попередників у порядку зростання відстані, доки нічого
+    не змінюється; позиції, що лишилися невизначеними, - нічиї.
+
+    Args:
+        material (tuple): Склад (wm, wk, bm, bk)
+        tables (dict): Уже побудовані склади -> (MaterialIndex, байти таблиці)
+
+    Returns:
+        bytearray: По байту на позицію
+    """
+    index = MaterialIndex(material)
+    size = index.size
+    result = bytearray(size)
+    distance = array("H", bytes(2 * size))
+    remaining = array("H", bytes(2 * size))
+    has_draw = bytearray(size)
+    finalized = bytearray(size)
+    edge_child = array("I")
+    edge_parent = array("I")
+    queue = []
+    board = SearchBoard(0, 0, 0, "white")
+
+    for number in range(size):
+        white, black, kings, player = index.position(number)
+        # Шашка в ряду перетворення вже була б дамкою - позиції не буває
+        if white & ~kings & PROMOTION_MASK["white"] or black & ~kings & PROMOTION_MASK["black"]:
+            continue
+        moves = generate_search_moves(white, black, kings, player)
+        if not moves:
+            result[number] = LOSS
+            heapq.heappush(queue, (0, number))
+            continue
+        board.white, board.black, board.kings, board.player = white, black, kings, player
+        best_win = None
+        longest_loss = 0
+        in_table = 0
+        for move in moves:
+            board.make(move)
+            opponent = board.white if board.player == "white" else board.black
+            if not opponent:
+                child_result, child_distance = LOSS, 0
+            else:
+                child_material = material_of(board.white, board.black, board.kings)
+                if child_material == material:
+                    edge_child.append(index.index(board.white, board.black, board.kings, board.player))
+                    edge_parent.append(number)
+                    in_table += 1
+                    board.unmake()
+                    continue
+                child_index, child_table = tables[child_material]
+                child_result, child_distance = decode_result(
+                    child_table[child_index.index(board.white, board.black, board.kings, board.player)])
+            board.unmake()
+            if child_result == LOSS:
+                if best_win is None or child_distance < best_win:
+                    best_win = child_distance
+            elif child_result == WIN:
+                longest_loss = max(longest_loss, child_distance)
+            else:
+                has_draw[number] = 1
+        remaining[number] = in_table
+        distance[number] = longest_loss
+        if best_win is not None:
+            result[number] = WIN
+            distance[number] = best_win + 1
+            heapq.heappush(queue, (best_win + 1, number))
+        elif not in_table and not has_draw[number]:
+            result[number] = LOSS
+            distance[number] = longest_loss + 1
+            heapq.heappush(queue, (longest_loss + 1, number))
+
+    # Попередники кожної позиції в межах складу (стиснені рядки)
+    offsets = array("I", bytes(4 * (size + 1)))
+    for child in edge_child:
+        offsets[child + 1] += 1
+    for number in range(size):
+        offsets[number + 1] += offsets[number]
+    predecessors = array("I", bytes(4 * len(edge_child)))
+    fill = array("I", offsets)
+    for child, parent in zip(edge_child, edge_parent):
+        predecessors[fill[child]] = parent
+        fill[child] += 1
+    del edge_child, edge_parent, fill
+
+    while queue:
+        child_distance, number = heapq.heappop(queue)
+        if finalized[number] or distance[number] != child_distance:
+            continue
+        finalized[number] = 1
+        child_result = result[number]
+        for parent in predecessors[offsets[number]:offsets[number + 1]]:
+            if finalized[parent]:
+                continue
+            if child_result == LOSS:
+                # Хід у програшну для суперника позицію - виграш
+                if result[parent] != WIN or distance[parent] > child_distance + 1:
+                    result[parent] = WIN
+                    distance[parent] = child_distance + 1
+                    heapq.heappush(queue, (child_distance + 1, parent))
+            else:
+                remaining[parent] -= 1
+                if result[parent] == WIN:
+                    continue
+                distance[parent] = max(distance[parent], child_distance)
+                # Усі ходи ведуть до виграшу суперника - програш, якомога пізніший
+                if not remaining[parent] and not has_draw[parent]:
+                    result[parent] = LOSS
+                    distance[parent] += 1
+                    heapq.heappush(queue, (distance[parent], parent))
+
+    table = bytearray(size)
+    for number in range(size):
+        if result[number] != DRAW:
+            table[number] = encode_result(result[number], distance[number])
+    return table
+
+
+def generate_tablebases(directory, max_pieces=4, materials=None, log=print):
+    """
+    Будує і записує таблиці складів фігур
+
+    Уже записані таблиці не перебудовуються, а читаються з файлів.
+
+    Args:
+        directory (str): Каталог для файлів таблиць
+        max_pieces (int): Найбільша кількість фігур на дошці
+        materials (list): Лише ці склади (разом з тими, від яких вони
+            залежать) замість усіх складів до max_pieces фігур
+        log (callable): Функція для повідомлень про хід побудови або None
+    """
+    if materials is None:
+        order = all_materials(max_pieces)
+    else:
+        needed = set()
+        for material in materials:
+            needed.update(dependencies(tuple(material)))
+        order = [material for material in all_materials(max(map(sum, needed))) if material in needed]
+    os.makedirs(directory, exist_ok=True)
+    tables = {}
+    for material in order:
+        path = os.path.join(directory, table_name(material))
+        if os.path.exists(path):
+            with open(path, "rb") as table_file:
+                table = bytearray(table_file.read()[HEADER_SIZE:])
+        else:
+            table = build_table(material, tables)
+            with open(path, "wb") as table_file:
+                table_file.write(TABLE_MAGIC + bytes(material) + table)
+            if log:
+                log(f"{table_name(material)}: {len(table)} позицій")
+        tables[material] = (MaterialIndex(material), table)
+
+
+class Tablebases:
+    """
+    Таблиці ендшпілю з каталогу, відкриті через mmap
+    """
+    def __init__(self, directory):
+        """
+        Знаходить таблиці в каталозі (файли відкриваються при першому зверненні)
+
+        Args:
+            directory (str): Каталог з файлами таблиць
+        """
+        self.directory = directory
+        self.paths = {}
+        for name in os.listdir(directory):
+            parts = name[:-len(".bin")].split("_")
+            if name.startswith("tb_") and name.endswith(".bin") and len(parts) == 5:
+                self.paths[tuple(int(part) for part in parts[1:])] = os.path.join(directory, name)
+        self.max_pieces = max((sum(material) for material in self.paths), default=0)
+        self._tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """
+        Закриває відображення файлів
+        """
+        for _, table_map in self._tables.values():
+            table_map.close()
+        self._tables = {}
+
+    def _table(self, material):
+        table = self._tables.get(material)
+        if table is None:
+            with open(self.paths[material], "rb") as table_file:
+                table_map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if table_map[:HEADER_SIZE] != TABLE_MAGIC + bytes(material):
+                table_map.close()
+                raise Exception(f"Файл {self.paths[material]} не є таблицею складу {material}")
+            table = self._tables[material] = (MaterialIndex(material), table_map)
+        return table
+
+    def probe(self, white, black, kings, player):
+        """
+        Шукає результат позиції
+
+        Args:
+            white (int): Бітборд білих фігур
+            black (int): Бітборд чорних фігур
+            kings (int): Бітборд дамок
+            player (str): Гравець, який ходить ('white' або 'black')
+
+        Returns:
+            tuple: Результат для гравця, який ходить (DRAW, WIN або LOSS), і
+                кількість півходів до кінця гри, або None, якщо таблиці немає
+                або позиції немає в таблиці
+        """
+        material = material_of(white, black, kings)
+        if material not in self.paths:
+            self.misses += 1
+            return None
+        index, table_map = self._table(material)
+        number = index.index(white, black, kings, player)
+        if number is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode_result(table_map[HEADER_SIZE + number])
+
+    def best_move(self, position):
+        """
+        Вибирає найкращий хід за таблицями: найшвидший виграш, інакше нічия,
+        інакше найдовший опір
+
+        Args:
+            position (SearchBoard): Позиція
+
+        Returns:
+            tuple: Хід (Move), результат і відстань для гравця, який ходить,
+                або None, якщо позиції чи її наслідків немає в таблицях
+        """
+        if self.probe(position.white, position.black, position.kings, position.player) is None:
+            return None
+        best = None
+        for move in position.moves():
+            position.make(move)
+            try:
+                opponent = position.white if position.player == "white" else position.black
+                if opponent:
+                    child = self.probe(position.white, position.black, position.kings, position.player)
+                else:
+                    child = (LOSS, 0)
+            finally:
+                position.unmake()
+            if child is None:
+                return None
+            child_result, child_distance = child
+            # Результат для того, хто ходить: програш суперника - наш виграш
+            if child_result == LOSS:
+                rank = (2, -child_distance)
+                outcome = (WIN, child_distance + 1)
+            elif child_result == DRAW:
+                rank = (1, 0)
+                outcome = (DRAW, 0)
+            else:
+                rank = (0, child_distance)
+                outcome = (LOSS, child_distance + 1)
+            if best is None or rank > best[0]:
+                best = (rank, move, outcome)
+        if best is None:
+            return None
+        return (best[1],) + best[2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Побудова баз ендшпілю ретроградним аналізом")
+    parser.add_argument("--directory", default="tablebases", help="каталог для файлів таблиць")
+    parser.add_argument("--pieces", type=int, default=4, help="найбільша кількість фігур на дошці")
+    args = parser.parse_args()
+    generate_tablebases(args.directory, args.pieces)
+
+
+if __name__ == "__main__":
+    main()
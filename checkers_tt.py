@@ -0,0 +1,176 @@
+# Файл: checkers_tt.py
+"""
+Таблиця транспозицій для пошуку AI.
+
+Позиції ідентифікуються 64-бітним хешем Зобріста. З нуля він обчислюється
+hash_bitboards, а після кожного ходу SearchBoard.make оновлює його
+інкрементально: XOR ключа фігури на старій клітинці, на новій клітинці,
+ключів взятих фігур та ключа черги ходу.
+"""
+import random
+
+# Фігури, для яких генеруються ключі Зобріста
+PIECES = ("w", "wk", "b", "bk")
+
+# Зерно генератора ключів: хеші однакові між запусками та процесами
+DEFAULT_SEED = 0x5EED_C0DE
+
+# Тип оцінки, збереженої в таблиці
+EXACT = 0
+LOWER_BOUND = 1  # Оцінка не менша за збережену (відсікання за бетою)
+UPPER_BOUND = 2  # Оцінка не більша за збережену (жоден хід не покращив альфу)
+
+# Приблизний розмір одного запису в пам'яті Python (кортеж з п'яти полів
+# разом з 64-бітним ключем, оцінкою і ходом), байтів
+ENTRY_BYTES = 200
+# Записів у кошику: один із заміною за глибиною, один із заміною завжди
+BUCKET_SIZE = 2
+
+
+class ZobristKeys:
+    """
+    Випадкові 64-бітні ключі для кожної пари (фігура, клітинка) і черги ходу
+    """
+    def __init__(self, seed=DEFAULT_SEED):
+        """
+        Генерує ключі детерміновано із зерна
+
+        Args:
+            seed (int): Зерно генератора випадкових чисел
+        """
+        rng = random.Random(seed)
+        # Клітинка (X, Y) має номер (Y - 1) * 8 + (X - 1), як у бітбордах
+        self.pieces = {piece: [rng.getrandbits(64) for _ in range(64)] for piece in PIECES}
+        # Додається до хешу, коли ходять чорні
+        self.black_to_move = rng.getrandbits(64)
+
+    def hash_bitboards(self, white, black, kings, player):
+        """
+        Обчислює хеш позиції з нуля
+
+        Args:
+            white (int): Бітборд білих фігур
+            black (int): Бітборд чорних фігур
+            kings (int): Бітборд дамок
+            player (str): Гравець, який ходить ('white' або 'black')
+
+        Returns:
+            int: 64-бітний хеш позиції
+        """
+        key = self.black_to_move if player == "black" else 0
+        for pieces, man, king in ((white, "w", "wk"), (black, "b", "bk")):
+            while pieces:
+                bit = pieces & -pieces
+                pieces ^= bit
+                sq = bit.bit_length() - 1
+                key ^= self.pieces[king if kings & bit else man][sq]
+        return key
+
+
+class TranspositionTable:
+    """
+    Таблиця транспозицій фіксованого розміру з обмеженням пам'яті
+
+    Кожен кошик має два записи: перший замінюється лише записом з
+    не меншою глибиною пошуку (або тієї ж позиції), другий - завжди.
+    Запис - кортеж (key, depth, flag, score, move).
+    """
+    def __init__(self, max_memory_mb=16):
+        """
+        Створює порожню таблицю
+
+        Args:
+            max_memory_mb (float): Обмеження пам'яті таблиці в мегабайтах
+        """
+        self.max_memory_mb = max_memory_mb
+        self.bucket_count = max(1, int(max_memory_mb * 1024 * 1024) // (ENTRY_BYTES * BUCKET_SIZE))
+        self.entries = [None] * (self.bucket_count * BUCKET_SIZE)
+        self.reset_counters()
+
+    def reset_counters(self):
+        """
+        Обнуляє лічильники звернень
+        """
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def clear(self):
+        """
+        Очищає таблицю та лічильники
+        """
+        self.entries = [None] * (self.bucket_count * BUCKET_SIZE)
+        self.reset_counters()
+
+    def probe(self, key):
+        """
+        Шукає запис позиції
+
+        Args:
+            key (int): Хеш позиції
+
+        Returns:
+            tuple: Запис (key, depth, flag, score, move) або None
+        """
+        index = (key % self.bucket_count) * BUCKET_SIZE
+        for entry in (self.entries[index], self.entries[index + 1]):
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        """
+        Зберігає результат пошуку позиції
+
+        Args:
+            key (int): Хеш позиції
+            depth (int): Глибина, на яку шукали
+            flag (int): EXACT, LOWER_BOUND або UPPER_BOUND
+            score (float): Оцінка позиції
+            move (Move): Найкращий хід або None
+        """
+        index = (key % self.bucket_count) * BUCKET_SIZE
+        entry = (key, depth, flag, score, move)
+        self.stores += 1
+        deep = self.entries[index]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            if deep is not None and deep[0] != key:
+                # Витіснений глибокий запис ще корисний - переносимо його
+                # на місце запису з заміною завжди
+                self.entries[index + 1] = deep
+                self.replacements += 1
+            self.entries[index] = entry
+        else:
+            if self.entries[index + 1] is not None and self.entries[index + 1][0] != key:
+                self.replacements += 1
+            self.entries[index + 1] = entry
+
+    def hit_rate(self):
+        """
+        Частка успішних звернень до таблиці
+
+        Returns:
+            float: Від 0.0 до 1.0
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats(self):
+        """
+        Повертає лічильники таблиці
+
+        Returns:
+            dict: Розмір, заповненість, звернення, влучання і заміни
+        """
+        return {
+            "capacity": len(self.entries),
+            "filled": sum(entry is not None for entry in self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "stores": self.stores,
+            "replacements": self.replacements,
+        }
@@ -0,0 +1,314 @@
+# Файл: test_ai.py
+import time
+import random
+import unittest
+from checkers_bitboard import BitboardInterface, Move, SearchBoard
+from checkers_ai import PIECE_SQUARE_VALUES, WIN_SCORE, CheckersAI
+
+
+class TestIterativeDeepening(unittest.TestCase):
+    """
+    Клас для тестування пошуку ходу AI з обмеженням часу
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        board = self.interface.get_initial_board()
+        self.board = self.interface.make_move(board, 3, 6, 4, 5, "white")
+        self.ai = CheckersAI("medium", interface=self.interface)
+
+    def test_fixed_depth(self):
+        """
+        Без обмеження часу пошук доходить до заданої глибини
+        """
+        new_board, move = self.ai.make_best_move(self.board, max_depth=3)
+        self.assertEqual(self.ai.last_depth, 3)
+        self.assertIn(move, self.interface.legal_moves(self.board, "black"))
+        self.assertEqual(new_board, self.interface.make_move(self.board, *move, "black"))
+
+    def test_time_budget(self):
+        """
+        Пошук завершується приблизно за відведений час і повертає допустимий хід
+        """
+        started = time.perf_counter()
+        _, move = self.ai.make_best_move(self.board, time_budget=0.1)
+        elapsed = time.perf_counter() - started
+        self.assertLess(elapsed, 1.0)
+        self.assertGreaterEqual(self.ai.last_depth, 1)
+        self.assertIn(move, self.interface.legal_moves(self.board, "black"))
+
+    def test_single_move(self):
+        """
+        Єдиний допустимий хід повертається без пошуку
+        """
+        board = self.interface.get_empty_board()
+        board[0][0] = "b"
+        board[7][7] = "w"
+        _, move = self.ai.make_best_move(board, time_budget=10)
+        self.assertEqual(move, (1, 1, 2, 2))
+        self.assertEqual(self.ai.last_depth, 0)
+
+    def test_no_moves(self):
+        """
+        Без допустимих ходів AI не ходить
+        """
+        board = self.interface.get_empty_board()
+        board[7][0] = "b"
+        self.assertEqual(self.ai.make_best_move(board), (None, (None, None, None, None)))
+
+    def test_terminal_positions(self):
+        """
+        Гравець без ходів програє; швидший виграш оцінюється вище
+        """
+        board = self.interface.get_empty_board()
+        board[1][1] = "b"
+        board[2][2] = "w"
+        position = SearchBoard.from_board(board, "black", self.ai.zobrist, PIECE_SQUARE_VALUES)
+        score, move = self.ai.minimax(position, 3, float('-inf'), float('inf'), True)
+        self.assertEqual(score, WIN_SCORE - 1)
+        self.assertEqual(move, Move((9, 27), (18,)))
+        board = self.interface.get_empty_board()
+        board[7][0] = "b"
+        board[0][7] = "w"
+        position = SearchBoard.from_board(board, "black", self.ai.zobrist, PIECE_SQUARE_VALUES)
+        self.assertEqual(self.ai.minimax(position, 3, float('-inf'), float('inf'), True)[0], -WIN_SCORE)
+
+    def test_parallel_search(self):
+        """
+        Паралельний пошук ходів кореня дає ту саму оцінку, що й послідовний
+        """
+        parallel = CheckersAI("medium", interface=self.interface, workers=2)
+        try:
+            _, move = parallel.make_best_move(self.board, max_depth=3)
+        finally:
+            parallel.close()
+        self.ai.make_best_move(self.board, max_depth=3)
+        self.assertEqual(parallel.last_depth, 3)
+        self.assertEqual(parallel.last_score, self.ai.last_score)
+        self.assertIn(move, self.interface.legal_moves(self.board, "black"))
+        # Влучання в таблиці і відсікання процесів-виконавців доходять до кореня
+        stats = parallel.last_stats
+        self.assertGreater(stats.tt_probes, 0)
+        self.assertGreater(stats.ordering_cutoffs, 0)
+        self.assertEqual(stats.ordering_cutoffs, stats.beta_cutoffs)
+
+    def test_quiescence(self):
+        """
+        Пошук спокою доводить обмін взяттями до тихої позиції
+        """
+        board = self.interface.get_empty_board()
+        board[1][1] = "b"
+        board[2][2] = "w"
+        board[2][4] = "w"
+        board[1][5] = "w"
+        board[7][7] = "b"
+        position = SearchBoard.from_board(board, "black", values=PIECE_SQUARE_VALUES)
+        # Чорні беруть (2,2) -> (4,4), білі відповідають (5,3) -> (3,5)
+        position.make(Move((9, 27), (18,)))
+        position.make(Move((20, 34), (27,)))
+        expected = self.ai.evaluate_position(position)
+        position.unmake()
+        position.unmake()
+        score = self.ai.quiescence(position, float('-inf'), float('inf'), True)
+        self.assertEqual(score, expected)
+        self.assertEqual(self.ai.quiescence_nodes, 3)
+        # Без взять пошук спокою повертає статичну оцінку
+        quiet = SearchBoard.from_board(self.board, "black", values=PIECE_SQUARE_VALUES)
+        self.assertEqual(self.ai.quiescence(quiet, float('-inf'), float('inf'), True),
+                         self.ai.evaluate_position(quiet))
+
+
+class TestPrincipalVariationSearch(unittest.TestCase):
+    """
+    Клас для тестування пошуку головного варіанту
+    """
+    def test_same_score(self):
+        """
+        PVS з вікнами аспірації знаходить ту саму оцінку, що й альфа-бета
+        """
+        interface = BitboardInterface()
+        alphabeta = CheckersAI("hard", interface=interface, tt_size_mb=0)
+        pvs = CheckersAI("hard", interface=interface, tt_size_mb=0, algorithm="pvs")
+        rng = random.Random(5)
+        board = interface.get_initial_board()
+        player = "white"
+        for _ in range(12):
+            if player == "black":
+                alphabeta.make_best_move(board, max_depth=5)
+                pvs.make_best_move(board, max_depth=5)
+                self.assertEqual(pvs.last_score, alphabeta.last_score)
+                self.assertEqual(pvs.last_depth, 5)
+            moves = interface.legal_moves(board, player)
+            if not moves:
+                break
+            board = interface.make_move(board, *rng.choice(moves), player)
+            player = "black" if player == "white" else "white"
+
+    def test_unknown_algorithm(self):
+        """
+        Невідомий алгоритм пошуку відхиляється
+        """
+        with self.assertRaises(ValueError):
+            CheckersAI("hard", interface=BitboardInterface(), algorithm="mtdf")
+
+
+class TestSelectiveSearch(unittest.TestCase):
+    """
+    Клас для тестування скорочення пізніх ходів і нульового ходу
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        board = self.interface.get_initial_board()
+        self.board = self.interface.make_move(board, 3, 6, 4, 5, "white")
+
+    def test_selective_search(self):
+        """
+        Вибірковий пошук шукає менше вузлів на ту саму глибину і звітує про скорочення
+        """
+        full = CheckersAI("hard", interface=self.interface)
+        selective = CheckersAI("hard", interface=self.interface, selective={"lmr_reduction": 2})
+        full.make_best_move(self.board, max_depth=7)
+        _, move = selective.make_best_move(self.board, max_depth=7)
+        stats = selective.last_stats
+        self.assertEqual(stats.depth, 7)
+        self.assertIn(move, self.interface.legal_moves(self.board, "black"))
+        self.assertLess(stats.nodes, full.last_stats.nodes)
+        self.assertGreater(stats.lmr_reductions, 0)
+        self.assertGreater(stats.null_move_tries, 0)
+        self.assertEqual(stats.selective["lmr_reduction"], 2)
+        self.assertIsNone(full.last_stats.selective)
+
+    def test_null_move_endgame(self):
+        """
+        В ендшпілі з кількох фігур нульовий хід не пробується
+        """
+        board = self.interface.get_empty_board()
+        board[1][1] = "b"
+        board[3][5] = "bk"
+        board[6][6] = "w"
+        board[7][2] = "wk"
+        ai = CheckersAI("hard", interface=self.interface, selective=True)
+        ai.make_best_move(board, max_depth=6)
+        self.assertEqual(ai.last_stats.null_move_tries, 0)
+
+    def test_null_move_restores_position(self):
+        """
+        Нульовий хід передає хід суперникові і скасовується без змін
+        """
+        position = SearchBoard.from_board(self.board, "black", CheckersAI("hard", interface=self.interface).zobrist)
+        key = position.key
+        position.make_null()
+        self.assertEqual(position.player, "white")
+        self.assertNotEqual(position.key, key)
+        position.unmake_null()
+        self.assertEqual((position.player, position.key), ("black", key))
+
+    def test_unknown_parameter(self):
+        """
+        Невідомий параметр вибіркового пошуку відхиляється
+        """
+        with self.assertRaises(ValueError):
+            CheckersAI("hard", interface=self.interface, selective={"futility_margin": 100})
+
+
+class TestSearchStats(unittest.TestCase):
+    """
+    Клас для тестування статистики пошуку
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        board = self.interface.get_initial_board()
+        self.board = self.interface.make_move(board, 3, 6, 4, 5, "white")
+
+    def test_stats(self):
+        """
+        Кожен пошук повертає статистику, узгоджену з лічильниками AI
+        """
+        reports = []
+        ai = CheckersAI("medium", interface=self.interface, progress=reports.append)
+        ai.make_best_move(self.board, max_depth=4)
+        stats = ai.last_stats
+        self.assertEqual(stats.depth, 4)
+        self.assertEqual(stats.score, ai.last_score)
+        self.assertEqual(stats.nodes, ai.search_nodes + ai.quiescence_nodes)
+        self.assertEqual(sum(stats.iteration_nodes), stats.nodes)
+        self.assertEqual(len(stats.iteration_nodes), 4)
+        self.assertGreater(stats.leaf_evaluations, 0)
+        self.assertGreater(stats.nodes_per_second(), 0)
+        self.assertGreater(stats.effective_branching_factor(), 1)
+        self.assertTrue(0 < stats.cutoff_rate() <= 1)
+        self.assertGreater(stats.tt_probes, 0)
+        self.assertEqual(stats.movegen_time, 0.0, "Без profile час не вимірюється")
+        # Повідомлення після кожної ітерації
+        self.assertGreaterEqual(len(reports), 4)
+        self.assertIs(reports[-1], stats)
+        self.assertEqual(stats.to_dict()["nodes"], stats.nodes)
+
+    def test_profile(self):
+        """
+        З profile пошук вимірює час генерації ходів, виконання ходів і оцінки
+        """
+        ai = CheckersAI("medium", interface=self.interface, profile=True)
+        plain = CheckersAI("medium", interface=self.interface)
+        ai.make_best_move(self.board, max_depth=3)
+        plain.make_best_move(self.board, max_depth=3)
+        stats = ai.last_stats
+        self.assertEqual(stats.nodes, plain.last_stats.nodes)
+        self.assertEqual(stats.score, plain.last_stats.score)
+        self.assertGreater(stats.movegen_time, 0)
+        self.assertGreater(stats.make_time, 0)
+        self.assertGreater(stats.eval_time, 0)
+        self.assertLess(stats.movegen_time + stats.make_time + stats.eval_time, stats.elapsed)
+
+
+class TestSearchEvaluation(unittest.TestCase):
+    """
+    Клас для тестування оцінки позицій пошуку
+    """
+    def test_matches_evaluate_board(self):
+        """
+        Оцінка з бітбордів збігається з evaluate_board на списку списків
+        """
+        interface = BitboardInterface()
+        ai = CheckersAI("medium", interface=interface)
+        rng = random.Random(5)
+        for _ in range(50):
+            board = interface.get_empty_board()
+            for y in range(1, 9):
+                for x in range(1, 9):
+                    if rng.random() < 0.3:
+                        board[y - 1][x - 1] = rng.choice(["w", "b", "wk", "bk"])
+            position = SearchBoard.from_board(board, "black", values=PIECE_SQUARE_VALUES)
+            self.assertEqual(ai.evaluate_position(position), ai.evaluate_board(board))
+
+    def test_incremental_score(self):
+        """
+        Оцінка, оновлена ходами і скасуваннями, збігається з обчисленою з нуля
+        """
+        interface = BitboardInterface()
+        rng = random.Random(8)
+        for _ in range(20):
+            position = SearchBoard.from_board(interface.get_initial_board(), "white", values=PIECE_SQUARE_VALUES)
+            made = 0
+            for _ in range(60):
+                moves = position.moves()
+                if not moves:
+                    break
+                position.make(rng.choice(moves))
+                made += 1
+                self.assertEqual(position.score, position.static_score(PIECE_SQUARE_VALUES))
+            for _ in range(made):
+                position.unmake()
+                self.assertEqual(position.score, position.static_score(PIECE_SQUARE_VALUES))
+
+
+if __name__ == "__main__":
+    unittest.main()
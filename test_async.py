@@ -0,0 +1,213 @@
+# Файл: test_async.py
+import time
+import unittest
+from checkers_bitboard import BitboardInterface, SearchBoard
+from checkers_async import AsyncSearch, Ponderer
+from checkers_ai import MAX_SEARCH_DEPTH, CheckersAI
+
+
+class TestAsyncSearch(unittest.TestCase):
+    """
+    Клас для тестування пошуку ходу у фоновому потоці
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.board = self.interface.make_move(self.interface.get_initial_board(), 3, 6, 4, 5, "white")
+        self.ai = CheckersAI("medium", interface=self.interface)
+        self.search = AsyncSearch(self.ai)
+
+    def tearDown(self):
+        """
+        Зупинка потоку пошуку
+        """
+        self.search.shutdown()
+
+    def wait(self, timeout):
+        """
+        Опитує пошук, як кадри графічного інтерфейсу
+        """
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            done, move = self.search.poll()
+            if done:
+                return move
+            time.sleep(0.01)
+        self.fail("Пошук не завершився вчасно")
+
+    def test_poll_until_done(self):
+        """
+        Пошук не блокує виклик, а хід забирається опитуванням
+        """
+        self.search.start(self.board)
+        self.assertTrue(self.search.running)
+        move = self.wait(5)
+        self.assertFalse(self.search.running)
+        new_board, coords = self.ai.apply_move(self.board, move)
+        self.assertIn(coords, self.interface.legal_moves(self.board, "black"))
+        self.assertEqual(new_board, self.interface.make_move(self.board, *coords, "black"))
+
+        # Той самий хід на збереженій дошці (так його виконує графічний інтерфейс)
+        handle = self.interface.new_board_handle(self.board)
+        self.assertEqual(self.ai.apply_move(self.board, move, handle), (new_board, coords))
+        self.assertEqual(self.interface.get_handle_board(handle), new_board)
+        self.interface.release_board_handle(handle)
+
+    def test_cancel(self):
+        """
+        Скасований пошук швидко звільняє потік, а його результат відкидається
+        """
+        self.ai.time_map["hard"] = 60
+        self.ai.set_difficulty("hard")
+        self.search.start(self.board)
+        time.sleep(0.1)
+        started = time.perf_counter()
+        self.search.cancel()
+        self.assertEqual(self.search.poll(), (False, None))
+        # Новий пошук чекає, доки скасований звільнить AI
+        self.ai.set_difficulty("medium")
+        self.search.start(self.board)
+        self.assertIsNotNone(self.wait(5))
+        self.assertLess(time.perf_counter() - started, 5)
+
+    def test_stop_parallel(self):
+        """
+        Пошук у процесах-виконавцях без обмеження часу зупиняється скасуванням
+        """
+        ai = CheckersAI("hard", interface=self.interface, workers=2, profile=True)
+        search = AsyncSearch(ai)
+        try:
+            search.start(self.board, lambda board: ai.choose_best_move(board, max_depth=MAX_SEARCH_DEPTH))
+            time.sleep(1.0)
+            started = time.perf_counter()
+            move = search.stop()
+            self.assertLess(time.perf_counter() - started, 2)
+            self.assertIn(move, SearchBoard.from_board(self.board, "black").moves())
+            self.assertGreaterEqual(ai.last_depth, 1)
+            self.assertGreater(ai.last_stats.movegen_time, 0)
+            # Після скасування процеси знову шукають до кінця
+            ai.choose_best_move(self.board, max_depth=3)
+            self.assertEqual(ai.last_depth, 3)
+        finally:
+            search.shutdown()
+            ai.close()
+
+
+class TestPonderer(unittest.TestCase):
+    """
+    Клас для тестування обдумування під час ходу людини
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.board = self.interface.get_initial_board()
+        self.ai = CheckersAI("medium", interface=self.interface)
+        self.ai.time_map["medium"] = 0.1
+        self.search = AsyncSearch(self.ai)
+        self.ponderer = Ponderer(self.search)
+
+    def tearDown(self):
+        """
+        Зупинка потоку пошуку
+        """
+        self.search.shutdown()
+
+    def wait_ponder(self):
+        """
+        Чекає, доки обдумування завершиться саме
+        """
+        deadline = time.perf_counter() + 5
+        while not self.search._future.done():
+            self.assertLess(time.perf_counter(), deadline, "Обдумування не завершилося вчасно")
+            time.sleep(0.01)
+
+    def test_hit(self):
+        """
+        Передбачений хід людини отримує готову відповідь
+        """
+        self.ponderer.start(self.board)
+        time.sleep(0.5)
+        predicted = self.ponderer.predicted_board
+        self.assertIsNotNone(predicted)
+        move = self.ponderer.finish(predicted)
+        self.assertIsNotNone(move)
+        self.assertIn(self.ai.apply_move(predicted, move)[1], self.interface.legal_moves(predicted, "black"))
+        self.assertEqual((self.ponderer.hits, self.ponderer.misses), (1, 0))
+        self.assertFalse(self.search.running)
+
+    def test_miss(self):
+        """
+        Інший хід людини - звичайний пошук з заповненою таблицею
+        """
+        self.ponderer.start(self.board)
+        time.sleep(0.2)
+        for move in self.interface.legal_moves(self.board, "white"):
+            board = self.interface.make_move(self.board, *move, "white")
+            if board != self.ponderer.predicted_board:
+                break
+        self.assertIsNone(self.ponderer.finish(board))
+        self.assertGreater(self.ai.tt.stores, 0)
+        self.assertEqual(self.ponderer.hit_rate(), 0.0)
+        # Без обдумування finish нічого не рахує
+        self.assertIsNone(self.ponderer.finish(board))
+        self.assertEqual(self.ponderer.misses, 1)
+
+    def test_no_prediction(self):
+        """
+        Обдумування без передбаченого ходу не рахується ні влученням, ні промахом
+        """
+        board = self.interface.get_empty_board()
+        board[1][1] = "b"
+        self.ponderer.start(board)
+        self.wait_ponder()
+        self.assertIsNone(self.ponderer.predicted_board)
+        self.assertIsNone(self.ponderer.finish(board))
+        self.assertEqual((self.ponderer.hits, self.ponderer.misses), (0, 0))
+
+    def test_max_time(self):
+        """
+        Без ходу людини обдумування завершується саме
+        """
+        self.ai.time_map["medium"] = 0.05
+        ponderer = Ponderer(self.search, max_time=0.2)
+        ponderer.start(self.board)
+        self.wait_ponder()
+        self.assertIsNotNone(ponderer.predicted_board)
+        self.assertIsNotNone(ponderer.finish(ponderer.predicted_board))
+
+    def test_book_move(self):
+        """
+        На передбачену позицію обдумування відповідає ходом з книги, як
+        choose_move, навіть коли пошук вибрав би інший хід
+        """
+        book = LastMoveBook()
+        self.ai.book = book
+        self.ponderer.start(self.board)
+        self.wait_ponder()
+        predicted = self.ponderer.predicted_board
+        move = self.ponderer.finish(predicted)
+        self.assertEqual(move, book.chosen)
+        self.assertEqual(self.ponderer.pondered_source, "book")
+
+        searched = CheckersAI("medium", interface=self.interface).choose_best_move(predicted, max_depth=4)
+        self.assertNotEqual(searched, move)
+
+
+class LastMoveBook:
+    """
+    Книга, що на будь-яку позицію радить останній згенерований хід
+    """
+    def __init__(self):
+        self.chosen = None
+
+    def choose(self, position):
+        self.chosen = position.moves()[-1]
+        return self.chosen
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# Файл: test_backend.py
+import os
+import unittest
+from unittest.mock import patch
+from checkers_backend import BACKEND_ENV_VAR, create_interface, get_interface, reset_interfaces, resolve_backend
+from checkers_bitboard import BitboardInterface
+from checkers_ai import CheckersAI
+
+
+class TestBackendSelection(unittest.TestCase):
+    """
+    Клас для тестування вибору та спільного використання бекенду правил
+    """
+    def setUp(self):
+        """
+        Кожен тест починає з порожнього реєстру
+        """
+        reset_interfaces()
+
+    def tearDown(self):
+        reset_interfaces()
+
+    def test_resolve_backend(self):
+        """
+        Бекенд обирається параметром або змінною середовища
+        """
+        with patch.dict(os.environ, {BACKEND_ENV_VAR: "Bitboard"}):
+            self.assertEqual(resolve_backend(), "bitboard")
+            self.assertEqual(resolve_backend("prolog"), "prolog")
+        with self.assertRaises(ValueError):
+            resolve_backend("lisp")
+
+    def test_shared_interface(self):
+        """
+        get_interface повертає один екземпляр, create_interface - новий
+        """
+        shared = get_interface("bitboard")
+        self.assertIsInstance(shared, BitboardInterface)
+        self.assertIs(get_interface("bitboard"), shared)
+        self.assertIsNot(create_interface("bitboard"), shared)
+
+    def test_ai_reuses_interface(self):
+        """
+        AI та зміна складності не створюють новий інтерфейс
+        """
+        shared = get_interface("bitboard")
+        ai = CheckersAI("easy", backend="bitboard")
+        self.assertIs(ai.interface, shared)
+        ai.set_difficulty("hard")
+        self.assertEqual(ai.difficulty, "hard")
+        self.assertIs(ai.interface, shared)
+
+
+if __name__ == "__main__":
+    unittest.main()
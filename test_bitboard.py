@@ -0,0 +1,247 @@
+# Файл: test_bitboard.py
+import unittest
+import random
+from checkers_bitboard import (BitboardInterface, Move, SearchBoard, board_to_bitboards, bitboards_to_board,
+                               count_captures, generate_captures, square_index)
+from checkers_tt import ZobristKeys
+
+try:
+    import pyswip  # noqa: F401
+    PROLOG_AVAILABLE = True
+except Exception:
+    PROLOG_AVAILABLE = False
+
+
+def random_board(rng):
+    """
+    Створює випадкову дошку
+    """
+    density = rng.random()
+    board = [["empty"] * 8 for _ in range(8)]
+    for y in range(1, 9):
+        for x in range(1, 9):
+            if rng.random() < density:
+                board[y - 1][x - 1] = rng.choice(["w", "b", "wk", "bk"])
+    return board
+
+
+class TestBitboardInterface(unittest.TestCase):
+    """
+    Клас для тестування бекенду правил на бітбордах
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.initial_board = self.interface.get_initial_board()
+        self.empty_board = self.interface.get_empty_board()
+
+    def test_initial_board(self):
+        """
+        Тестування початкової дошки
+        """
+        self.assertEqual(self.initial_board[0][1], "b", "На позиції (2,1) має бути чорна шашка")
+        self.assertEqual(self.initial_board[5][0], "w", "На позиції (1,6) має бути біла шашка")
+        white, black, kings = board_to_bitboards(self.initial_board)
+        self.assertEqual(bin(white).count("1"), 12)
+        self.assertEqual(bin(black).count("1"), 12)
+        self.assertEqual(kings, 0)
+
+    def test_bitboards_round_trip(self):
+        """
+        Тестування перетворення дошки на бітборди і назад
+        """
+        rng = random.Random(7)
+        for _ in range(50):
+            board = random_board(rng)
+            self.assertEqual(bitboards_to_board(*board_to_bitboards(board)), board)
+
+    def test_square_index(self):
+        """
+        Тестування нумерації клітинок
+        """
+        self.assertEqual(square_index(1, 1), 0)
+        self.assertEqual(square_index(2, 1), 1)
+        self.assertEqual(square_index(8, 8), 63)
+        self.assertEqual(square_index(0, 3), -1, "Клітинка поза дошкою не має номера")
+
+    def test_simple_move(self):
+        """
+        Тестування простого ходу
+        """
+        self.assertTrue(self.interface.is_valid_move(self.initial_board, 1, 6, 2, 5, "white"))
+        self.assertFalse(self.interface.is_valid_move(self.initial_board, 1, 6, 3, 4, "white"))
+        self.assertFalse(self.interface.is_valid_move(self.initial_board, 2, 1, 2, 2, "black"))
+        new_board = self.interface.make_move(self.initial_board, 1, 6, 2, 5, "white")
+        self.assertEqual(new_board[5][0], "empty")
+        self.assertEqual(new_board[4][1], "w")
+        self.assertIsNone(self.interface.make_move(self.initial_board, 1, 6, 3, 4, "white"))
+
+    def test_capture_and_promotion(self):
+        """
+        Тестування взяття з перетворенням на дамку
+        """
+        board = [row[:] for row in self.empty_board]
+        board[2][2] = "w"  # Біла шашка на (3,3)
+        board[1][3] = "b"  # Чорна шашка на (4,2)
+        self.assertTrue(self.interface.is_valid_capture(board, 3, 3, 5, 1, "white"))
+        new_board = self.interface.make_move(board, 3, 3, 5, 1, "white")
+        self.assertEqual(new_board[1][3], "empty", "Взята шашка має зникнути")
+        self.assertEqual(new_board[0][4], "wk", "Шашка на першому ряду стає дамкою")
+
+    def test_king_move(self):
+        """
+        Тестування ходу дамкою
+        """
+        board = [row[:] for row in self.empty_board]
+        board[3][3] = "wk"  # Біла дамка на (4,4)
+        self.assertTrue(self.interface.is_valid_king_move(board, 4, 4, 7, 7, "white"))
+        self.assertTrue(self.interface.is_valid_king_move(board, 4, 4, 1, 1, "white"))
+        board[4][4] = "b"  # Перешкода на (5,5)
+        self.assertFalse(self.interface.is_valid_king_move(board, 4, 4, 7, 7, "white"))
+        self.assertIsNone(self.interface.make_move(board, 4, 4, 7, 7, "white"))
+
+    def test_legal_moves(self):
+        """
+        Тестування генерації всіх допустимих ходів
+        """
+        moves = self.interface.legal_moves(self.initial_board, "white")
+        self.assertEqual(len(moves), 7, "У початковій позиції білі мають 7 ходів")
+        self.assertIn((1, 6, 2, 5), moves)
+
+        # Взяття обов'язкове: простий хід іншою шашкою не пропонується
+        board = [row[:] for row in self.empty_board]
+        board[4][2] = "w"  # Біла шашка на (3,5)
+        board[3][3] = "b"  # Чорна шашка на (4,4)
+        board[7][0] = "w"  # Біла шашка на (1,8)
+        self.assertEqual(self.interface.legal_moves(board, "white"), [(3, 5, 5, 3)])
+
+        # Дамка ходить на будь-яку відстань у всіх напрямках
+        board = [row[:] for row in self.empty_board]
+        board[0][1] = "bk"  # Чорна дамка на (2,1)
+        self.assertEqual(self.interface.legal_moves(board, "black"),
+                         [(2, 1, 1, 2)] + [(2, 1, 2 + d, 1 + d) for d in range(1, 7)])
+
+    def test_ai_make_move(self):
+        """
+        Хід AI повертає весь шлях серії взять (як ai_make_move/4 в Prolog)
+        """
+        board = [row[:] for row in self.empty_board]
+        board[2][1] = "b"  # Чорна шашка на (2,3)
+        board[3][2] = "w"  # Біла шашка на (3,4)
+        board[5][4] = "w"  # Біла шашка на (5,6)
+        board[7][0] = "w"  # Біла шашка на (1,8)
+        new_board, path = self.interface.ai_make_move(board, "medium")
+        self.assertEqual(path, [(2, 3), (4, 5), (6, 7)])
+        self.assertEqual(new_board[6][5], "b")
+        self.assertEqual(new_board[3][2], "empty")
+        self.assertEqual(new_board[5][4], "empty")
+
+    def test_board_handles(self):
+        """
+        Тестування дескрипторів збережених дошок
+        """
+        handle = self.interface.new_board_handle(self.initial_board)
+        self.assertEqual(self.interface.handle_legal_moves(handle, "white"),
+                         self.interface.legal_moves(self.initial_board, "white"))
+
+        copy = self.interface.copy_board_handle(handle)
+        self.assertTrue(self.interface.handle_make_move(handle, 1, 6, 2, 5, "white"))
+        self.assertFalse(self.interface.handle_make_move(handle, 1, 6, 2, 5, "white"),
+                         "Повторний хід з порожньої клітинки неможливий")
+        self.assertEqual(self.interface.get_handle_board(handle),
+                         self.interface.make_move(self.initial_board, 1, 6, 2, 5, "white"))
+        self.assertEqual(self.interface.get_handle_board(copy), self.initial_board,
+                         "Копія не повинна змінюватися разом з оригіналом")
+
+        self.interface.release_board_handle(handle)
+        with self.assertRaises(Exception):
+            self.interface.get_handle_board(handle)
+
+
+class TestSearchBoard(unittest.TestCase):
+    """
+    Клас для тестування виконання і скасування ходів на місці
+    """
+    def test_make_unmake(self):
+        """
+        make() збігається зі стрибками make_move бекенду, unmake() відновлює позицію і хеш
+        """
+        interface = BitboardInterface()
+        keys = ZobristKeys()
+        rng = random.Random(7)
+        for _ in range(200):
+            board = random_board(rng)
+            player = rng.choice(["white", "black"])
+            position = SearchBoard.from_board(board, player, keys)
+            for move in position.moves():
+                state = (position.white, position.black, position.kings, position.player, position.key)
+                expected = position.to_board()
+                for hop in move.hops():
+                    expected = interface.make_move(expected, *hop, player)
+                position.make(move)
+                self.assertEqual(position.to_board(), expected)
+                self.assertNotEqual(position.player, player, "Після серії взять ходить суперник")
+                self.assertEqual(position.key, keys.hash_bitboards(position.white, position.black,
+                                                                   position.kings, position.player))
+                position.unmake()
+                self.assertEqual((position.white, position.black, position.kings, position.player, position.key), state)
+
+    def test_capture_sequences(self):
+        """
+        Серія взять генерується одним ходом з усім шляхом
+        """
+        interface = BitboardInterface()
+        board = interface.get_empty_board()
+        board[7][0] = "w"  # Біла шашка на (1,8)
+        board[6][1] = "b"  # Чорні шашки на (2,7), (4,5) і (4,3)
+        board[4][3] = "b"
+        board[2][3] = "b"
+        position = SearchBoard.from_board(board, "white")
+        self.assertEqual(position.moves(), [Move((56, 42, 28, 10), (49, 35, 19))])
+        self.assertEqual(interface.capture_sequences(board, 1, 8, "white"), [[(1, 8), (3, 6), (5, 4), (3, 2)]])
+        self.assertEqual(interface.capture_sequences(board, 2, 7, "black"), [])
+        position.make(position.moves()[0])
+        self.assertEqual(position.black, 0)
+        self.assertEqual(position.player, "black")
+
+    def test_count_captures(self):
+        """
+        Підрахунок взять зсувами збігається з генерацією взять
+        """
+        rng = random.Random(9)
+        for _ in range(300):
+            white, black, kings = board_to_bitboards(random_board(rng))
+            for player in ("white", "black"):
+                self.assertEqual(count_captures(white, black, player),
+                                 len(generate_captures(white, black, kings, player)))
+
+
+@unittest.skipUnless(PROLOG_AVAILABLE, "pyswip не встановлено")
+class TestBitboardMatchesProlog(unittest.TestCase):
+    """
+    Порівняння бекенду на бітбордах з правилами з Checkers.pl
+    """
+    def test_random_positions(self):
+        """
+        Обидва бекенди мають однаково оцінювати випадкові ходи
+        """
+        from checkers_interface import CheckersInterface
+        prolog = CheckersInterface("Checkers.pl")
+        bitboard = BitboardInterface()
+        rng = random.Random(11)
+        for _ in range(100):
+            board = random_board(rng)
+            from_x, from_y = rng.randint(1, 8), rng.randint(1, 8)
+            to_x, to_y = rng.randint(1, 8), rng.randint(1, 8)
+            player = rng.choice(["white", "black"])
+            args = (board, from_x, from_y, to_x, to_y, player)
+            self.assertEqual(bitboard.is_valid_move(*args), prolog.is_valid_move(*args))
+            self.assertEqual(bitboard.is_valid_capture(*args), prolog.is_valid_capture(*args))
+            self.assertEqual(bitboard.is_valid_king_move(*args), prolog.is_valid_king_move(*args))
+            self.assertEqual(bitboard.make_move(*args), prolog.make_move(*args))
+
+
+if __name__ == "__main__":
+    unittest.main()
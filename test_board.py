@@ -0,0 +1,110 @@
+# Файл: test_board.py
+import unittest
+import pickle
+from checkers_board import Board, BoardSnapshot
+from checkers_bitboard import BitboardInterface
+
+
+class TestBoardSnapshot(unittest.TestCase):
+    """
+    Клас для тестування знімків дошки
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.initial_board = self.interface.get_initial_board()
+
+    def test_get_piece(self):
+        """
+        Знімок має повертати ті ж фігури, що й інтерфейс
+        """
+        snapshot = BoardSnapshot(self.initial_board)
+        for y in range(1, 9):
+            for x in range(1, 9):
+                self.assertEqual(snapshot.get_piece(x, y), self.interface.get_piece(self.initial_board, x, y))
+        with self.assertRaises(Exception):
+            snapshot.get_piece(0, 1)
+
+    def test_pieces(self):
+        """
+        Тестування перебору фігур гравця
+        """
+        snapshot = BoardSnapshot(self.initial_board)
+        white = list(snapshot.pieces("white"))
+        self.assertEqual(len(white), 12)
+        self.assertIn((1, 6, "w"), white)
+        self.assertEqual(len(list(snapshot.pieces())), 24)
+
+    def test_immutable(self):
+        """
+        Знімок не змінюється разом з вихідною дошкою
+        """
+        board = [row[:] for row in self.initial_board]
+        snapshot = BoardSnapshot(board)
+        board[5][0] = "empty"
+        self.assertEqual(snapshot.get_piece(1, 6), "w")
+        self.assertEqual(snapshot.to_list(), self.initial_board)
+        with self.assertRaises(TypeError):
+            snapshot[0] = "w"
+
+
+class TestBoard(unittest.TestCase):
+    """
+    Клас для тестування компактної дошки
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.initial_board = self.interface.get_initial_board()
+
+    def test_round_trip(self):
+        """
+        Перетворення у всі формати і назад не змінює дошку
+        """
+        board = Board.from_list(self.initial_board)
+        self.assertEqual(board.to_list(), self.initial_board)
+        self.assertEqual(Board.from_bytes(board.to_bytes()), board)
+        self.assertEqual(len(board.to_bytes()), Board.BYTES_SIZE)
+        self.assertEqual(pickle.loads(pickle.dumps(board)), board)
+        self.assertEqual(board.snapshot().to_list(), self.initial_board)
+
+    def test_prolog_term(self):
+        """
+        Тестування перетворення в Prolog-термін
+        """
+        board = Board.from_list(self.initial_board)
+        term = board.to_prolog()
+        self.assertTrue(term.startswith("[[empty,b,empty,b,"))
+        # pyswip повертає список списків атомів; рядки поводяться так само
+        self.assertEqual(Board.from_prolog(board.to_list()), board)
+
+    def test_hash_and_equality(self):
+        """
+        Однакові позиції мають однаковий хеш і збігаються як ключі словника
+        """
+        first = Board.from_list(self.initial_board)
+        second = Board.from_list([row[:] for row in self.initial_board])
+        moved = Board.from_list(self.interface.make_move(self.initial_board, 1, 6, 2, 5, "white"))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, moved)
+        self.assertEqual(len({first, second, moved}), 2)
+        self.assertEqual(moved.get_piece(2, 5), "w")
+
+    def test_immutable(self):
+        """
+        Дошку не можна змінити після створення
+        """
+        board = Board.from_list(self.initial_board)
+        with self.assertRaises(AttributeError):
+            board.white = 0
+        with self.assertRaises(AttributeError):
+            board.extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Файл: test_book.py
+import os
+import random
+import tempfile
+import unittest
+from checkers_bitboard import SQUARE_COORDS, BitboardInterface, Move, SearchBoard
+from checkers_book import OpeningBook, build_book, write_book
+from checkers_ai import CheckersAI
+from checkers_tt import ZobristKeys
+
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    Клас для тестування дебютної книги
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        handle, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+
+    def tearDown(self):
+        """
+        Видалення файлу книги
+        """
+        os.remove(self.path)
+
+    def test_probe(self):
+        """
+        Бінарний пошук знаходить усі ходи позиції серед багатьох записів
+        """
+        rng = random.Random(3)
+        book = {rng.getrandbits(64): [(Move((40, 33)), rng.randint(1, 100))] for _ in range(500)}
+        book[12345] = [(Move((42, 33)), 7), (Move((40, 33)), 3)]
+        write_book(self.path, book)
+        opening_book = OpeningBook(self.path)
+        try:
+            self.assertEqual(len(opening_book), 502)
+            self.assertEqual(sorted(opening_book.probe(12345)), [((40, 33), 3), ((42, 33), 7)])
+            for key in list(book)[:50]:
+                self.assertEqual(len(opening_book.probe(key)), len(book[key]))
+            self.assertEqual(opening_book.probe(12346), [])
+        finally:
+            opening_book.close()
+
+    def test_ai_plays_book_move(self):
+        """
+        AI відповідає з книги без пошуку, а поза книгою шукає
+        """
+        board = self.interface.make_move(self.interface.get_initial_board(), 3, 6, 4, 5, "white")
+        position = SearchBoard.from_board(board, "black", ZobristKeys())
+        book_move = position.moves()[-1]
+        write_book(self.path, {position.key: [(book_move, 5)]})
+        ai = CheckersAI("medium", interface=self.interface, book=self.path)
+        try:
+            new_board, move = ai.make_move(board)
+            self.assertEqual(ai.last_source, "book")
+            self.assertEqual(ai.search_nodes, 0)
+            self.assertEqual(move, SQUARE_COORDS[book_move.from_sq] + SQUARE_COORDS[book_move.to_sq])
+            self.assertEqual(new_board, self.interface.make_move(board, *move, "black"))
+
+            board = self.interface.make_move(self.interface.get_initial_board(), 7, 6, 8, 5, "white")
+            ai.make_move(board)
+            self.assertEqual(ai.last_source, "search")
+        finally:
+            ai.book.close()
+
+    def test_build_book(self):
+        """
+        Самогра записує в книгу допустимі ходи, найкращий - з найбільшою вагою
+        """
+        book = build_book(games=2, plies=2, depth=2)
+        initial = SearchBoard.from_board(self.interface.get_initial_board(), "white", ZobristKeys())
+        entries = book[initial.key]
+        self.assertTrue(set(move for move, _ in entries) <= set(initial.moves()))
+        self.assertEqual(max(weight for _, weight in entries), entries[0][1])
+        self.assertGreater(len(book), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 # Файл: test_interface.py
 import unittest
-import CheckersInterface
+from checkers_interface import CheckersInterface
 
 class TestCheckersInterface(unittest.TestCase):
     """
@@ -102,6 +102,29 @@ class TestCheckersInterface(unittest.TestCase):
         # Неправильне взяття (немає фігури для взяття)
         self.assertFalse(self.interface.is_valid_capture(self.initial_board, 1, 6, 3, 4, "white"),
                         "Взяття (1,6) -> (3,4) має бути недопустимим, оскільки немає фігури для взяття")
+    
+    def test_ai_make_move(self):
+        """
+        Тестування ходу AI: допустимий хід і серія взять тією ж шашкою
+        """
+        board, path = self.interface.ai_make_move(self.initial_board, "medium")
+        self.assertIn(path[0] + path[-1], self.interface.legal_moves(self.initial_board, "black"),
+                      "AI має повернути допустимий хід")
+        self.assertEqual(board, self.interface.make_move(self.initial_board, *path[0], *path[-1], "black"))
+        
+        # Чорна шашка на (2,3) може взяти дві білі підряд
+        board_with_captures = [row.copy() for row in self.empty_board]
+        board_with_captures[2][1] = "b"  # Чорна шашка на (2,3)
+        board_with_captures[3][2] = "w"  # Біла шашка на (3,4)
+        board_with_captures[5][4] = "w"  # Біла шашка на (5,6)
+        board_with_captures[7][0] = "w"  # Біла шашка на (1,8)
+        
+        board, path = self.interface.ai_make_move(board_with_captures, "medium")
+        self.assertEqual(path, [(2, 3), (4, 5), (6, 7)],
+                         "Серія взять має продовжуватися тією ж шашкою")
+        self.assertEqual(board[6][5], "b", "Шашка має закінчити серію на (6,7)")
+        self.assertEqual(board[3][2], "empty", "Біла шашка на (3,4) має бути взята")
+        self.assertEqual(board[5][4], "empty", "Біла шашка на (5,6) має бути взята")
 
 
 def run_tests():
@@ -0,0 +1,240 @@
+# Файл: test_interface_stubbed.py
+"""
+Тести обгортки CheckersInterface без SWI-Prolog: клас Prolog замінено
+заглушкою, яка записує запити і повертає заздалегідь задані відповіді.
+"""
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+import numpy  # noqa: F401
+import checkers_board  # noqa: F401
+import checkers_stats  # noqa: F401
+from checkers_backend import RULES_FILE
+
+try:
+    import pyswip  # noqa: F401
+    import checkers_interface
+except ImportError:
+    # Модуль імпортується з тимчасовою заглушкою pyswip; patch.dict прибирає з
+    # sys.modules і заглушку, і сам модуль, тож інші тести її не побачать
+    with patch.dict(sys.modules, {"pyswip": types.SimpleNamespace(Prolog=None)}):
+        import checkers_interface
+
+
+class FakeProlog:
+    """
+    Заглушка pyswip.Prolog
+    """
+    answers = {}
+
+    def __init__(self):
+        self.queries = []
+        self.consulted = []
+
+    def query(self, query):
+        """
+        Записує запит і повертає розв'язки за найдовшим збігом префікса
+
+        Args:
+            query (str): Текст запиту
+
+        Returns:
+            iterator: Розв'язки (за замовчуванням одне порожнє зіставлення)
+        """
+        self.queries.append(query)
+        prefixes = [prefix for prefix in self.answers if query.startswith(prefix)]
+        answer = self.answers[max(prefixes, key=len)] if prefixes else [{}]
+        return self._solutions(answer)
+
+    @staticmethod
+    def _solutions(answer):
+        # pyswip повідомляє про помилки Prolog під час перебору розв'язків
+        if isinstance(answer, Exception):
+            raise answer
+        yield from answer
+
+    def consult(self, path):
+        self.consulted.append(path)
+
+
+class StubbedPrologTestCase(unittest.TestCase):
+    """
+    Базовий клас: checkers_interface.Prolog замінено на FakeProlog
+    """
+    answers = {}
+
+    def setUp(self):
+        fake_class = type("FakePrologWithAnswers", (FakeProlog,), {"answers": self.answers})
+        patcher = patch.object(checkers_interface, "Prolog", fake_class)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        printer = patch("builtins.print")
+        printer.start()
+        self.addCleanup(printer.stop)
+
+    def queries_with(self, interface, prefix):
+        return [query for query in interface.prolog.queries if query.startswith(prefix)]
+
+
+class RulesFileTestCase(StubbedPrologTestCase):
+    """
+    Базовий клас: тимчасовий файл правил і, за потреби, .qlf поруч з ним
+    """
+    def setUp(self):
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.rules = os.path.join(temp_dir.name, "Checkers.pl")
+        self.qlf = os.path.join(temp_dir.name, "Checkers.qlf")
+        with open(self.rules, "w") as f:
+            f.write("% rules\n")
+
+    def write_qlf(self, offset):
+        """
+        Створює .qlf, новіший (offset > 0) або старіший за файл правил
+        """
+        with open(self.qlf, "w") as f:
+            f.write("qlf\n")
+        rules_time = os.path.getmtime(self.rules)
+        os.utime(self.qlf, (rules_time + offset, rules_time + offset))
+
+
+class TestRulesLoading(RulesFileTestCase):
+    """
+    Клас для тестування завантаження файлу правил
+    """
+    def test_default_rules_file(self):
+        """
+        Типовий файл правил існує під своїм справжнім ім'ям
+        """
+        self.assertEqual(os.path.basename(RULES_FILE), "Checkers.pl")
+        self.assertTrue(os.path.exists(RULES_FILE))
+
+    def test_consult(self):
+        """
+        Без precompiled файл консультується напряму
+        """
+        interface = checkers_interface.CheckersInterface(self.rules, quiet=True)
+        self.assertEqual(interface.prolog.consulted, [self.rules])
+        self.assertTrue(self.queries_with(interface, "create_prolog_flag(checkers_quiet, true"))
+        self.assertFalse(self.queries_with(interface, "qcompile("))
+
+    def test_qcompile_without_qlf(self):
+        """
+        Відсутній .qlf створюється через qcompile
+        """
+        interface = checkers_interface.CheckersInterface(self.rules, precompiled=True)
+        self.assertEqual(len(self.queries_with(interface, "qcompile(")), 1)
+        self.assertFalse(self.queries_with(interface, "load_files("))
+        self.assertEqual(interface.prolog.consulted, [])
+
+    def test_qcompile_stale_qlf(self):
+        """
+        Застарілий .qlf перекомпільовується
+        """
+        self.write_qlf(-10)
+        interface = checkers_interface.CheckersInterface(self.rules, precompiled=True)
+        self.assertEqual(len(self.queries_with(interface, "qcompile(")), 1)
+        self.assertFalse(self.queries_with(interface, "load_files("))
+
+    def test_load_qlf(self):
+        """
+        Актуальний .qlf завантажується без перекомпіляції
+        """
+        self.write_qlf(10)
+        interface = checkers_interface.CheckersInterface(self.rules, precompiled=True)
+        self.assertEqual(len(self.queries_with(interface, "load_files(")), 1)
+        self.assertFalse(self.queries_with(interface, "qcompile("))
+
+
+class TestBrokenQlf(RulesFileTestCase):
+    """
+    Клас для тестування .qlf, який не вдається завантажити
+    """
+    answers = {"load_files(": RuntimeError("incompatible QLF file")}
+
+    def test_fallback_to_qcompile(self):
+        """
+        Помилка завантаження .qlf призводить до перекомпіляції правил
+        """
+        self.write_qlf(10)
+        interface = checkers_interface.CheckersInterface(self.rules, precompiled=True)
+        self.assertEqual(len(self.queries_with(interface, "load_files(")), 1)
+        self.assertEqual(len(self.queries_with(interface, "qcompile(")), 1)
+
+
+class TestBoardHandles(StubbedPrologTestCase):
+    """
+    Клас для тестування обгортки дескрипторів дошок
+    """
+    def setUp(self):
+        super().setUp()
+        self.interface = checkers_interface.CheckersInterface(RULES_FILE, quiet=True)
+        self.prolog = self.interface.prolog
+        self.board = [["empty"] * 8 for _ in range(8)]
+        self.board[5][0] = "w"  # Біла шашка на (1,6)
+        self.board[2][1] = "bk"  # Чорна дамка на (2,3)
+
+    def test_new_board_handle(self):
+        """
+        Дошка передається термом один раз, далі використовується дескриптор
+        """
+        self.prolog.answers = {"new_board_handle(": [{"Handle": 7}]}
+        self.assertEqual(self.interface.new_board_handle(self.board), 7)
+        query = self.prolog.queries[-1]
+        self.assertTrue(query.startswith("new_board_handle([[empty,"))
+        self.assertIn("[w,empty,", query)
+        self.assertTrue(query.endswith(", Handle)"))
+
+        self.prolog.answers = {"new_board_handle(": []}
+        with self.assertRaises(Exception):
+            self.interface.new_board_handle(self.board)
+
+    def test_copy_and_release(self):
+        """
+        Копіювання повертає новий дескриптор, звільнення передає лише номер
+        """
+        self.prolog.answers = {"copy_board_handle(7,": [{"NewHandle": 8}]}
+        self.assertEqual(self.interface.copy_board_handle(7), 8)
+        with self.assertRaises(Exception):
+            self.interface.copy_board_handle(9)
+
+        self.interface.release_board_handle(8)
+        self.assertEqual(self.prolog.queries[-1], "release_board_handle(8)")
+
+    def test_handle_board(self):
+        """
+        Збережена дошка розбирається у формат Python
+        """
+        self.prolog.answers = {"handle_board(7,": [{"Board": self.board}]}
+        self.assertEqual(self.interface.get_handle_board(7), self.board)
+        self.assertEqual(self.prolog.queries[-1], "handle_board(7, Board)")
+
+        self.prolog.answers = {"handle_board(": []}
+        with self.assertRaises(Exception):
+            self.interface.get_handle_board(7)
+
+    def test_handle_moves(self):
+        """
+        Ходи на збереженій дошці: список ходів і результат виконання ходу
+        """
+        self.prolog.answers = {
+            "handle_legal_moves(": [],
+            "handle_legal_moves(7, white,": [{"Moves": [[1, 6, 2, 5]]}],
+        }
+        self.assertEqual(self.interface.handle_legal_moves(7, "white"), [(1, 6, 2, 5)])
+        self.assertEqual(self.interface.handle_legal_moves(8, "white"), [])
+
+        self.prolog.answers = {"handle_make_move(": []}
+        self.assertFalse(self.interface.handle_make_move(7, 1, 6, 2, 5, "white"))
+        self.prolog.answers = {}
+        self.assertTrue(self.interface.handle_make_move(7, 1, 6, 2, 5, "white"))
+        self.assertEqual(self.prolog.queries[-1], "handle_make_move(7, 1, 6, 2, 5, white)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Файл: test_ordering.py
+import unittest
+from checkers_ordering import KILLERS_PER_PLY, MoveOrderer
+from checkers_bitboard import BitboardInterface, Move, square_index
+from checkers_ai import CheckersAI
+
+
+class TestMoveOrderer(unittest.TestCase):
+    """
+    Клас для тестування впорядкування ходів
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.orderer = MoveOrderer()
+        self.moves = [self.move(1, 6, 2, 5), self.move(3, 6, 2, 5), self.move(3, 6, 4, 5),
+                      self.move(5, 6, 4, 5), self.move(5, 6, 6, 5)]
+
+    @staticmethod
+    def move(from_x, from_y, to_x, to_y):
+        """
+        Хід пошуку (Move) без взяття між двома клітинками
+        """
+        return Move((square_index(from_x, from_y), square_index(to_x, to_y)))
+
+    def test_priorities(self):
+        """
+        Хід з таблиці, потім хід попередньої ітерації, вбивці та історія
+        """
+        # Рівні, але окремо створені ходи мають збігатися з ходами генератора
+        self.orderer.record_cutoff(self.move(5, 6, 6, 5), "white", 3, 2, 1)
+        self.orderer.record_cutoff(self.move(5, 6, 4, 5), "white", 0, 4, 0)
+        ordered = self.orderer.order(self.moves, "white", 3, tt_move=self.move(3, 6, 4, 5),
+                                     first_move=self.move(1, 6, 2, 5))
+        self.assertEqual(ordered[:4], [self.moves[2], self.moves[0], self.moves[4], self.moves[3]])
+        self.assertEqual(sorted(ordered), sorted(self.moves))
+        self.assertTrue(all(isinstance(move, Move) for move in ordered))
+
+    def test_killers_per_ply(self):
+        """
+        На кожному рівні зберігаються лише останні ходи-вбивці
+        """
+        for move in self.moves:
+            self.orderer.record_cutoff(move, "white", 2, 1, 1)
+        self.assertEqual(len(self.orderer.killers[2]), KILLERS_PER_PLY)
+        self.assertEqual(self.orderer.killers[2][0], self.moves[-1])
+        self.assertEqual(self.orderer.killers[1], [])
+
+    def test_statistics_and_new_search(self):
+        """
+        Частка відсікань першим ходом і старіння історії
+        """
+        self.orderer.record_cutoff(self.moves[0], "white", 0, 4, 0)
+        self.orderer.record_cutoff(self.moves[1], "white", 0, 1, 2)
+        self.assertEqual(self.orderer.stats()["cutoffs"], 2)
+        self.assertAlmostEqual(self.orderer.first_move_cutoff_rate(), 0.5)
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.history, {("white", self.moves[0]): 8})
+        self.assertEqual(self.orderer.killers[0], [])
+
+    def test_ai_records_cutoffs(self):
+        """
+        Пошук AI передає відсікання у впорядкування
+        """
+        interface = BitboardInterface()
+        board = interface.make_move(interface.get_initial_board(), 3, 6, 4, 5, "white")
+        ai = CheckersAI("medium", interface=interface)
+        _, move = ai.make_best_move(board, max_depth=4)
+        self.assertIn(move, interface.legal_moves(board, "black"))
+        self.assertGreater(ai.orderer.cutoffs, 0)
+        self.assertGreater(ai.orderer.first_move_cutoff_rate(), 0.5)
+        self.assertEqual(ai.last_stats.ordering_cutoffs, ai.orderer.cutoffs)
+
+        # Лічильники відсікань рахують лише поточний пошук
+        ai.make_best_move(board, max_depth=5)
+        self.assertEqual(ai.orderer.cutoffs, ai.beta_cutoffs)
+        self.assertEqual(ai.last_stats.ordering_cutoffs, ai.last_stats.beta_cutoffs)
+        self.assertEqual(ai.last_stats.first_move_cutoffs, ai.orderer.first_move_cutoffs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# Файл: test_stats.py
+import json
+import unittest
+from checkers_stats import QueryStats, SearchStats
+
+
+class TestQueryStats(unittest.TestCase):
+    """
+    Клас для тестування статистики запитів
+    """
+    def test_record(self):
+        """
+        Статистика накопичується окремо для кожного предиката
+        """
+        stats = QueryStats()
+        for i in range(1, 101):
+            stats.record("get_piece", 0.001, i / 1000)
+        stats.record("apply_move", 0.002, 0.003)
+        stats.record_decode("apply_move", 0.004)
+
+        summary = stats.to_dict()
+        self.assertEqual(list(summary), ["get_piece", "apply_move"], "Предикати сортуються за сумарним часом")
+        self.assertEqual(summary["get_piece"]["calls"], 100)
+        self.assertAlmostEqual(summary["get_piece"]["serialise_ms"], 100.0)
+        self.assertAlmostEqual(summary["get_piece"]["p50_ms"], 51.0)
+        self.assertAlmostEqual(summary["get_piece"]["p99_ms"], 100.0)
+        self.assertAlmostEqual(summary["apply_move"]["total_ms"], 9.0)
+
+    def test_json(self):
+        """
+        Статистика серіалізується в JSON і очищається
+        """
+        stats = QueryStats()
+        stats.record("legal_moves", 0.0, 0.5)
+        self.assertEqual(json.loads(stats.to_json())["legal_moves"]["calls"], 1)
+        stats.reset()
+        self.assertEqual(stats.to_dict(), {})
+
+
+class TestSearchStats(unittest.TestCase):
+    """
+    Клас для тестування статистики пошуку
+    """
+    def test_derived(self):
+        """
+        Похідні показники обчислюються з лічильників
+        """
+        stats = SearchStats()
+        self.assertEqual(stats.effective_branching_factor(), 0.0)
+        self.assertEqual(stats.nodes_per_second(), 0.0)
+        stats.depth = 3
+        stats.search_nodes = 60
+        stats.quiescence_nodes = 40
+        stats.iteration_nodes = [10, 20, 70]
+        stats.elapsed = 0.5
+        stats.expanded_nodes = 40
+        stats.beta_cutoffs = 10
+        stats.tt_probes = 50
+        stats.tt_hits = 5
+        self.assertAlmostEqual(stats.effective_branching_factor(), 3.5)
+        self.assertAlmostEqual(stats.nodes_per_second(), 200.0)
+        self.assertAlmostEqual(stats.cutoff_rate(), 0.25)
+        self.assertAlmostEqual(stats.tt_hit_rate(), 0.1)
+        stats.iteration_nodes = [100]
+        self.assertAlmostEqual(stats.effective_branching_factor(), 100 ** (1 / 3))
+        self.assertEqual(json.loads(json.dumps(stats.to_dict()))["nodes"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# Файл: test_tablebase.py
+import random
+import shutil
+import tempfile
+import unittest
+from checkers_bitboard import BitboardInterface, SearchBoard, bitboards_to_board
+from checkers_tablebase import LOSS, WIN, MaterialIndex, Tablebases, generate_tablebases, material_of
+from checkers_ai import WIN_SCORE, CheckersAI
+
+# Дві білі дамки проти чорної дамки (разом з таблицею одна на одну)
+MATERIAL = (0, 2, 0, 1)
+
+
+class TestTablebases(unittest.TestCase):
+    """
+    Клас для тестування баз ендшпілю
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Будує таблиці один раз для всіх тестів
+        """
+        cls.directory = tempfile.mkdtemp()
+        generate_tablebases(cls.directory, materials=[MATERIAL], log=None)
+        cls.tablebase = Tablebases(cls.directory)
+        cls.index = MaterialIndex(MATERIAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Видалення файлів таблиць
+        """
+        cls.tablebase.close()
+        shutil.rmtree(cls.directory)
+
+    def sample(self, count, seed):
+        """
+        Випадкові позиції складу з результатами таблиці
+        """
+        rng = random.Random(seed)
+        for number in rng.sample(range(self.index.size), count):
+            white, black, kings, player = self.index.position(number)
+            yield SearchBoard(white, black, kings, player), self.tablebase.probe(white, black, kings, player)
+
+    def test_index(self):
+        """
+        Номер позиції і позиція за номером взаємно обернені
+        """
+        for number in random.Random(1).sample(range(self.index.size), 500):
+            white, black, kings, player = self.index.position(number)
+            self.assertEqual(material_of(white, black, kings), MATERIAL)
+            self.assertEqual(self.index.index(white, black, kings, player), number)
+        self.assertEqual(self.tablebase.max_pieces, 3)
+
+    def test_best_move(self):
+        """
+        Виграшна позиція має хід у програшну для суперника на півхід ближчу до кінця
+        """
+        for position, (result, distance) in self.sample(1000, 2):
+            found = self.tablebase.best_move(position)
+            self.assertEqual(found[1:], (result, distance))
+            if result == WIN:
+                position.make(found[0])
+                opponent = position.white if position.player == "white" else position.black
+                if opponent:
+                    self.assertEqual(self.tablebase.probe(position.white, position.black, position.kings,
+                                                          position.player), (LOSS, distance - 1))
+                position.unmake()
+
+    def test_matches_search(self):
+        """
+        Короткі виграші з таблиць знаходить і повний перебір
+        """
+        ai = CheckersAI("hard", interface=BitboardInterface(), tt_size_mb=0, quiescence=False)
+        depth = 4
+        for position, (result, distance) in self.sample(150, 3):
+            score, _ = ai.minimax(position, depth, float('-inf'), float('inf'), position.player == "black")
+            score = score if position.player == "black" else -score
+            if result == WIN and distance < depth:
+                self.assertEqual(score, WIN_SCORE - distance)
+            elif result == LOSS and distance < depth:
+                self.assertEqual(score, distance - WIN_SCORE)
+            elif distance != depth:
+                self.assertLess(abs(score), WIN_SCORE - depth)
+
+    def test_ai_uses_tablebase(self):
+        """
+        AI ходить за таблицями без пошуку
+        """
+        ai = CheckersAI("medium", interface=BitboardInterface(), tablebase=self.tablebase)
+        for number in range(1, self.index.size, 2):
+            white, black, kings, player = self.index.position(number)
+            if self.tablebase.probe(white, black, kings, player)[0] == WIN:
+                break
+        board = bitboards_to_board(white, black, kings)
+        _, move = ai.make_move(board)
+        self.assertEqual(ai.last_source, "tablebase")
+        self.assertEqual(ai.search_nodes, 0)
+        self.assertGreater(ai.last_score, WIN_SCORE - 128)
+        self.assertIn(move, ai.interface.legal_moves(board, "black"))
+
+    def test_light_square_miss(self):
+        """
+        Позиція з фігурою на світлій клітинці - промах таблиці, а не помилка
+        """
+        board = [["empty"] * 8 for _ in range(8)]
+        board[3][3] = "bk"  # Чорна дамка на світлій клітинці (4,4)
+        board[1][2] = "wk"  # Біла дамка на (3,2)
+        board[6][6] = "wk"  # Біла дамка на світлій клітинці (7,7)
+        position = SearchBoard.from_board(board, "black")
+        self.assertIsNone(self.index.index(position.white, position.black, position.kings, "black"))
+        self.assertIsNone(self.tablebase.probe(position.white, position.black, position.kings, "black"))
+        self.assertIsNone(self.tablebase.best_move(position))
+
+        ai = CheckersAI("medium", interface=BitboardInterface(), tablebase=self.tablebase)
+        new_board, _ = ai.make_move(board)
+        self.assertIsNotNone(new_board)
+        self.assertEqual(ai.last_source, "search")
+
+    def test_parallel_search_probes(self):
+        """
+        Процеси-виконавці паралельного пошуку теж оцінюють позиції за таблицями
+        """
+        for number in range(self.index.size):
+            white, black, kings, player = self.index.position(number)
+            if player == "black":
+                result, distance = self.tablebase.probe(white, black, kings, player)
+                if result == LOSS and distance > 8:
+                    break
+        ai = CheckersAI("hard", interface=BitboardInterface(), tablebase=self.tablebase, workers=2)
+        try:
+            ai.choose_best_move(bitboards_to_board(white, black, kings), max_depth=2)
+        finally:
+            ai.close()
+        # Найдовший опір чорних - програш за стільки ж півходів, скільки в таблиці
+        self.assertEqual(ai.last_score, distance - WIN_SCORE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# Файл: test_tt.py
+import unittest
+import random
+from checkers_tt import EXACT, LOWER_BOUND, TranspositionTable, ZobristKeys
+from checkers_bitboard import BitboardInterface, SearchBoard
+from checkers_ai import (MAX_SEARCH_DEPTH, PIECE_SQUARE_VALUES, QUIESCENCE_MAX_DEPTH, WIN_SCORE,
+                         WIN_THRESHOLD, CheckersAI, score_from_tt, score_to_tt)
+from checkers_ordering import MAX_PLY
+from checkers_tablebase import MAX_DISTANCE
+
+
+class TestZobristKeys(unittest.TestCase):
+    """
+    Клас для тестування хешування позицій
+    """
+    def setUp(self):
+        """
+        Підготовка тестового середовища
+        """
+        self.interface = BitboardInterface()
+        self.keys = ZobristKeys()
+
+    def test_deterministic(self):
+        """
+        Однакове зерно дає однакові ключі, черга ходу змінює хеш
+        """
+        board = self.interface.get_initial_board()
+        key = SearchBoard.from_board(board, "white", self.keys).key
+        self.assertEqual(key, SearchBoard.from_board(board, "white", ZobristKeys()).key)
+        self.assertNotEqual(key, SearchBoard.from_board(board, "white", ZobristKeys(seed=1)).key)
+        self.assertNotEqual(key, SearchBoard.from_board(board, "black", self.keys).key)
+
+    def test_incremental_update(self):
+        """
+        Інкрементальний хеш SearchBoard збігається з обчисленням з нуля
+        (прості ходи, серії взять, ходи дамок і перетворення) і
+        відновлюється скасуванням ходів
+        """
+        rng = random.Random(3)
+        for _ in range(30):
+            position = SearchBoard.from_board(self.interface.get_initial_board(), "white", self.keys)
+            keys = []
+            for _ in range(80):
+                moves = position.moves()
+                if not moves:
+                    break
+                keys.append(position.key)
+                position.make(rng.choice(moves))
+                self.assertEqual(position.key, self.keys.hash_bitboards(position.white, position.black,
+                                                                        position.kings, position.player))
+            while keys:
+                position.unmake()
+                self.assertEqual(position.key, keys.pop())
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Клас для тестування таблиці транспозицій
+    """
+    def test_store_and_probe(self):
+        """
+        Збережений запис знаходиться, лічильники рахують звернення
+        """
+        table = TranspositionTable(max_memory_mb=0.01)
+        self.assertIsNone(table.probe(42))
+        table.store(42, 3, EXACT, 1.5, (1, 6, 2, 5))
+        self.assertEqual(table.probe(42), (42, 3, EXACT, 1.5, (1, 6, 2, 5)))
+        self.assertEqual((table.hits, table.misses), (1, 1))
+        self.assertEqual(table.stats()["filled"], 1)
+
+    def test_memory_cap(self):
+        """
+        Кількість записів обмежена розміром пам'яті
+        """
+        small = TranspositionTable(max_memory_mb=0.01)
+        large = TranspositionTable(max_memory_mb=1)
+        self.assertLess(len(small.entries), len(large.entries))
+        for key in range(10000):
+            small.store(key, 1, EXACT, 0, None)
+        self.assertEqual(small.stats()["filled"], len(small.entries))
+        self.assertGreater(small.replacements, 0)
+
+    def test_depth_preferred_replacement(self):
+        """
+        Глибокий запис не витісняється мілким, а переноситься при заміні глибшим
+        """
+        table = TranspositionTable(max_memory_mb=0.001)
+        count = table.bucket_count
+        table.store(1, 5, EXACT, 10, None)
+        table.store(1 + count, 2, LOWER_BOUND, 20, None)
+        self.assertEqual(table.probe(1)[1], 5)
+        self.assertEqual(table.probe(1 + count)[1], 2)
+        table.store(1 + 2 * count, 6, EXACT, 30, None)
+        self.assertEqual(table.probe(1 + 2 * count)[1], 6)
+        self.assertEqual(table.probe(1)[1], 5)
+        self.assertIsNone(table.probe(1 + count))
+
+    def test_ai_uses_table(self):
+        """
+        Пошук AI звертається до таблиці і знаходить повтори позицій
+        """
+        interface = BitboardInterface()
+        board = interface.get_initial_board()
+        board = interface.make_move(board, 3, 6, 4, 5, "white")
+        ai = CheckersAI("hard", interface=interface)
+        new_board, move = ai.make_move(board)
+        self.assertIn(move, interface.legal_moves(board, "black"))
+        self.assertGreater(ai.tt.stores, 0)
+        self.assertGreater(ai.tt.hits, 0)
+        without_table = CheckersAI("medium", interface=interface, tt_size_mb=0)
+        self.assertIsNone(without_table.tt)
+        self.assertIsNotNone(without_table.make_move(board)[0])
+
+    def test_win_score_transposed(self):
+        """
+        Виграш з таблиці рахується від вузла, а не від кореня, де його знайдено
+        """
+        interface = BitboardInterface()
+        board = interface.get_empty_board()
+        board[1][1] = "b"
+        board[2][2] = "w"
+        ai = CheckersAI("hard", interface=interface)
+        position = SearchBoard.from_board(board, "black", ai.zobrist, PIECE_SQUARE_VALUES)
+        # Чорні беруть останню білу шашку: виграш через півхід від кореня
+        score, _ = ai.minimax(position, 3, float('-inf'), float('inf'), True)
+        self.assertEqual(score, WIN_SCORE - 1)
+        # Та сама позиція на відстані 4 від кореня береться з таблиці
+        hits = ai.tt.hits
+        score, _ = ai.minimax(position, 3, float('-inf'), float('inf'), True, ply=4)
+        self.assertEqual(ai.tt.hits, hits + 1)
+        self.assertEqual(score, WIN_SCORE - 5)
+
+    def test_win_threshold(self):
+        """
+        Межа виграшу охоплює найглибший виграш пошуку і баз ендшпілю
+        """
+        self.assertLessEqual(MAX_SEARCH_DEPTH + QUIESCENCE_MAX_DEPTH, MAX_PLY)
+        deepest = WIN_SCORE - (MAX_PLY - 1) - MAX_DISTANCE
+        self.assertGreaterEqual(deepest, WIN_THRESHOLD)
+        self.assertEqual(score_from_tt(score_to_tt(deepest, 7), 7), deepest)
+        self.assertEqual(score_to_tt(-deepest, 7), -deepest - 7)
+        # Звичайні оцінки позиції не змінюються
+        self.assertEqual(score_to_tt(WIN_THRESHOLD - 1, 7), WIN_THRESHOLD - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()